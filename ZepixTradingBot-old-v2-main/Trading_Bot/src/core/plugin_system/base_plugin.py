@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 import logging
 
+if TYPE_CHECKING:
+    import sqlite3
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +94,25 @@ class BaseLogicPlugin(ABC):
     - process_reversal_signal()
     """
     
+    # Subclasses that do not declare __slots__ still get a __dict__
+    __slots__ = (
+        "plugin_id", "config", "service_api", "logger", "metadata",
+        "enabled", "db_path", "_conn", "_hook_cache",
+    )
+    
+    # Hooks this class handles: "<hook>" for every on_<hook> method in the MRO.
+    # Filled in per subclass by __init_subclass__.
+    _HOOK_NAMES: frozenset = frozenset()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._HOOK_NAMES = frozenset(
+            name[3:]
+            for klass in cls.__mro__
+            for name, attr in vars(klass).items()
+            if name.startswith("on_") and callable(attr)
+        )
+    
     def __init__(self, plugin_id: str, config: Dict[str, Any], service_api):
         """
         Initialize plugin instance.
@@ -111,8 +133,12 @@ class BaseLogicPlugin(ABC):
         # Plugin state
         self.enabled = config.get("enabled", True)
         
+        # hook name -> (handler, is_coroutine), filled in by PluginRegistry
+        self._hook_cache: Dict[str, tuple] = {}
+        
         # Database connection (plugin-specific)
         self.db_path = f"data/zepix_{plugin_id}.db"
+        self._conn: Optional["sqlite3.Connection"] = None
         
         self.logger.info(f"Initialized plugin: {plugin_id}")
     
@@ -173,9 +199,21 @@ class BaseLogicPlugin(ABC):
         return True
     
     def get_database_connection(self):
-        """Get plugin's isolated database connection"""
-        import sqlite3
-        return sqlite3.connect(self.db_path)
+        """Get plugin's isolated database connection (opened once, then reused)"""
+        if self._conn is None:
+            import sqlite3
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn = conn
+        return self._conn
+    
+    def close(self):
+        """Close the cached database connection, if one is open"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
     
     def enable(self):
         """Enable this plugin"""
@@ -1,7 +1,7 @@
 import importlib
-import importlib.util
-import asyncio
+import inspect
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List, Any
 import logging
 
@@ -65,6 +65,43 @@ AVAILABLE_PLUGINS = {
     }
 }
 
+# Signal type keywords in routing precedence order, and the plugin method each one routes to
+_SIGNAL_KEYS = ("entry", "exit", "reversal")
+_SIGNAL_HANDLERS = {
+    "entry": "process_entry_signal",
+    "exit": "process_exit_signal",
+    "reversal": "process_reversal_signal",
+}
+
+
+def _build_hook_cache(plugin) -> Dict[str, tuple]:
+    """
+    Map each hook a plugin handles to its bound handler.
+    
+    A method named on_<hook> handles <hook>. BaseLogicPlugin subclasses list
+    their class hooks in _HOOK_NAMES at class creation, plus any on_<hook>
+    assigned on the instance; anything else is scanned with dir(). Rebuilt
+    whenever the registry's hook handler cache is, so execute_hook does no
+    reflection per event.
+    
+    Returns:
+        dict: hook name -> (handler, is_coroutine_function)
+    """
+    hook_names = getattr(type(plugin), "_HOOK_NAMES", None)
+    if hook_names is None:
+        hook_names = [name[3:] for name in dir(plugin) if name.startswith("on_")]
+    else:
+        hook_names = hook_names.union(
+            name[3:] for name in getattr(plugin, "__dict__", ()) if name.startswith("on_")
+        )
+    
+    cache = {}
+    for hook_name in hook_names:
+        handler = getattr(plugin, "on_" + hook_name, None)
+        if callable(handler):
+            cache[hook_name] = (handler, inspect.iscoroutinefunction(handler))
+    return cache
+
 
 class PluginRegistry:
     """
@@ -89,10 +126,73 @@ class PluginRegistry:
         self.service_api = service_api
         self.plugins: Dict[str, BaseLogicPlugin] = {}
         
+        # Per hook name: (all, sync, async) handler lists of registered
+        # plugins, in plugin order. execute_hook checks plugin.enabled as it
+        # dispatches, so enabling/disabling needs no rebuild; changing the set
+        # of plugins does (see register_plugin/invalidate_hook_cache).
+        self._hook_handlers: Dict[str, tuple] = {}
+        self._hook_caches_built = False
+        
         self.plugin_dir = config.get("plugin_system", {}).get("plugin_dir", "src/logic_plugins")
         
+        # plugin_dir could be relative, e.g. "src/logic_plugins" or "./src/logic_plugins/"
+        # Turn it into a package path once: "src.logic_plugins"
+        # normpath drops "./" and trailing separators; either slash style is accepted
+        self._package_path = os.path.normpath(self.plugin_dir).replace('\\', '/').replace('/', '.').strip('.')
+        
+        # Imported plugin modules by plugin_id, reused when a plugin is reloaded
+        self._module_cache: Dict[str, Any] = {}
+        
         logger.info("Plugin registry initialized")
     
+    def register_plugin(self, plugin_id: str, plugin: BaseLogicPlugin):
+        """Add or replace a plugin and refresh the hook handler cache"""
+        self.plugins[plugin_id] = plugin
+        self.invalidate_hook_cache()
+    
+    def unregister_plugin(self, plugin_id: str) -> Optional[BaseLogicPlugin]:
+        """Remove a plugin and refresh the hook handler cache"""
+        plugin = self.plugins.pop(plugin_id, None)
+        self.invalidate_hook_cache()
+        return plugin
+    
+    def invalidate_hook_cache(self):
+        """
+        Drop the cached hook handlers.
+        
+        Call after changing self.plugins directly, or after assigning an
+        on_<hook> handler on a registered plugin instance.
+        """
+        self._hook_handlers = {}
+        self._hook_caches_built = False
+    
+    def _get_hook_handlers(self, hook_name: str) -> tuple:
+        """
+        Return the handlers registered plugins have for a hook, in plugin order.
+        
+        Returns:
+            tuple: (all, sync, async) where all holds
+                (plugin_id, plugin, handler, is_coroutine) and sync/async hold
+                (plugin_id, plugin, handler)
+        """
+        handlers = self._hook_handlers.get(hook_name)
+        if handlers is None:
+            if not self._hook_caches_built:
+                for plugin in self.plugins.values():
+                    plugin._hook_cache = _build_hook_cache(plugin)
+                self._hook_caches_built = True
+            chain = []
+            for plugin_id, plugin in self.plugins.items():
+                entry = plugin._hook_cache.get(hook_name)
+                if entry is not None:
+                    chain.append((plugin_id, plugin, *entry))
+            handlers = self._hook_handlers[hook_name] = (
+                chain,
+                [(plugin_id, plugin, handler) for plugin_id, plugin, handler, is_coro in chain if not is_coro],
+                [(plugin_id, plugin, handler) for plugin_id, plugin, handler, is_coro in chain if is_coro],
+            )
+        return handlers
+    
     def discover_plugins(self) -> List[str]:
         """
         Discover available plugins in plugin directory.
@@ -104,18 +204,35 @@ class PluginRegistry:
             logger.warning(f"Plugin directory not found: {self.plugin_dir}")
             return []
         
-        plugins = []
-        for item in os.listdir(self.plugin_dir):
-            plugin_path = os.path.join(self.plugin_dir, item)
-            
-            # Check if it's a valid plugin directory
-            if os.path.isdir(plugin_path) and not item.startswith("_"):
-                if os.path.exists(os.path.join(plugin_path, "plugin.py")):
-                    plugins.append(item)
+        # A valid plugin directory is public and contains plugin.py.
+        # DirEntry.is_dir() reuses the type read with the listing, no extra stat.
+        with os.scandir(self.plugin_dir) as entries:
+            plugins = [
+                entry.name for entry in entries
+                if entry.is_dir()
+                and not entry.name.startswith("_")
+                and os.path.isfile(os.path.join(entry.path, "plugin.py"))
+            ]
         
         logger.info(f"Discovered {len(plugins)} plugins: {plugins}")
         return plugins
     
+    def _import_plugin_module(self, plugin_id: str):
+        """Import a plugin's module once, reusing it on later loads"""
+        plugin_module = self._module_cache.get(plugin_id)
+        if plugin_module is None:
+            module_path = f"{self._package_path}.{plugin_id}.plugin"
+            plugin_module = importlib.import_module(module_path)
+            self._module_cache[plugin_id] = plugin_module
+        return plugin_module
+    
+    def _preload_plugin_module(self, plugin_id: str):
+        """Import a plugin's module ahead of load_plugin, which reports any failure"""
+        try:
+            self._import_plugin_module(plugin_id)
+        except Exception:
+            pass
+    
     def load_plugin(self, plugin_id: str) -> bool:
         """
         Load and register a single plugin.
@@ -134,19 +251,14 @@ class PluginRegistry:
                 logger.warning(f"Using legacy plugin name '{original_id}', please update to: {plugin_id}")
             
             # Import plugin module
-            # plugin_dir could be relative, e.g. "src/logic_plugins"
-            # We need to turn this into a package path: "src.logic_plugins"
-            package_path = self.plugin_dir.replace('/', '.').replace('\\', '.')
-            module_path = f"{package_path}.{plugin_id}.plugin"
-            
-            plugin_module = importlib.import_module(module_path)
+            plugin_module = self._import_plugin_module(plugin_id)
             
             # Get plugin class from AVAILABLE_PLUGINS if defined, otherwise construct
             if plugin_id in AVAILABLE_PLUGINS:
                 class_name = AVAILABLE_PLUGINS[plugin_id]['class']
             else:
                 # Fallback: Construct expected class name: "my_plugin" -> "MyPluginPlugin"
-                class_name = f"{plugin_id.title().replace('_', '')}Plugin"
+                class_name = ''.join(part.capitalize() for part in plugin_id.split('_')) + 'Plugin'
             plugin_class = getattr(plugin_module, class_name)
             
             # Load plugin config
@@ -159,8 +271,8 @@ class PluginRegistry:
                 service_api=self.service_api
             )
             
-            # Register
-            self.plugins[plugin_id] = plugin_instance
+            # Register; hook handlers are resolved when execute_hook next runs
+            self.register_plugin(plugin_id, plugin_instance)
             
             logger.info(f"Loaded plugin: {plugin_id}")
             return True
@@ -179,6 +291,12 @@ class PluginRegistry:
         """Discover and load all available plugins"""
         plugins = self.discover_plugins()
         
+        # Plugin module bodies can do heavy setup, so import them in parallel.
+        # Instantiation and registration stay sequential and in discovery order.
+        if len(plugins) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(plugins))) as executor:
+                list(executor.map(self._preload_plugin_module, plugins))
+        
         for plugin_id in plugins:
             self.load_plugin(plugin_id)
         
@@ -270,7 +388,7 @@ class PluginRegistry:
             if hasattr(plugin, 'can_process_signal'):
                 # can_process_signal might be async, handle sync check
                 try:
-                    if asyncio.iscoroutinefunction(plugin.can_process_signal):
+                    if inspect.iscoroutinefunction(plugin.can_process_signal):
                         # For sync context, check via get_supported_strategies instead
                         if hasattr(plugin, 'get_supported_strategies'):
                             strategy = signal_data.get('strategy', '')
@@ -294,73 +412,102 @@ class PluginRegistry:
         Returns:
             dict: Execution result from plugin
         """
-        plugin = self.get_plugin(plugin_id)
-        
-        if not plugin:
-            # Instead of raising, return error dict to avoid crashing caller
-            logger.error(f"Plugin not found: {plugin_id}")
-            return {"error": "plugin_not_found"}
+        try:
+            plugin = self.plugins[plugin_id]
+        except KeyError:
+            # Not registered under this id, may be a legacy name
+            plugin = self.get_plugin(plugin_id)
+            if not plugin:
+                # Instead of raising, return error dict to avoid crashing caller
+                logger.error(f"Plugin not found: {plugin_id}")
+                return {"error": "plugin_not_found"}
         
         if not plugin.enabled:
             logger.warning(f"Plugin {plugin_id} is disabled, skipping alert")
             return {"skipped": True, "reason": "plugin_disabled"}
         
         # Route based on alert type - assume alert object has signal_type
-        signal_type = getattr(alert, "signal_type", None)
-        if not signal_type and isinstance(alert, dict):
-             signal_type = alert.get("signal_type")
+        try:
+            signal_type = alert.signal_type
+        except AttributeError:
+            signal_type = alert.get("signal_type") if isinstance(alert, dict) else None
 
         if not signal_type:
              logger.warning("Alert missing signal_type")
              return {"error": "missing_signal_type"}
 
-        if "entry" in signal_type.lower():
-            return await plugin.process_entry_signal(alert)
-        elif "exit" in signal_type.lower():
-            return await plugin.process_exit_signal(alert)
-        elif "reversal" in signal_type.lower():
-            return await plugin.process_reversal_signal(alert)
-        else:
+        signal_type_lower = signal_type.lower()
+        kind = next((key for key in _SIGNAL_KEYS if key in signal_type_lower), None)
+        if kind is None:
             logger.warning(f"Unknown signal type: {signal_type}")
             return {"error": "unknown_signal_type"}
+        
+        result: Dict[str, Any] = await getattr(plugin, _SIGNAL_HANDLERS[kind])(alert)
+        return result
     
-    async def execute_hook(self, hook_name: str, data: Any) -> Any:
+    async def execute_hook(self, hook_name: str, data: Any, concurrent: bool = False) -> Any:
         """
         Execute a hook across all enabled plugins.
         
         Args:
             hook_name: Name of hook event (e.g., 'signal_received')
             data: Data to pass to hook
+            concurrent: Run async handlers together with asyncio.gather.
+                Only for side-effecting hooks: every async handler sees the
+                original data and their return values are ignored, so there
+                is no filter chaining between them. Sync handlers still run
+                in order and chain as usual.
             
         Returns:
             Modified data (pipe-and-filter style) or original if no modifications
         """
         result = data
+        chain, sync_handlers, async_handlers = self._get_hook_handlers(hook_name)
         
-        for plugin_id, plugin in self.plugins.items():
-            if not plugin.enabled:
-                continue
-            
-            # Check if plugin has hook handler
-            handler_name = f"on_{hook_name}"
-            if hasattr(plugin, handler_name):
+        if concurrent:
+            for plugin_id, plugin, handler in sync_handlers:
+                if not plugin.enabled:
+                    continue
                 try:
-                    handler = getattr(plugin, handler_name)
-                    
-                    # Support both sync and async hooks
-                    if importlib.util.find_spec("asyncio") and asyncio.iscoroutinefunction(handler):
-                        modified = await handler(result)
-                    else:
-                        modified = handler(result)
-                        
+                    modified = handler(result)
                     if modified is not None:
                         result = modified
-                        
-                    # If result explicitly set to None/False by plugin?
-                    # We assume handler returns modified data object.
-                    
                 except Exception as e:
                     logger.error(f"Error in plugin {plugin_id} hook {hook_name}: {e}")
+            
+            enabled_async = [
+                (plugin_id, handler) for plugin_id, plugin, handler in async_handlers if plugin.enabled
+            ]
+            if enabled_async:
+                # Only concurrent callers pay for the asyncio import
+                import asyncio
+                outcomes = await asyncio.gather(
+                    *(handler(data) for _, handler in enabled_async), return_exceptions=True
+                )
+                for (plugin_id, _), outcome in zip(enabled_async, outcomes):
+                    if isinstance(outcome, Exception):
+                        logger.error(f"Error in plugin {plugin_id} hook {hook_name}: {outcome}")
+            
+            return result
+        
+        # Serial mode is a filter chain, so handlers run in plugin order whatever their kind
+        for plugin_id, plugin, handler, is_coro in chain:
+            if not plugin.enabled:
+                continue
+            try:
+                if is_coro:
+                    modified = await handler(result)
+                else:
+                    modified = handler(result)
+                    
+                if modified is not None:
+                    result = modified
+                    
+                # If result explicitly set to None/False by plugin?
+                # We assume handler returns modified data object.
+                
+            except Exception as e:
+                logger.error(f"Error in plugin {plugin_id} hook {hook_name}: {e}")
         
         return result
     
@@ -427,7 +574,7 @@ class PluginRegistry:
             if hasattr(plugin, 'on_sl_hit'):
                 try:
                     handler = getattr(plugin, 'on_sl_hit')
-                    if asyncio.iscoroutinefunction(handler):
+                    if inspect.iscoroutinefunction(handler):
                         result = await handler(trade_data)
                     else:
                         result = handler(trade_data)
@@ -456,7 +603,7 @@ class PluginRegistry:
             if hasattr(plugin, 'on_tp_hit'):
                 try:
                     handler = getattr(plugin, 'on_tp_hit')
-                    if asyncio.iscoroutinefunction(handler):
+                    if inspect.iscoroutinefunction(handler):
                         result = await handler(trade_data)
                     else:
                         result = handler(trade_data)
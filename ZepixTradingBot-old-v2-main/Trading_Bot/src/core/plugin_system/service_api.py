@@ -29,14 +29,46 @@ Services Integrated:
 - TelegramService: 3-Bot notification routing (Plan 07)
 """
 
-from typing import Dict, Any, List, Optional, Tuple, Callable
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Callable, Set, Awaitable, TypeVar, cast
 import logging
 import asyncio
+import importlib
+import inspect
+import sys
+import time
 from datetime import datetime
 from dataclasses import dataclass, field
+from functools import cached_property
+
+if TYPE_CHECKING:
+    from src.core.services.order_execution_service import OrderExecutionService
+    from src.core.services.risk_management_service import RiskManagementService
+    from src.core.services.trend_management_service import TrendManagementService
+    from src.core.services.market_data_service import MarketDataService
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+# Core service classes are imported on first use, not when this module loads
+_LAZY_IMPORTS = {
+    "OrderExecutionService": "src.core.services.order_execution_service",
+    "RiskManagementService": "src.core.services.risk_management_service",
+    "TrendManagementService": "src.core.services.trend_management_service",
+    "MarketDataService": "src.core.services.market_data_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily loaded service class and keep it as a module global"""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
 # ==================== Plan 08: Service Metrics ====================
 
@@ -91,6 +123,59 @@ class ServiceRegistration:
 # ==================== End Plan 08: Service Metrics ====================
 
 
+# Symbols priced with 0.1 pips and 2 digits by the default pip calculator
+_METAL_SYMBOLS = frozenset({'XAUUSD', 'XAGUSD'})
+
+# Default pip metadata per symbol: (pip value per lot, pip size, digits)
+_PIP_DEFAULT = (10.0, 0.0001, 5)
+_PIP_TABLE = {symbol: (10.0, 0.1, 2) for symbol in _METAL_SYMBOLS}
+
+
+class DefaultPipCalculator:
+    """Pip calculator used when the trading engine does not provide one"""
+    
+    __slots__ = ()
+    
+    def get_symbol_meta(self, symbol: str) -> Tuple[float, float, int]:
+        """Return (pip value per lot, pip size, digits) for a symbol"""
+        return _PIP_TABLE.get(symbol, _PIP_DEFAULT)
+    
+    def get_pip_value(self, symbol: str, lot_size: float) -> float:
+        return _PIP_TABLE.get(symbol, _PIP_DEFAULT)[0] * lot_size
+    
+    def get_pip_size(self, symbol: str) -> float:
+        return _PIP_TABLE.get(symbol, _PIP_DEFAULT)[1]
+    
+    def get_digits(self, symbol: str) -> int:
+        return _PIP_TABLE.get(symbol, _PIP_DEFAULT)[2]
+
+
+# Stateless, so every ServiceAPI without an engine pip calculator shares it
+_DEFAULT_PIP_CALCULATOR = DefaultPipCalculator()
+
+# Results returned when the backing core service is unavailable.
+# Templates only: callers get a copy, since they may mutate the result.
+_FALLBACK_VOLATILITY: Dict[str, Any] = {"state": "UNKNOWN"}
+_FALLBACK_PARTIAL_CLOSE: Dict[str, Any] = {"success": False, "error": "Service not available"}
+_ORDER_REJECTED_MSG = "Trading is paused. Order rejected."
+_FALLBACK_DAILY_LIMIT: Dict[str, Any] = {"can_trade": True, "daily_loss": 0.0, "daily_limit": 0.0}
+_FALLBACK_LIFETIME_LIMIT: Dict[str, Any] = {"can_trade": True, "lifetime_loss": 0.0, "lifetime_limit": 0.0}
+_FALLBACK_VALIDATION: Dict[str, Any] = {"valid": True, "reason": "Validation skipped"}
+_FALLBACK_MTF_TRENDS: Dict[str, int] = {"15m": 0, "1h": 0, "4h": 0, "1d": 0}
+
+# ServiceAPI.log level names; anything else logs at INFO
+_LOG_LEVELS = {
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+}
+
+# Queued by ServiceAPI.close() to stop the notification sender once
+# everything queued before it has been sent
+_NOTIFY_STOP = object()
+
+
 class ServiceAPI:
     """
     Unified Service API - Single point of entry for all plugin operations.
@@ -116,6 +201,27 @@ class ServiceAPI:
     
     VERSION = "3.0.0"
     
+    # Seconds a cached MT5 tick / symbol info / balance / MTF trend set stays fresh
+    PRICE_CACHE_TTL = 0.05
+    # Symbol info carries live fields (spread, trade_mode), so keep it short
+    SYMBOL_INFO_CACHE_TTL = 0.2
+    BALANCE_CACHE_TTL = 0.5
+    MTF_TRENDS_CACHE_TTL = 1.0
+    
+    # Queued send_notification messages; the oldest is dropped when full
+    NOTIFY_QUEUE_SIZE = 1024
+    
+    # Fixed per-instance state lives in slots; __dict__ stays for the
+    # cached_property core services
+    __slots__ = (
+        "_engine", "_plugin_id", "_plugin_prefix", "_log_prefix", "_config", "_plugin_cfg",
+        "config", "_mt5", "_risk", "_telegram", "_logger", "_pip_calculator", "_trend_manager", "_database",
+        "_service_registry", "_service_metrics",
+        "_services_initialized", "_service_failed",
+        "_tick_cache", "_symbol_info_cache", "_balance_cache", "_mtf_trends_cache",
+        "_inflight", "_notify_queue", "_notify_task", "__dict__",
+    )
+    
     def __init__(self, trading_engine, plugin_id: str = "core"):
         """
         Initialize ServiceAPI with trading engine and optional plugin_id.
@@ -125,102 +231,140 @@ class ServiceAPI:
             plugin_id: Plugin identifier for tracking (default: "core" for legacy)
         """
         self._engine = trading_engine
-        self._plugin_id = plugin_id
+        self._plugin_id = sys.intern(plugin_id)
+        self._plugin_prefix = self._plugin_id + "|"  # MT5 order comment prefix
+        self._log_prefix = sys.intern(f"[{plugin_id}] ")
         self._config = trading_engine.config
         self.config = trading_engine.config  # Alias for compatibility
+        self.refresh_plugin_config()
         self._mt5 = trading_engine.mt5_client
         self._risk = trading_engine.risk_manager
         self._telegram = trading_engine.telegram_bot
         self._logger = logger
         
-        self._order_service = None
-        self._risk_service = None
-        self._trend_service = None
-        self._market_service = None
+        # Engine collaborators the core services are built from
+        pip_calculator = getattr(trading_engine, 'pip_calculator', None)
+        if pip_calculator is None:
+            pip_calculator = self._create_default_pip_calculator()
+        self._pip_calculator = pip_calculator
+        
+        trend_manager = getattr(trading_engine, 'timeframe_trend_manager', None)
+        if trend_manager is None:
+            trend_manager = getattr(trading_engine, 'trend_manager', None)
+        self._trend_manager = trend_manager
+        self._database = getattr(trading_engine, 'database', None)
         
         # Plan 08: Service Registry
         self._service_registry: Dict[str, ServiceRegistration] = {}
         self._service_metrics: Dict[str, ServiceMetrics] = {}
         
-        self._services_initialized = False
-        self._init_services()
+        # Core services are built on first use; classes that failed are not retried
+        self._services_initialized = True
+        self._service_failed: Set[str] = set()
+        
+        # symbol -> (time.monotonic() when fetched, value)
+        self._tick_cache: Dict[str, Tuple[float, float]] = {}
+        self._symbol_info_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._mtf_trends_cache: Dict[str, Tuple[float, Dict[str, int]]] = {}
+        # (time.monotonic() when fetched, balance); cleared by order and close calls
+        self._balance_cache: Optional[Tuple[float, float]] = None
+        
+        # (method, symbol, ...) -> market data fetch shared by concurrent callers
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        
+        # Background Telegram sender, started by the first send_notification
+        # made inside a running event loop
+        self._notify_queue: Optional[asyncio.Queue] = None
+        self._notify_task: Optional[asyncio.Task] = None
     
-    def _init_services(self):
+    @classmethod
+    def for_plugin(cls, trading_engine, plugin_id: str = "core") -> "ServiceAPI":
         """
-        Initialize all services from Batch 03.
+        Get the shared ServiceAPI for a plugin on this engine, creating it once.
         
-        Services are lazily initialized to avoid circular dependencies.
-        If services cannot be imported, the API falls back to direct calls.
+        Instances are kept on the engine itself rather than in a module-level
+        registry: each one holds a strong reference to its engine, so only
+        engine-owned storage lets them be collected along with it.
+        
+        Args:
+            trading_engine: The main TradingEngine instance
+            plugin_id: Plugin identifier
+        """
+        instances: Dict[str, "ServiceAPI"] = vars(trading_engine).setdefault("_service_apis", {})
+        api = instances.get(plugin_id)
+        if api is None:
+            api = instances[plugin_id] = cls(trading_engine, plugin_id)
+        return api
+    
+    def _build_service(self, class_name: str, **kwargs) -> Optional[Any]:
         """
+        Construct one Batch 03 core service.
+        
+        If the service cannot be imported or built, the API falls back to
+        direct calls for it.
+        """
+        if class_name in self._service_failed:
+            return None
         try:
-            from src.core.services import (
-                OrderExecutionService,
-                RiskManagementService,
-                TrendManagementService,
-                MarketDataService
-            )
-            
-            pip_calculator = getattr(self._engine, 'pip_calculator', None)
-            if pip_calculator is None:
-                pip_calculator = self._create_default_pip_calculator()
-            
-            trend_manager = getattr(self._engine, 'timeframe_trend_manager', None)
-            if trend_manager is None:
-                trend_manager = getattr(self._engine, 'trend_manager', None)
-            
-            self._order_service = OrderExecutionService(
-                mt5_client=self._mt5,
-                config=self._config,
-                pip_calculator=pip_calculator
-            )
-            
-            self._risk_service = RiskManagementService(
-                risk_manager=self._risk,
-                config=self._config,
-                mt5_client=self._mt5,
-                pip_calculator=pip_calculator
-            )
-            
-            self._trend_service = TrendManagementService(
-                trend_manager=trend_manager,
-                db=getattr(self._engine, 'database', None)
-            )
-            
-            self._market_service = MarketDataService(
-                mt5_client=self._mt5,
-                config=self._config,
-                pip_calculator=pip_calculator
-            )
-            
-            self._services_initialized = True
-            self._logger.info(f"[ServiceAPI] Services initialized for plugin: {self._plugin_id}")
-            
+            service_class = getattr(sys.modules[__name__], class_name)
+            service = service_class(**kwargs)
+            self._logger.info(f"[ServiceAPI] {class_name} initialized for plugin: {self._plugin_id}")
+            return service
         except ImportError as e:
-            self._logger.warning(f"[ServiceAPI] Services not available, using fallback: {e}")
-            self._services_initialized = False
+            self._logger.warning(f"[ServiceAPI] {class_name} not available, using fallback: {e}")
         except Exception as e:
-            self._logger.error(f"[ServiceAPI] Error initializing services: {e}")
-            self._services_initialized = False
+            self._logger.error(f"[ServiceAPI] Error initializing {class_name}: {e}")
+        self._services_initialized = False
+        self._service_failed.add(class_name)
+        return None
+    
+    @cached_property
+    def _order_service(self) -> Optional["OrderExecutionService"]:
+        """OrderExecutionService, built on first use"""
+        service: Optional["OrderExecutionService"] = self._build_service(
+            "OrderExecutionService",
+            mt5_client=self._mt5,
+            config=self._config,
+            pip_calculator=self._pip_calculator
+        )
+        return service
+    
+    @cached_property
+    def _risk_service(self) -> Optional["RiskManagementService"]:
+        """RiskManagementService, built on first use"""
+        service: Optional["RiskManagementService"] = self._build_service(
+            "RiskManagementService",
+            risk_manager=self._risk,
+            config=self._config,
+            mt5_client=self._mt5,
+            pip_calculator=self._pip_calculator
+        )
+        return service
+    
+    @cached_property
+    def _trend_service(self) -> Optional["TrendManagementService"]:
+        """TrendManagementService, built on first use"""
+        service: Optional["TrendManagementService"] = self._build_service(
+            "TrendManagementService",
+            trend_manager=self._trend_manager,
+            db=self._database
+        )
+        return service
+    
+    @cached_property
+    def _market_service(self) -> Optional["MarketDataService"]:
+        """MarketDataService, built on first use"""
+        service: Optional["MarketDataService"] = self._build_service(
+            "MarketDataService",
+            mt5_client=self._mt5,
+            config=self._config,
+            pip_calculator=self._pip_calculator
+        )
+        return service
     
     def _create_default_pip_calculator(self):
-        """Create a default pip calculator if none exists"""
-        class DefaultPipCalculator:
-            def get_pip_value(self, symbol: str, lot_size: float) -> float:
-                if symbol in ['XAUUSD', 'XAGUSD']:
-                    return lot_size * 10.0
-                return lot_size * 10.0
-            
-            def get_pip_size(self, symbol: str) -> float:
-                if symbol in ['XAUUSD', 'XAGUSD']:
-                    return 0.1
-                return 0.0001
-            
-            def get_digits(self, symbol: str) -> int:
-                if symbol in ['XAUUSD', 'XAGUSD']:
-                    return 2
-                return 5
-        
-        return DefaultPipCalculator()
+        """Return the shared default pip calculator"""
+        return _DEFAULT_PIP_CALCULATOR
     
     @property
     def plugin_id(self) -> str:
@@ -229,7 +373,12 @@ class ServiceAPI:
     
     @property
     def services_available(self) -> bool:
-        """Check if services are properly initialized"""
+        """
+        Check if core services are available.
+        
+        Services are built on first use, so this turns False once any of them
+        has failed to import or construct.
+        """
         return self._services_initialized
 
     # =========================================================================
@@ -487,9 +636,17 @@ class ServiceAPI:
         Returns:
             Current bid price or 0.0 if unavailable
         """
+        tick_cache = self._tick_cache
+        now = time.monotonic()
+        cached = tick_cache.get(symbol)
+        if cached and now - cached[0] < self.PRICE_CACHE_TTL:
+            return cached[1]
+        
         tick = self._mt5.get_symbol_tick(symbol)
         if tick:
-            return tick.get('bid', 0.0)
+            bid = tick.get('bid', 0.0)
+            tick_cache[symbol] = (now, bid)
+            return bid
         return 0.0
 
     def get_symbol_info(self, symbol: str) -> Dict:
@@ -502,7 +659,78 @@ class ServiceAPI:
         Returns:
             Dict with symbol information
         """
-        return self._mt5.get_symbol_info(symbol)
+        info_cache = self._symbol_info_cache
+        now = time.monotonic()
+        cached = info_cache.get(symbol)
+        if cached and now - cached[0] < self.SYMBOL_INFO_CACHE_TTL:
+            return dict(cached[1])
+        
+        info = self._mt5.get_symbol_info(symbol)
+        if info:
+            info_cache[symbol] = (now, dict(info))
+        return info
+    
+    async def _coalesced(self, key: tuple, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Run fetch() once for all concurrent callers with the same key.
+        
+        The first caller starts the fetch; callers arriving while it is in
+        flight await the same task. Shielded, so one caller being cancelled
+        does not cancel the fetch for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            
+            def _done(finished, key=key):
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+            
+            task.add_done_callback(_done)
+        result: _T = await asyncio.shield(task)
+        return result
+    
+    def invalidate_cache(self, symbol: Optional[str] = None) -> None:
+        """
+        Drop cached prices, symbol info and MTF trends.
+        
+        Args:
+            symbol: Only drop this symbol's entries (default: all symbols)
+        """
+        if symbol is None:
+            self._tick_cache.clear()
+            self._symbol_info_cache.clear()
+            self._mtf_trends_cache.clear()
+        else:
+            self._tick_cache.pop(symbol, None)
+            self._symbol_info_cache.pop(symbol, None)
+            self._mtf_trends_cache.pop(symbol, None)
+    
+    async def warmup(self, symbols: List[str]) -> None:
+        """
+        Build the core services and prime per-symbol caches before trading.
+        
+        Meant to run once at startup, before the first tick, so the first
+        real order does not pay for service construction, the symbol info
+        fetch or the first pass through the lot-size path. Failures are
+        logged and skipped; warming up never blocks startup.
+        
+        Args:
+            symbols: Symbols the bot will trade
+        """
+        # Reading each cached_property builds the service
+        for name in ("_order_service", "_risk_service", "_trend_service", "_market_service"):
+            getattr(self, name)
+        
+        for symbol in symbols:
+            try:
+                self.get_symbol_info(symbol)
+                if self._market_service:
+                    await self.get_current_spread(symbol)
+                self.calculate_lot_size(symbol, 50.0)
+            except Exception as e:
+                self._logger.warning(f"[ServiceAPI] Warmup failed for {symbol}: {e}")
     
     async def get_current_spread(self, symbol: str) -> float:
         """
@@ -517,7 +745,10 @@ class ServiceAPI:
             Spread in pips
         """
         if self._market_service:
-            return await self._market_service.get_current_spread(symbol)
+            return await self._coalesced(
+                ("spread", symbol),
+                lambda: self._market_service.get_current_spread(symbol)
+            )
         return 999.9
     
     async def check_spread_acceptable(self, symbol: str, max_spread_pips: float) -> bool:
@@ -546,7 +777,10 @@ class ServiceAPI:
             Dict with bid, ask, spread, timestamp
         """
         if self._market_service:
-            return await self._market_service.get_current_price(symbol)
+            return await self._coalesced(
+                ("price_data", symbol),
+                lambda: self._market_service.get_current_price(symbol)
+            )
         return {"bid": self.get_price(symbol), "ask": 0.0, "spread_pips": 0.0}
     
     async def get_volatility_state(self, symbol: str, timeframe: str = '15m') -> Dict[str, Any]:
@@ -561,8 +795,11 @@ class ServiceAPI:
             Dict with state (HIGH/MODERATE/LOW), ATR values
         """
         if self._market_service:
-            return await self._market_service.get_volatility_state(symbol, timeframe)
-        return {"state": "UNKNOWN"}
+            return await self._coalesced(
+                ("volatility", symbol, timeframe),
+                lambda: self._market_service.get_volatility_state(symbol, timeframe)
+            )
+        return dict(_FALLBACK_VOLATILITY)
     
     async def is_market_open(self, symbol: str) -> bool:
         """
@@ -583,8 +820,24 @@ class ServiceAPI:
     # =========================================================================
 
     def get_balance(self) -> float:
-        """Get current account balance (backward compatible)"""
-        return self._mt5.get_account_balance()
+        """
+        Get current account balance (backward compatible).
+        
+        Reused for BALANCE_CACHE_TTL seconds; orders and closes made
+        through this API drop the cached value.
+        """
+        now = time.monotonic()
+        cached = self._balance_cache
+        if cached and now - cached[0] < self.BALANCE_CACHE_TTL:
+            return cached[1]
+        
+        balance = self._mt5.get_account_balance()
+        self._balance_cache = (now, balance)
+        return balance
+    
+    def invalidate_balance(self) -> None:
+        """Drop the cached account balance"""
+        self._balance_cache = None
     
     def get_equity(self) -> float:
         """Get current account equity (backward compatible)"""
@@ -594,6 +847,24 @@ class ServiceAPI:
     # ORDER EXECUTION METHODS (OrderExecutionService)
     # =========================================================================
 
+    # Order methods read self._engine.trading_enabled on every call on purpose:
+    # it is a TradingEngine property over is_paused, so it cannot be cached here.
+    
+    async def _forward_order(self, method_name: str, fallback: Any, **kwargs) -> Any:
+        """
+        Call an OrderExecutionService method on behalf of this plugin.
+        
+        Args:
+            method_name: OrderExecutionService method to call
+            fallback: Result when the service is unavailable; called first if callable
+            **kwargs: Method arguments (plugin_id is added)
+        """
+        order_service = self._order_service
+        self._balance_cache = None
+        if order_service:
+            return await getattr(order_service, method_name)(plugin_id=self._plugin_id, **kwargs)
+        return fallback() if callable(fallback) else fallback
+
     def place_order(self, symbol: str, direction: str, lot_size: float, 
                    sl_price: float = 0.0, tp_price: float = 0.0, 
                    comment: str = "", **kwargs) -> Optional[int]:
@@ -613,9 +884,10 @@ class ServiceAPI:
             MT5 ticket number or None
         """
         if not self._engine.trading_enabled:
-            self._logger.warning("Trading is paused. Order rejected.")
+            self._logger.warning(_ORDER_REJECTED_MSG)
             return None
 
+        self._balance_cache = None
         return self._mt5.place_order(
             symbol=symbol,
             order_type=direction.upper(),
@@ -623,7 +895,7 @@ class ServiceAPI:
             price=0.0,
             sl=sl_price,
             tp=tp_price,
-            comment=f"{self._plugin_id}|{comment}" if comment else self._plugin_id
+            comment=self._plugin_prefix + comment if comment else self._plugin_id
         )
     
     async def place_order_async(
@@ -656,9 +928,10 @@ class ServiceAPI:
             Dict with success status and trade_id or error
         """
         if not self._engine.trading_enabled:
-            self._logger.warning("Trading is paused. Order rejected.")
+            self._logger.warning(_ORDER_REJECTED_MSG)
             return {"success": False, "error": "Trading is paused"}
 
+        self._balance_cache = None
         try:
             ticket = self._mt5.place_order(
                 symbol=symbol,
@@ -667,11 +940,11 @@ class ServiceAPI:
                 price=entry_price,
                 sl=sl_price,
                 tp=tp_price,
-                comment=f"{self._plugin_id}|{comment}" if comment else self._plugin_id
+                comment=self._plugin_prefix + comment if comment else self._plugin_id
             )
             
             if ticket:
-                self._logger.info(f"[ServiceAPI] Order placed: {ticket} | {symbol} {direction} {lot_size}")
+                self._logger.info("[ServiceAPI] Order placed: %s | %s %s %s", ticket, symbol, direction, lot_size)
                 return {"success": True, "trade_id": ticket}
             else:
                 return {"success": False, "error": "Order placement failed"}
@@ -714,21 +987,20 @@ class ServiceAPI:
             self._logger.warning("Trading is paused. Dual orders rejected.")
             return (None, None)
         
-        if self._order_service:
-            return await self._order_service.place_dual_orders_v3(
-                plugin_id=self._plugin_id,
-                symbol=symbol,
-                direction=direction,
-                lot_size_total=lot_size_total,
-                order_a_sl=order_a_sl,
-                order_a_tp=order_a_tp,
-                order_b_sl=order_b_sl,
-                order_b_tp=order_b_tp,
-                logic_route=logic_route
-            )
+        if not self._order_service:
+            self._logger.warning("[ServiceAPI] OrderService not available, using fallback")
         
-        self._logger.warning("[ServiceAPI] OrderService not available, using fallback")
-        return (None, None)
+        return cast(Tuple[Optional[int], Optional[int]], await self._forward_order(
+            "place_dual_orders_v3", (None, None),
+            symbol=symbol,
+            direction=direction,
+            lot_size_total=lot_size_total,
+            order_a_sl=order_a_sl,
+            order_a_tp=order_a_tp,
+            order_b_sl=order_b_sl,
+            order_b_tp=order_b_tp,
+            logic_route=logic_route
+        ))
     
     async def place_dual_orders_v6(
         self,
@@ -761,18 +1033,15 @@ class ServiceAPI:
             self._logger.warning("Trading is paused. V6 dual orders rejected.")
             return (None, None)
         
-        if self._order_service:
-            return await self._order_service.place_dual_orders_v6(
-                plugin_id=self._plugin_id,
-                symbol=symbol,
-                direction=direction,
-                lot_size_total=lot_size_total,
-                sl_price=sl_price,
-                tp1_price=tp1_price,
-                tp2_price=tp2_price
-            )
-        
-        return (None, None)
+        return cast(Tuple[Optional[int], Optional[int]], await self._forward_order(
+            "place_dual_orders_v6", (None, None),
+            symbol=symbol,
+            direction=direction,
+            lot_size_total=lot_size_total,
+            sl_price=sl_price,
+            tp1_price=tp1_price,
+            tp2_price=tp2_price
+        ))
     
     async def place_single_order_a(
         self,
@@ -800,18 +1069,16 @@ class ServiceAPI:
         if not self._engine.trading_enabled:
             return None
         
-        if self._order_service:
-            return await self._order_service.place_single_order_a(
-                plugin_id=self._plugin_id,
-                symbol=symbol,
-                direction=direction,
-                lot_size=lot_size,
-                sl_price=sl_price,
-                tp_price=tp_price,
-                comment=comment
-            )
-        
-        return self.place_order(symbol, direction, lot_size, sl_price, tp_price, comment)
+        return cast(Optional[int], await self._forward_order(
+            "place_single_order_a",
+            lambda: self.place_order(symbol, direction, lot_size, sl_price, tp_price, comment),
+            symbol=symbol,
+            direction=direction,
+            lot_size=lot_size,
+            sl_price=sl_price,
+            tp_price=tp_price,
+            comment=comment
+        ))
     
     async def place_single_order_b(
         self,
@@ -839,21 +1106,20 @@ class ServiceAPI:
         if not self._engine.trading_enabled:
             return None
         
-        if self._order_service:
-            return await self._order_service.place_single_order_b(
-                plugin_id=self._plugin_id,
-                symbol=symbol,
-                direction=direction,
-                lot_size=lot_size,
-                sl_price=sl_price,
-                tp_price=tp_price,
-                comment=comment
-            )
-        
-        return self.place_order(symbol, direction, lot_size, sl_price, tp_price, comment)
+        return cast(Optional[int], await self._forward_order(
+            "place_single_order_b",
+            lambda: self.place_order(symbol, direction, lot_size, sl_price, tp_price, comment),
+            symbol=symbol,
+            direction=direction,
+            lot_size=lot_size,
+            sl_price=sl_price,
+            tp_price=tp_price,
+            comment=comment
+        ))
 
     def close_trade(self, trade_id: int) -> bool:
         """Close an existing trade (backward compatible)"""
+        self._balance_cache = None
         return self._mt5.close_position(trade_id)
     
     async def close_positions(self, symbol: str = None, direction: str = None) -> List[Dict[str, Any]]:
@@ -869,6 +1135,7 @@ class ServiceAPI:
         """
         results = []
         positions = self._mt5.get_positions()
+        self._balance_cache = None
         
         for pos in positions:
             if symbol and pos.get('symbol') != symbol:
@@ -909,7 +1176,7 @@ class ServiceAPI:
             closed_count = sum(1 for r in results if r.get('closed'))
             
             self._logger.info(
-                f"[ServiceAPI] Closed {closed_count} {direction.upper()} positions for {symbol}"
+                "[ServiceAPI] Closed %d %s positions for %s", closed_count, direction.upper(), symbol
             )
             
             return {
@@ -932,15 +1199,12 @@ class ServiceAPI:
         Returns:
             Dict with success status and profit info
         """
-        if self._order_service:
-            return await self._order_service.close_position(
-                plugin_id=self._plugin_id,
-                order_id=order_id,
-                reason=reason
-            )
-        
-        success = self.close_trade(order_id)
-        return {"success": success, "order_id": order_id, "reason": reason}
+        return cast(Dict[str, Any], await self._forward_order(
+            "close_position",
+            lambda: {"success": self.close_trade(order_id), "order_id": order_id, "reason": reason},
+            order_id=order_id,
+            reason=reason
+        ))
     
     async def close_position_partial(self, order_id: int, percentage: float) -> Dict[str, Any]:
         """
@@ -953,14 +1217,11 @@ class ServiceAPI:
         Returns:
             Dict with closed volume and remaining info
         """
-        if self._order_service:
-            return await self._order_service.close_position_partial(
-                plugin_id=self._plugin_id,
-                order_id=order_id,
-                percentage=percentage
-            )
-        
-        return {"success": False, "error": "Service not available"}
+        return cast(Dict[str, Any], await self._forward_order(
+            "close_position_partial", lambda: dict(_FALLBACK_PARTIAL_CLOSE),
+            order_id=order_id,
+            percentage=percentage
+        ))
 
     def modify_order(self, trade_id: int, sl: float = 0.0, tp: float = 0.0) -> bool:
         """Modify SL/TP of a trade (backward compatible)"""
@@ -983,20 +1244,28 @@ class ServiceAPI:
         Returns:
             True if modification successful
         """
-        if self._order_service:
-            return await self._order_service.modify_order(
-                plugin_id=self._plugin_id,
-                order_id=order_id,
-                new_sl=new_sl,
-                new_tp=new_tp
-            )
-        
-        return self.modify_order(order_id, new_sl or 0.0, new_tp or 0.0)
+        return cast(bool, await self._forward_order(
+            "modify_order",
+            lambda: self.modify_order(order_id, new_sl or 0.0, new_tp or 0.0),
+            order_id=order_id,
+            new_sl=new_sl,
+            new_tp=new_tp
+        ))
     
     def get_open_trades(self) -> List[Any]:
         """Get list of ALL open trades (backward compatible)"""
         return self._engine.get_open_trades()
     
+    def get_open_trades_soa(self) -> Dict[str, Any]:
+        """
+        Get ALL open trades as columns (one NumPy array per field).
+        
+        Returns:
+            Dict of ticket, symbol, direction, strategy, lots, open_price, sl, tp arrays
+        """
+        arrays: Dict[str, Any] = self._engine.get_open_trades_arrays()
+        return arrays
+    
     async def get_plugin_orders(self, symbol: str = None) -> List[Dict]:
         """
         Get all open orders for THIS plugin only.
@@ -1007,13 +1276,10 @@ class ServiceAPI:
         Returns:
             List of open order dictionaries
         """
-        if self._order_service:
-            return await self._order_service.get_open_orders(
-                plugin_id=self._plugin_id,
-                symbol=symbol
-            )
-        
-        return []
+        return cast(List[Dict], await self._forward_order(
+            "get_open_orders", list,
+            symbol=symbol
+        ))
 
     # =========================================================================
     # RISK MANAGEMENT METHODS (RiskManagementService)
@@ -1032,11 +1298,12 @@ class ServiceAPI:
         Returns:
             Dict with lot_size or float for backward compatibility
         """
+        risk = self._risk
         balance = self.get_balance()
-        if hasattr(self._risk, 'calculate_lot_size') and stop_loss_pips > 0:
-            lot_size = self._risk.calculate_lot_size(balance, stop_loss_pips)
+        if hasattr(risk, 'calculate_lot_size') and stop_loss_pips > 0:
+            lot_size = risk.calculate_lot_size(balance, stop_loss_pips)
         else:
-            lot_size = self._risk.get_fixed_lot_size(balance)
+            lot_size = risk.get_fixed_lot_size(balance)
         
         return {"lot_size": lot_size, "balance": balance}
     
@@ -1113,6 +1380,48 @@ class ServiceAPI:
         
         return self.calculate_lot_size(symbol, stop_loss_pips)
     
+    def calculate_lot_sizes_bulk(
+        self,
+        symbols: List[str],
+        risk_percentages: List[float],
+        stop_loss_pips: List[float],
+        account_balance: float = None
+    ) -> Any:
+        """
+        Calculate risk-based lot sizes for many (symbol, risk, SL) rows at once.
+        
+        Same rules as calculate_lot_size_async, for backtest sweeps and
+        other bulk callers. Uses the Numba kernel when Numba is installed.
+        Rows without a usable pip value or SL distance get the fixed lot size.
+        
+        Args:
+            symbols: Trading symbol per row
+            risk_percentages: Risk per trade per row (e.g., 1.5 = 1.5%)
+            stop_loss_pips: Stop loss distance in pips per row
+            account_balance: Account balance (auto-fetch if None)
+        
+        Returns:
+            NumPy array of lot sizes, one per row
+        """
+        import numpy as np
+        from src.core.services._numba_kernels import lot_sizes
+        
+        if account_balance is None:
+            account_balance = self.get_balance()
+        
+        get_pip_value = self._pip_calculator.get_pip_value
+        pip_values = {symbol: get_pip_value(symbol, 1.0) for symbol in set(symbols)}
+        
+        lots = lot_sizes(
+            np.full(len(symbols), float(account_balance)),
+            np.asarray(risk_percentages, dtype=np.float64),
+            np.asarray(stop_loss_pips, dtype=np.float64),
+            np.fromiter((pip_values[symbol] for symbol in symbols), dtype=np.float64, count=len(symbols)),
+            float(self._config.get("max_lot_size", 10.0))
+        )
+        lots[lots == 0.0] = self._risk.get_fixed_lot_size(account_balance)
+        return lots
+    
     async def calculate_atr_sl(
         self,
         symbol: str,
@@ -1184,7 +1493,7 @@ class ServiceAPI:
         """
         if self._risk_service:
             return await self._risk_service.check_daily_limit(self._plugin_id)
-        return {"can_trade": True, "daily_loss": 0.0, "daily_limit": 0.0}
+        return dict(_FALLBACK_DAILY_LIMIT)
     
     async def check_risk_limits(self, symbol: str, lot_size: float, direction: str) -> Dict[str, Any]:
         """
@@ -1247,10 +1556,11 @@ class ServiceAPI:
             ATR value in price units
         """
         if self._market_service:
-            return await self._market_service.get_atr(symbol, period, timeframe)
+            # MarketDataService does not define get_atr yet
+            return await self._market_service.get_atr(symbol, period, timeframe)  # type: ignore[attr-defined,no-any-return]
         
         # Fallback: estimate ATR based on symbol
-        if symbol in ['XAUUSD', 'XAGUSD']:
+        if symbol in _METAL_SYMBOLS:
             return 15.0  # Gold/Silver typical ATR
         return 0.0015  # Forex typical ATR
     
@@ -1295,7 +1605,7 @@ class ServiceAPI:
         """
         if self._risk_service:
             return await self._risk_service.check_lifetime_limit(self._plugin_id)
-        return {"can_trade": True, "lifetime_loss": 0.0, "lifetime_limit": 0.0}
+        return dict(_FALLBACK_LIFETIME_LIMIT)
     
     async def validate_trade_risk(
         self,
@@ -1321,7 +1631,7 @@ class ServiceAPI:
                 lot_size=lot_size,
                 sl_pips=sl_pips
             )
-        return {"valid": True, "reason": "Validation skipped"}
+        return dict(_FALLBACK_VALIDATION)
     
     async def get_fixed_lot_size(self, account_balance: float = None) -> float:
         """
@@ -1363,6 +1673,10 @@ class ServiceAPI:
         """
         Get ALL 4-pillar trends at once.
         
+        Reused for MTF_TRENDS_CACHE_TTL seconds, so the pillar checks of one
+        decision cycle share a single trend service call. Each caller gets
+        its own copy of the cached dict.
+        
         Args:
             symbol: Trading symbol
         
@@ -1370,9 +1684,40 @@ class ServiceAPI:
             Dict with trend values for each timeframe
             {"15m": 1, "1h": 1, "4h": -1, "1d": 1}
         """
-        if self._trend_service:
-            return await self._trend_service.get_mtf_trends(symbol)
-        return {"15m": 0, "1h": 0, "4h": 0, "1d": 0}
+        if not self._trend_service:
+            return dict(_FALLBACK_MTF_TRENDS)
+        
+        now = time.monotonic()
+        cached = self._mtf_trends_cache.get(symbol)
+        if cached and now - cached[0] < self.MTF_TRENDS_CACHE_TTL:
+            return dict(cached[1])
+        
+        trends = await self._coalesced(
+            ("mtf_trends", symbol),
+            lambda: self._trend_service.get_mtf_trends(symbol)
+        )
+        self._mtf_trends_cache[symbol] = (now, dict(trends))
+        return dict(trends)
+    
+    async def get_timeframe_trends_bulk(
+        self,
+        symbol: str,
+        timeframes: Tuple[str, ...] = ("15m", "1h", "4h", "1d")
+    ) -> Dict[str, int]:
+        """
+        Get trend values for several 4-pillar timeframes in one call.
+        
+        Prefer this over calling get_timeframe_trend() once per pillar.
+        
+        Args:
+            symbol: Trading symbol
+            timeframes: Timeframes to return (unknown ones read as 0)
+        
+        Returns:
+            Dict with trend values for the requested timeframes
+        """
+        trends = await self.get_mtf_trends(symbol)
+        return {timeframe: trends.get(timeframe, 0) for timeframe in timeframes}
     
     async def validate_v3_trend_alignment(
         self,
@@ -1547,8 +1892,10 @@ class ServiceAPI:
             }
         
         try:
-            if hasattr(self._engine, 'trend_pulse_manager') and self._engine.trend_pulse_manager:
-                pulse_data = await self._engine.trend_pulse_manager.get_pulse(symbol, higher_tf)
+            # Read per call: the engine creates its TrendPulseManager after ServiceAPI
+            pulse_manager = getattr(self._engine, 'trend_pulse_manager', None)
+            if pulse_manager:
+                pulse_data = await pulse_manager.get_pulse(symbol, higher_tf)
                 
                 if pulse_data is None:
                     return {
@@ -1570,8 +1917,9 @@ class ServiceAPI:
                     reason = f"{higher_tf}m trend: Bear={bear_count} > Bull={bull_count}" if is_aligned else f"{higher_tf}m trend: Bear={bear_count} <= Bull={bull_count}"
                 
                 self._logger.info(
-                    f"[HIGHER_TF_CHECK] {symbol} {signal_tf}m {direction}: "
-                    f"Checking {higher_tf}m - {reason} - {'ALIGNED' if is_aligned else 'MISALIGNED'}"
+                    "[HIGHER_TF_CHECK] %s %sm %s: Checking %sm - %s - %s",
+                    symbol, signal_tf, direction, higher_tf, reason,
+                    "ALIGNED" if is_aligned else "MISALIGNED"
                 )
                 
                 return {
@@ -1637,8 +1985,88 @@ class ServiceAPI:
             plugin_id: Plugin ID (ignored - uses self._plugin_id)
             priority: Message priority (normal, high, low)
             **kwargs: Additional arguments (ignored for backward compatibility)
+        
+        Inside a running event loop the message is queued for a background
+        sender, so the caller never waits on Telegram. Outside one it is
+        sent directly.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._telegram.send_message(message)
+            return
+        
+        self._queue_notification(loop, message, None)
+    
+    def _queue_notification(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        message: str,
+        done: Optional["asyncio.Future[bool]"]
+    ) -> None:
+        """Queue a message for the background sender, starting it on this loop if needed"""
+        task = self._notify_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._notify_queue = asyncio.Queue(maxsize=self.NOTIFY_QUEUE_SIZE)
+            self._notify_task = loop.create_task(self._notify_worker(self._notify_queue))
+        
+        queue = self._notify_queue
+        if queue.full():
+            _, dropped = queue.get_nowait()
+            if dropped is not None and not dropped.done():
+                dropped.set_result(False)
+            self._logger.warning("[ServiceAPI] Notification queue full, dropped oldest message")
+        queue.put_nowait((message, done))
+    
+    async def _notify_worker(self, queue: asyncio.Queue) -> None:
+        """Send queued notifications one at a time until close() stops it"""
+        while True:
+            message, done = await queue.get()
+            if message is _NOTIFY_STOP:
+                return
+            sent = await self._send_queued(message)
+            if done is not None and not done.done():
+                done.set_result(sent)
+    
+    async def _send_queued(self, message: str) -> bool:
+        """Send one queued message, logging rather than raising on failure"""
+        try:
+            await self._send_telegram(message)
+            return True
+        except Exception as e:
+            self._logger.error("[ServiceAPI] Notification error: %s", e)
+            return False
+    
+    async def _send_telegram(self, message: str) -> None:
+        """Send one message; the Telegram client may be sync or async"""
+        result = self._telegram.send_message(message)
+        if inspect.isawaitable(result):
+            await result
+    
+    async def close(self) -> None:
+        """
+        Send every queued notification and stop the background sender.
+        
+        Await this on shutdown; messages queued by send_notification are
+        otherwise lost when the event loop stops.
         """
-        self._telegram.send_message(message)
+        task, queue = self._notify_task, self._notify_queue
+        # Anything sent from here on starts a fresh sender
+        self._notify_task = self._notify_queue = None
+        if task is None or queue is None:
+            return
+        
+        if not task.done() and task.get_loop() is asyncio.get_running_loop():
+            await queue.put((_NOTIFY_STOP, None))
+            await task
+            return
+        
+        # The sender died or belongs to a finished loop; send what it left here
+        while not queue.empty():
+            message, done = queue.get_nowait()
+            sent = await self._send_queued(message)
+            if done is not None and not done.done():
+                done.set_result(sent)
     
     async def send_notification_async(
         self,
@@ -1650,6 +2078,9 @@ class ServiceAPI:
         """
         Send message via Telegram (async version).
         
+        Goes through the same queue as send_notification, so messages from
+        both reach Telegram in the order they were sent.
+        
         Args:
             message: Message to send
             plugin_id: Plugin ID (ignored - uses self._plugin_id)
@@ -1659,24 +2090,16 @@ class ServiceAPI:
         Returns:
             True if sent successfully
         """
-        try:
-            self._telegram.send_message(message)
-            return True
-        except Exception as e:
-            self._logger.error(f"[ServiceAPI] Notification error: {e}")
-            return False
+        loop = asyncio.get_running_loop()
+        done: "asyncio.Future[bool]" = loop.create_future()
+        self._queue_notification(loop, message, done)
+        return await done
 
     def log(self, message: str, level: str = "info"):
         """Log message with plugin context"""
-        log_msg = f"[{self._plugin_id}] {message}"
-        if level.lower() == "error":
-            self._logger.error(log_msg)
-        elif level.lower() == "warning":
-            self._logger.warning(log_msg)
-        elif level.lower() == "debug":
-            self._logger.debug(log_msg)
-        else:
-            self._logger.info(log_msg)
+        self._logger.log(
+            _LOG_LEVELS.get(level.lower(), logging.INFO), "%s%s", self._log_prefix, message
+        )
     
     # =========================================================================
     # V6 NOTIFICATION METHODS (NEW - Telegram V5 Upgrade)
@@ -1960,9 +2383,16 @@ class ServiceAPI:
         Returns:
             Configuration value
         """
-        plugins_config = self._config.get("plugins", {})
-        plugin_config = plugins_config.get(self._plugin_id, {})
-        return plugin_config.get(key, default)
+        return self._plugin_cfg.get(key, default)
+    
+    def refresh_plugin_config(self) -> None:
+        """
+        Re-read this plugin's section of the engine config.
+        
+        get_plugin_config reads a snapshot taken here; call this after the
+        "plugins" section is replaced so the snapshot picks up the change.
+        """
+        self._plugin_cfg = self._config.get("plugins", {}).get(self._plugin_id, {})
 
 
 def create_service_api(trading_engine, plugin_id: str = "core") -> ServiceAPI:
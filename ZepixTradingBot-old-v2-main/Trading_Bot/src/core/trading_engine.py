@@ -118,7 +118,7 @@ class TradingEngine:
         self.combinedlogic_3_enabled = True
 
         # Initialize Plugin System
-        self.service_api = ServiceAPI(self)
+        self.service_api = ServiceAPI.for_plugin(self)
         self.plugin_registry = PluginRegistry(
             config=self.config,
             service_api=self.service_api
@@ -318,6 +318,35 @@ class TradingEngine:
         """Get list of currently open trades"""
         return self.open_trades
     
+    def get_open_trades_arrays(self) -> Dict[str, Any]:
+        """
+        Get currently open trades as one NumPy array per field.
+        
+        Lets callers filter and total open trades with array operations
+        instead of walking Trade objects. Trades without an MT5 ticket
+        get ticket -1.
+        
+        Returns:
+            Dict of ticket, symbol, direction, strategy, lots, open_price, sl, tp arrays
+        """
+        import numpy as np
+        
+        trades = self.open_trades
+        count = len(trades)
+        return {
+            "ticket": np.fromiter(
+                (t.trade_id if t.trade_id is not None else -1 for t in trades),
+                dtype=np.int64, count=count
+            ),
+            "symbol": np.array([t.symbol for t in trades], dtype=object),
+            "direction": np.array([t.direction for t in trades], dtype=object),
+            "strategy": np.array([t.strategy for t in trades], dtype=object),
+            "lots": np.fromiter((t.lot_size for t in trades), dtype=np.float64, count=count),
+            "open_price": np.fromiter((t.entry for t in trades), dtype=np.float64, count=count),
+            "sl": np.fromiter((t.sl for t in trades), dtype=np.float64, count=count),
+            "tp": np.fromiter((t.tp for t in trades), dtype=np.float64, count=count),
+        }
+    
     @property
     def trading_enabled(self) -> bool:
         """Check if trading is enabled (not paused)"""
@@ -333,6 +362,9 @@ class TradingEngine:
             if self.config.get("plugin_system", {}).get("enabled", True):
                 self.plugin_registry.discover_plugins()
                 self.plugin_registry.load_all_plugins()
+            
+            # Build core services and prime symbol caches before the first tick
+            await self.service_api.warmup(list(self.config.get("symbol_config", {})))
 
             self.telegram_bot.set_trend_manager(self.trend_manager)
             
@@ -375,6 +407,11 @@ class TradingEngine:
                 print("SUCCESS: Profit booking manager initialized")
         return success
 
+    async def shutdown(self):
+        """Flush queued notifications and stop background senders before exit"""
+        for service_api in list(vars(self).get("_service_apis", {}).values()):
+            await service_api.close()
+
     def initialize_symbol_signals(self, symbol: str):
         """Initialize signal tracking for a new symbol"""
         if symbol not in self.current_signals:
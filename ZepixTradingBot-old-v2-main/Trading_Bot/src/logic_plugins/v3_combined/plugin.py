@@ -12,7 +12,10 @@ Version: 1.0.0
 Date: 2026-01-14
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Union, cast
+from functools import lru_cache
+import asyncio
+import copy
 import logging
 import json
 import os
@@ -40,8 +43,71 @@ from .signal_handlers import V3SignalHandlers
 from .order_manager import V3OrderManager
 from .trend_validator import V3TrendValidator
 
+_json_loads: Callable[[bytes], Any]
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
+# Used when config.json has no aggressive_reversal_signals list
+DEFAULT_AGGRESSIVE_REVERSAL_SIGNALS = (
+    "Liquidity_Trap_Reversal",
+    "Golden_Pocket_Flip",
+    "Screener_Full_Bullish",
+    "Screener_Full_Bearish"
+)
+
+# Fixed routes checked after config signal_overrides, before timeframe routing
+_FORCED_SIGNAL_ROUTES = {
+    "Screener_Full_Bullish": "combinedlogic-3",
+    "Screener_Full_Bearish": "combinedlogic-3",
+}
+_FORCED_SIGNAL_TF_ROUTES = {
+    ("Golden_Pocket_Flip", "60"): "combinedlogic-3",
+    ("Golden_Pocket_Flip", "240"): "combinedlogic-3",
+}
+
+# Alert direction -> (entry direction, opposite direction to close); anything
+# else is treated as a sell
+_DIR_MAP = {
+    "buy": ("BUY", "SELL"),
+    "sell": ("SELL", "BUY"),
+    "BUY": ("BUY", "SELL"),
+    "SELL": ("SELL", "BUY"),
+}
+_DEFAULT_DIRS = ("SELL", "BUY")
+
+
+@lru_cache(maxsize=8)
+def _read_config_json(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a plugin config.json, cached per (path, mtime) so an edited file
+    is read again. Callers must deep-copy the result before changing it.
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _alert_field(field: str, default: Any, convert=None):
+    """
+    Build a _get_<field> method that reads one field from a dict alert
+    (key) or an alert object (attribute), returning default if absent.
+    """
+    def getter(self, alert):
+        if isinstance(alert, dict):
+            value = alert.get(field, default)
+        else:
+            value = getattr(alert, field, default)
+        return convert(value) if convert else value
+    
+    getter.__doc__ = f"Extract {field} from alert"
+    return getter
+
 
 class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReentryCapable, IDualOrderCapable, IProfitBookingCapable, IAutonomousCapable, IDatabaseCapable):
     """
@@ -61,6 +127,10 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
     - Bonus (1): Sideways_Breakout
     """
     
+    _SUPPORTED_STRATEGIES = frozenset({'V3_COMBINED', 'COMBINED_V3', 'V3'})
+    # Alert "type" values this plugin handles (ZepixV3Alert.type plus reversals)
+    _V3_ALERT_TYPES = frozenset({'entry_v3', 'exit_v3', 'squeeze_v3', 'trend_pulse_v3', 'reversal_v3'})
+    
     def __init__(self, plugin_id: str, config: Dict[str, Any], service_api):
         """
         Initialize the Combined V3 Plugin.
@@ -78,6 +148,11 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         self.order_manager = V3OrderManager(self, service_api)
         self.trend_validator = V3TrendValidator(self)
         
+        # Collaborator methods called once per signal, bound once here
+        self._place_dual = self.order_manager.place_v3_dual_orders
+        self._handle_exit = self.signal_handlers.handle_exit_signal
+        self._handle_reversal = self.signal_handlers.handle_reversal_signal
+        
         self.shadow_mode = self.plugin_config.get("shadow_mode", False)
         
         # Signal type definitions
@@ -88,6 +163,15 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         self.exit_signals = ['Bullish_Exit', 'Bearish_Exit']
         self.info_signals = ['Volatility_Squeeze', 'Trend_Pulse']
         
+        # process_signal handler per exact V3 alert type
+        self._signal_dispatch = {
+            "entry_v3": self.process_entry_signal,
+            "exit_v3": self.process_exit_signal,
+            "reversal_v3": self.process_reversal_signal,
+            "squeeze_v3": self.process_entry_signal,
+            "trend_pulse_v3": self.process_entry_signal,
+        }
+        
         # Re-entry system support (Plan 03)
         self._chain_levels: Dict[str, int] = {}  # trade_id -> chain_level
         self._reentry_service: Optional[ReentryService] = None
@@ -935,13 +1019,10 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
     
     def _load_plugin_config(self):
         """Load plugin configuration from config.json"""
-        config_path = os.path.join(
-            os.path.dirname(__file__), "config.json"
-        )
-        
         try:
-            with open(config_path, 'r') as f:
-                self.plugin_config = json.load(f)
+            self.plugin_config = copy.deepcopy(
+                _read_config_json(_CONFIG_PATH, os.stat(_CONFIG_PATH).st_mtime)
+            )
         except FileNotFoundError:
             self.logger.warning("config.json not found, using defaults")
             self.plugin_config = self.config
@@ -951,6 +1032,22 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         
         if self.config:
             self.plugin_config.update(self.config)
+        
+        # Routing tables read on every signal, resolved once here
+        signal_routing = self.plugin_config.get("signal_routing", {})
+        self._signal_overrides = signal_routing.get("signal_overrides", {})
+        self._tf_routing = signal_routing.get("timeframe_routing", {})
+        self._default_logic = signal_routing.get("default_logic", "combinedlogic-2")
+        self._logic_multipliers = self.plugin_config.get("logic_multipliers", {})
+        self._aggressive_signals_set = frozenset(
+            self.plugin_config.get("aggressive_reversal_signals", DEFAULT_AGGRESSIVE_REVERSAL_SIGNALS)
+        )
+        
+        # Fixed part of get_status(); shadow_mode can change at runtime
+        self._status_suffix = {
+            "supported_signals": self.metadata.get("supported_signals", []),
+            "logic_multipliers": self._logic_multipliers,
+        }
     
     def _load_metadata(self) -> Dict[str, Any]:
         """Load plugin metadata"""
@@ -998,17 +1095,18 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
             dict: Execution result with trade details
         """
         try:
-            signal_type = self._get_signal_type(alert)
-            symbol = self._get_symbol(alert)
-            direction = self._get_direction(alert)
+            fields = self._normalize(alert)
+            signal_type = fields["signal_type"]
+            symbol = fields["symbol"]
+            direction = fields["direction"]
             
             self.logger.info(
-                f"[V3 Entry] Signal: {signal_type} | "
-                f"Symbol: {symbol} | Direction: {direction}"
+                "[V3 Entry] Signal: %s | Symbol: %s | Direction: %s",
+                signal_type, symbol, direction
             )
             
             # Step 1: Validate consensus score threshold
-            if not self._validate_score_thresholds(alert):
+            if not self._validate_score_thresholds(fields):
                 return {
                     "status": "rejected",
                     "reason": "low_consensus_score",
@@ -1018,35 +1116,50 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
             
             # Step 2: Extract all alert data (including Pine Script SL/TP)
             alert_data = self._extract_alert_data(alert)
-            self.logger.debug(f"[V3 Entry] Extracted alert data: {alert_data}")
+            self.logger.debug("[V3 Entry] Extracted alert data: %s", alert_data)
             
-            if self._is_aggressive_reversal_signal(alert):
-                reversal_result = await self._handle_aggressive_reversal(alert)
-                self.logger.info(f"Reversal result: {reversal_result.get('status')}")
+            aggressive_reversal = self._is_aggressive_reversal_signal(fields)
             
-            logic_route = self._route_to_logic(alert)
+            logic_route = self._route_to_logic(fields)
             logic_multiplier = self._get_logic_multiplier(logic_route)
             
             self.logger.debug(
-                f"[V3 Routing] Signal: {signal_type} | "
-                f"Route: {logic_route} | Multiplier: {logic_multiplier}"
+                "[V3 Routing] Signal: %s | Route: %s | Multiplier: %s",
+                signal_type, logic_route, logic_multiplier
             )
             
             if self.shadow_mode:
-                return await self._process_shadow_entry(alert, logic_route, logic_multiplier)
+                if aggressive_reversal:
+                    reversal_result = await self._handle_aggressive_reversal(fields)
+                    self.logger.info("Reversal result: %s", reversal_result.get('status'))
+                return await self._process_shadow_entry(fields, logic_route, logic_multiplier)
             
-            result = await self.order_manager.place_v3_dual_orders(
+            place_orders = self._place_dual(
                 alert=alert,
                 logic_route=logic_route,
                 logic_multiplier=logic_multiplier
             )
+            if not aggressive_reversal:
+                return await place_orders
             
-            return result
+            # The reversal only closes the opposite direction, so it can run
+            # alongside the new orders instead of ahead of them
+            outcomes = await asyncio.gather(
+                place_orders, self._handle_aggressive_reversal(fields), return_exceptions=True
+            )
+            order_result = cast(Union[Dict[str, Any], BaseException], outcomes[0])
+            close_result = cast(Union[Dict[str, Any], BaseException], outcomes[1])
+            if isinstance(close_result, BaseException):
+                self.logger.error("Reversal close error: %s", close_result)
+            else:
+                self.logger.info("Reversal result: %s", close_result.get('status'))
+            if isinstance(order_result, BaseException):
+                raise order_result
+            
+            return order_result
             
         except Exception as e:
-            self.logger.error(f"[V3 Entry Error] {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception("[V3 Entry Error] %s", e)
             return {"status": "error", "message": str(e)}
     
     async def process_exit_signal(self, alert) -> Dict[str, Any]:
@@ -1064,20 +1177,21 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
             dict: Exit execution result
         """
         try:
-            signal_type = self._get_signal_type(alert)
-            symbol = self._get_symbol(alert)
+            fields = self._normalize(alert)
+            signal_type = fields["signal_type"]
+            symbol = fields["symbol"]
             
-            self.logger.info(f"[V3 Exit] Signal: {signal_type} | Symbol: {symbol}")
+            self.logger.info("[V3 Exit] Signal: %s | Symbol: %s", signal_type, symbol)
             
             if self.shadow_mode:
-                return await self._process_shadow_exit(alert)
+                return await self._process_shadow_exit(fields)
             
-            result = await self.signal_handlers.handle_exit_signal(alert)
+            result = await self._handle_exit(alert)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"[V3 Exit Error] {e}")
+            self.logger.exception("[V3 Exit Error] %s", e)
             return {"status": "error", "message": str(e)}
     
     async def process_reversal_signal(self, alert) -> Dict[str, Any]:
@@ -1097,20 +1211,21 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
             dict: Reversal execution result
         """
         try:
-            signal_type = self._get_signal_type(alert)
-            symbol = self._get_symbol(alert)
+            fields = self._normalize(alert)
+            signal_type = fields["signal_type"]
+            symbol = fields["symbol"]
             
-            self.logger.info(f"[V3 Reversal] Signal: {signal_type} | Symbol: {symbol}")
+            self.logger.info("[V3 Reversal] Signal: %s | Symbol: %s", signal_type, symbol)
             
             if self.shadow_mode:
-                return await self._process_shadow_reversal(alert)
+                return await self._process_shadow_reversal(fields)
             
-            result = await self.signal_handlers.handle_reversal_signal(alert)
+            result = await self._handle_reversal(alert)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"[V3 Reversal Error] {e}")
+            self.logger.exception("[V3 Reversal Error] %s", e)
             return {"status": "error", "message": str(e)}
     
     async def on_signal_received(self, signal_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -1128,10 +1243,10 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         signal_type = signal_data.get("signal_type", "")
         alert_type = signal_data.get("type", "")
         
-        if alert_type not in ["entry_v3", "exit_v3", "squeeze_v3", "trend_pulse_v3"]:
+        if alert_type not in self._V3_ALERT_TYPES:
             return signal_data
         
-        self.logger.debug(f"[V3 Hook] Signal received: {signal_type}")
+        self.logger.debug("[V3 Hook] Signal received: %s", signal_type)
         
         return signal_data
     
@@ -1152,26 +1267,24 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         signal_type = self._get_signal_type(alert)
         tf = self._get_timeframe(alert)
         
-        overrides = self.plugin_config.get("signal_routing", {}).get("signal_overrides", {})
+        overrides = self._signal_overrides
         if signal_type in overrides:
             route = overrides[signal_type]
-            self.logger.debug(f"Signal override: {signal_type} -> {route}")
+            self.logger.debug("Signal override: %s -> %s", signal_type, route)
             return route
         
-        if signal_type in ["Screener_Full_Bullish", "Screener_Full_Bearish"]:
-            return "combinedlogic-3"
-        
-        if signal_type == "Golden_Pocket_Flip" and tf in ["60", "240"]:
-            return "combinedlogic-3"
+        route = _FORCED_SIGNAL_ROUTES.get(signal_type) or _FORCED_SIGNAL_TF_ROUTES.get((signal_type, tf))
+        if route:
+            return route
         
-        tf_routing = self.plugin_config.get("signal_routing", {}).get("timeframe_routing", {})
+        tf_routing = self._tf_routing
         if tf in tf_routing:
             route = tf_routing[tf]
-            self.logger.debug(f"TF routing: {tf}m -> {route}")
+            self.logger.debug("TF routing: %sm -> %s", tf, route)
             return route
         
-        default = self.plugin_config.get("signal_routing", {}).get("default_logic", "combinedlogic-2")
-        self.logger.debug(f"Default routing -> {default}")
+        default = self._default_logic
+        self.logger.debug("Default routing -> %s", default)
         return default
     
     def _get_logic_multiplier(self, logic_route: str) -> float:
@@ -1184,8 +1297,7 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         Returns:
             float: Lot multiplier (1.25, 1.0, or 0.625)
         """
-        multipliers = self.plugin_config.get("logic_multipliers", {})
-        return multipliers.get(logic_route, 1.0)
+        return self._logic_multipliers.get(logic_route, 1.0)
     
     def _is_aggressive_reversal_signal(self, alert) -> bool:
         """
@@ -1200,14 +1312,7 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         signal_type = self._get_signal_type(alert)
         consensus_score = self._get_consensus_score(alert)
         
-        aggressive_signals = self.plugin_config.get("aggressive_reversal_signals", [
-            "Liquidity_Trap_Reversal",
-            "Golden_Pocket_Flip",
-            "Screener_Full_Bullish",
-            "Screener_Full_Bearish"
-        ])
-        
-        return signal_type in aggressive_signals or consensus_score >= 7
+        return signal_type in self._aggressive_signals_set or consensus_score >= 7
     
     async def _handle_aggressive_reversal(self, alert) -> Dict[str, Any]:
         """
@@ -1220,12 +1325,10 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
             dict: Reversal result
         """
         symbol = self._get_symbol(alert)
-        direction = self._get_direction(alert)
-        
-        close_direction = "SELL" if direction == "buy" else "BUY"
+        _, close_direction = _DIR_MAP.get(self._get_direction(alert), _DEFAULT_DIRS)
         
         self.logger.info(
-            f"[V3 Aggressive Reversal] Closing {close_direction} positions on {symbol}"
+            "[V3 Aggressive Reversal] Closing %s positions on %s", close_direction, symbol
         )
         
         try:
@@ -1256,8 +1359,8 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         direction = self._get_direction(alert)
         
         self.logger.info(
-            f"[V3 SHADOW] Entry: {signal_type} | {symbol} {direction} | "
-            f"Route: {logic_route} | Mult: {logic_multiplier}"
+            "[V3 SHADOW] Entry: %s | %s %s | Route: %s | Mult: %s",
+            signal_type, symbol, direction, logic_route, logic_multiplier
         )
         
         return {
@@ -1276,7 +1379,7 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         signal_type = self._get_signal_type(alert)
         symbol = self._get_symbol(alert)
         
-        self.logger.info(f"[V3 SHADOW] Exit: {signal_type} | {symbol}")
+        self.logger.info("[V3 SHADOW] Exit: %s | %s", signal_type, symbol)
         
         return {
             "status": "shadow",
@@ -1291,7 +1394,7 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         signal_type = self._get_signal_type(alert)
         symbol = self._get_symbol(alert)
         
-        self.logger.info(f"[V3 SHADOW] Reversal: {signal_type} | {symbol}")
+        self.logger.info("[V3 SHADOW] Reversal: %s | %s", signal_type, symbol)
         
         return {
             "status": "shadow",
@@ -1301,45 +1404,26 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
             "message": "Shadow mode - no real reversals"
         }
     
-    def _get_signal_type(self, alert) -> str:
-        """Extract signal_type from alert"""
-        if hasattr(alert, 'signal_type'):
-            return alert.signal_type
-        if isinstance(alert, dict):
-            return alert.get('signal_type', '')
-        return ''
-    
-    def _get_symbol(self, alert) -> str:
-        """Extract symbol from alert"""
-        if hasattr(alert, 'symbol'):
-            return alert.symbol
-        if isinstance(alert, dict):
-            return alert.get('symbol', '')
-        return ''
-    
-    def _get_direction(self, alert) -> str:
-        """Extract direction from alert"""
-        if hasattr(alert, 'direction'):
-            return alert.direction
-        if isinstance(alert, dict):
-            return alert.get('direction', '')
-        return ''
-    
-    def _get_timeframe(self, alert) -> str:
-        """Extract timeframe from alert"""
-        if hasattr(alert, 'tf'):
-            return str(alert.tf)
-        if isinstance(alert, dict):
-            return str(alert.get('tf', ''))
-        return ''
+    _get_signal_type = _alert_field('signal_type', '')
+    _get_symbol = _alert_field('symbol', '')
+    _get_direction = _alert_field('direction', '')
+    _get_timeframe = _alert_field('tf', '', str)
+    _get_consensus_score = _alert_field('consensus_score', 0)
     
-    def _get_consensus_score(self, alert) -> int:
-        """Extract consensus_score from alert"""
-        if hasattr(alert, 'consensus_score'):
-            return alert.consensus_score
-        if isinstance(alert, dict):
-            return alert.get('consensus_score', 0)
-        return 0
+    def _normalize(self, alert) -> Dict[str, Any]:
+        """
+        Read the routing fields of an alert into a plain dict, once per signal.
+        
+        The result is itself a valid alert for the _get_* helpers, so it can
+        be handed to the routing, score and shadow helpers in place of the alert.
+        """
+        return {
+            "signal_type": self._get_signal_type(alert),
+            "symbol": self._get_symbol(alert),
+            "direction": self._get_direction(alert),
+            "tf": self._get_timeframe(alert),
+            "consensus_score": self._get_consensus_score(alert),
+        }
     
     def _validate_score_thresholds(self, alert) -> bool:
         """
@@ -1368,10 +1452,10 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         if "Institutional_Launchpad" in signal_type and direction == "buy":
             if score < 7:
                 self.logger.warning(
-                    f"[V3 Score Filter] Launchpad BUY REJECTED: score {score} < 7"
+                    "[V3 Score Filter] Launchpad BUY REJECTED: score %s < 7", score
                 )
                 return False
-            self.logger.info(f"[V3 Score Filter] Launchpad BUY ACCEPTED: score {score} >= 7")
+            self.logger.info("[V3 Score Filter] Launchpad BUY ACCEPTED: score %s >= 7", score)
             return True
         
         # Global minimum threshold
@@ -1379,11 +1463,11 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         
         if score < min_score:
             self.logger.warning(
-                f"[V3 Score Filter] Signal REJECTED: consensus_score {score} < min {min_score}"
+                "[V3 Score Filter] Signal REJECTED: consensus_score %s < min %s", score, min_score
             )
             return False
         
-        self.logger.debug(f"[V3 Score Filter] Score {score} >= min {min_score} - ACCEPTED")
+        self.logger.debug("[V3 Score Filter] Score %s >= min %s - ACCEPTED", score, min_score)
         return True
     
     def _extract_alert_data(self, alert) -> Dict[str, Any]:
@@ -1474,11 +1558,8 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
     def get_status(self) -> Dict[str, Any]:
         """Get plugin status"""
         base_status = super().get_status()
-        base_status.update({
-            "shadow_mode": self.shadow_mode,
-            "supported_signals": self.metadata.get("supported_signals", []),
-            "logic_multipliers": self.plugin_config.get("logic_multipliers", {})
-        })
+        base_status["shadow_mode"] = self.shadow_mode
+        base_status.update(self._status_suffix)
         return base_status
 
     # ========== ISignalProcessor Interface Implementation ==========
@@ -1536,18 +1617,10 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         Returns:
             bool: True if this plugin can handle the signal
         """
-        strategy = signal_data.get('strategy', '')
-        alert_type = signal_data.get('type', '')
-        
-        # Check if strategy matches
-        if strategy in self.get_supported_strategies():
-            return True
-        
-        # Check if alert type is V3
-        if 'v3' in alert_type.lower():
-            return True
-        
-        return False
+        return (
+            signal_data.get('strategy', '') in self._SUPPORTED_STRATEGIES
+            or signal_data.get('type', '') in self._V3_ALERT_TYPES
+        )
     
     async def process_signal(self, signal_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -1562,11 +1635,17 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         """
         alert_type = signal_data.get('type', '')
         
-        if 'entry' in alert_type.lower():
+        handler = self._signal_dispatch.get(alert_type)
+        if handler is not None:
+            return await handler(signal_data)
+        
+        # Other alert types: match by name
+        alert_type = alert_type.lower()
+        if 'entry' in alert_type:
             return await self.process_entry_signal(signal_data)
-        elif 'exit' in alert_type.lower():
+        elif 'exit' in alert_type:
             return await self.process_exit_signal(signal_data)
-        elif 'reversal' in alert_type.lower():
+        elif 'reversal' in alert_type:
             return await self.process_reversal_signal(signal_data)
         else:
             # Default to entry processing
@@ -1588,7 +1667,7 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         try:
             return await self.order_manager.execute_order(order_data)
         except Exception as e:
-            self.logger.error(f"Order execution failed: {e}")
+            self.logger.exception("Order execution failed: %s", e)
             return {"status": "error", "message": str(e)}
     
     async def modify_order(self, order_id: str, modifications: Dict[str, Any]) -> bool:
@@ -1605,7 +1684,7 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         try:
             return await self.order_manager.modify_order(order_id, modifications)
         except Exception as e:
-            self.logger.error(f"Order modification failed: {e}")
+            self.logger.exception("Order modification failed: %s", e)
             return False
     
     async def close_order(self, order_id: str, reason: str) -> bool:
@@ -1622,7 +1701,7 @@ class V3CombinedPlugin(BaseLogicPlugin, ISignalProcessor, IOrderExecutor, IReent
         try:
             return await self.order_manager.close_order(order_id, reason)
         except Exception as e:
-            self.logger.error(f"Order close failed: {e}")
+            self.logger.exception("Order close failed: %s", e)
             return False
     
     # =========================================================================
@@ -39,12 +39,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger("Main")
 
-running_event = threading.Event()
-running_event.set()
+shutdown_event = threading.Event()
 
 def handle_exit(signum, frame):
     print("\nShutdown signal received...")
-    running_event.clear()
+    shutdown_event.set()
 
 signal.signal(signal.SIGINT, handle_exit)
 signal.signal(signal.SIGTERM, handle_exit)
@@ -158,9 +157,14 @@ def main():
         
         logger.info("✅ BOT STARTUP COMPLETE. Waiting for commands.")
         
-        # 11. Main Loop
-        while running_event.is_set():
-            time.sleep(1)
+        # 11. Main Loop - idle until handle_exit sets shutdown_event.
+        # Ctrl+C cannot interrupt a blocking wait on Windows, so wake once a second there.
+        wait_timeout = 1.0 if os.name == "nt" else None
+        while not shutdown_event.wait(wait_timeout):
+            pass
+        
+        # 12. Send whatever notifications are still queued before exiting
+        loop.run_until_complete(trading_engine.shutdown())
             
     except Exception as e:
         logger.critical(f"🔥 FATAL ERROR DURING STARTUP: {e}", exc_info=True)
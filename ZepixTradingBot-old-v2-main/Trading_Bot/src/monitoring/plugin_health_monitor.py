@@ -707,7 +707,7 @@ class PluginHealthMonitor:
                         logger.warning(f"[PluginHealthMonitor] Shutdown error for {plugin_id}: {e}")
                 
                 # Remove from registry
-                del self.plugin_registry.plugins[plugin_id]
+                self.plugin_registry.unregister_plugin(plugin_id)
             
             # Reload plugin
             success = self.plugin_registry.load_plugin(plugin_id)
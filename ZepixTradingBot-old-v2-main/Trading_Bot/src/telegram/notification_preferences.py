@@ -12,6 +12,7 @@ Date: 2026-01-19
 Part of Telegram V5 Upgrade - Batch 1
 """
 
+import copy
 import json
 import logging
 from datetime import datetime, time
@@ -133,12 +134,12 @@ class NotificationPreferences:
                     self._preferences = json.load(f)
                 self._logger.info(f"[NotifPrefs] Loaded preferences from {self._config_path}")
             else:
-                self._preferences = self.DEFAULT_PREFERENCES.copy()
+                self._preferences = copy.deepcopy(self.DEFAULT_PREFERENCES)
                 self._save_preferences()
                 self._logger.info("[NotifPrefs] Created default preferences")
         except Exception as e:
             self._logger.error(f"[NotifPrefs] Error loading preferences: {e}")
-            self._preferences = self.DEFAULT_PREFERENCES.copy()
+            self._preferences = copy.deepcopy(self.DEFAULT_PREFERENCES)
     
     def _save_preferences(self):
         """Save preferences to file"""
@@ -358,7 +359,7 @@ class NotificationPreferences:
     
     def reset_to_defaults(self):
         """Reset all preferences to defaults"""
-        self._preferences = self.DEFAULT_PREFERENCES.copy()
+        self._preferences = copy.deepcopy(self.DEFAULT_PREFERENCES)
         self._save_preferences()
         self._logger.info("[NotifPrefs] Reset to defaults")
     
@@ -10,15 +10,70 @@ Version: 1.0.0
 Date: 2026-01-14
 """
 
+import asyncio
+import functools
+import inspect
+import io
 import threading
 import logging
+import time
+from collections import ChainMap
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable, List, Set
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, FrozenSet, List, Mapping, Set, Tuple, Final
 from enum import Enum
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Static message fragments shared by the formatters
+_SEP24: Final[str] = "=" * 24
+_V6_SIGNAL_TMPL: Final[str] = (
+    " <b>V6 SIGNAL</b> | %(tfb)s\n" + _SEP24 + "\n\n"
+    "<b>Symbol:</b> %(symbol)s\n"
+    "<b>Direction:</b> %(demoji)s %(direction)s\n"
+    "<b>Timeframe:</b> %(tfb)s\n"
+    "<b>Pattern:</b> %(pattern)s\n"
+    "%(opt)s"
+    "<b>Time:</b> %(t)s"
+)
+_OPT_FIELDS: Final[Tuple[Tuple[str, str], ...]] = (("entry", "Entry"), ("sl", "SL"), ("tp", "TP"))
+_OPT_LINE_TMPL: Final[str] = "<b>%s:</b> %s\n"
+
+@functools.lru_cache(maxsize=16)
+def _tf_badge(tf: str) -> str:
+    """Return the display badge for a V6 timeframe (e.g. "15m" -> "15M")"""
+    if not tf:
+        return ""
+    return {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}.get(tf.lower(), tf.upper())
+
+
+# Emoji lookup tables: _DIR_EMOJI is (sell, buy), _PNL_EMOJI is (loss, profit)
+_BUY_DIRECTIONS: Final[FrozenSet[str]] = frozenset({"BUY", "buy", "Buy"})
+_DIR_EMOJI: Final[Tuple[str, str]] = ("", "")
+_PNL_EMOJI: Final[Tuple[str, str]] = ("", "")
+
+# Field defaults for the V6 formatters, layered under the payload with ChainMap
+_SIGNAL_DEFAULTS: Final[Dict[str, Any]] = {
+    "timeframe": "N/A", "symbol": "N/A", "direction": "N/A", "pattern": "N/A",
+    "entry": None, "sl": None, "tp": None,
+}
+_V6_SUMMARY_DEFAULTS: Final[Dict[str, Any]] = {"total_trades": 0, "total_pnl": 0, "total_win_rate": 0}
+_V6_TF_STATS_DEFAULTS: Final[Dict[str, Any]] = {"trades": 0, "pnl": 0, "win_rate": 0}
+
+# Cached "HH:MM:SS" stamp shared by the formatters, refreshed once per second
+_TIME_CACHE: Dict[str, Any] = {"t": 0, "s": ""}
+
+
+def _hms() -> str:
+    """Return the current local time as HH:MM:SS, re-formatted at most once per second"""
+    now = int(time.time())
+    if now != _TIME_CACHE["t"]:
+        _TIME_CACHE["s"] = time.strftime('%H:%M:%S', time.localtime(now))
+        _TIME_CACHE["t"] = now
+    stamp: str = _TIME_CACHE["s"]
+    return stamp
+
 
 class NotificationPriority(Enum):
     """Notification priority levels"""
@@ -338,7 +393,7 @@ class NotificationRouter:
         self.voice_mute = False
         
         # Statistics
-        self.stats = {
+        self.stats: Dict[str, Any] = {
             "total_sent": 0,
             "by_type": {},
             "by_priority": {},
@@ -350,8 +405,9 @@ class NotificationRouter:
         
         self._lock = threading.Lock()
         
-        # Custom formatters
-        self.formatters: Dict[NotificationType, Callable] = {}
+        # Custom formatters (read-only mapping once frozen)
+        self.formatters: Mapping[NotificationType, Callable] = {}
+        self._formatters_frozen = False
     
     def register_formatter(self, notification_type: NotificationType, formatter: Callable):
         """
@@ -361,7 +417,34 @@ class NotificationRouter:
             notification_type: Type of notification
             formatter: Function that takes data dict and returns formatted message
         """
-        self.formatters[notification_type] = formatter
+        self._check_formatters_mutable()
+        self.formatters[notification_type] = formatter  # type: ignore[index]
+    
+    def register_formatters(self, formatters: Dict[NotificationType, Callable]):
+        """
+        Register several formatters in one call.
+        
+        Args:
+            formatters: Mapping of notification type to formatter function
+        """
+        self._check_formatters_mutable()
+        self.formatters.update(formatters)  # type: ignore[attr-defined]
+    
+    def freeze_formatters(self):
+        """
+        Make the formatter mapping read-only.
+        
+        Formatters are registered at startup; freezing swaps the dict for a
+        MappingProxyType so dispatch reads a mapping that never changes.
+        """
+        if not self._formatters_frozen:
+            self.formatters = MappingProxyType(dict(self.formatters))
+            self._formatters_frozen = True
+    
+    def _check_formatters_mutable(self):
+        """Raise if formatters were frozen"""
+        if self._formatters_frozen:
+            raise RuntimeError("Formatters are frozen; register them before freeze_formatters()")
     
     def set_routing_rule(
         self,
@@ -477,14 +560,6 @@ class NotificationRouter:
             logger.debug(f"Notification muted: {notification_type.value}")
             return False
         
-        # Format message if formatter exists
-        formatted_message = message
-        if notification_type in self.formatters:
-            try:
-                formatted_message = self.formatters[notification_type](data)
-            except Exception as e:
-                logger.error(f"Formatter error for {notification_type.value}: {e}")
-        
         # Determine target
         target = rule["target"]
         
@@ -492,12 +567,23 @@ class NotificationRouter:
         if actual_priority == NotificationPriority.CRITICAL:
             target = TargetBot.ALL
         
+        voice_enabled = voice_override if voice_override is not None else rule.get("voice", False)
+        send_voice = bool(voice_enabled and not self.voice_mute and self.voice_callback)
+        
+        # Format message if formatter exists and someone will receive it
+        formatted_message = message
+        formatter = self.formatters.get(notification_type)
+        if formatter is not None and (send_voice or self._has_destination(target)):
+            try:
+                formatted_message = formatter(data)
+            except Exception as e:
+                logger.error(f"Formatter error for {notification_type.value}: {e}")
+        
         # Send to target(s)
         success = self._send_to_target(target, formatted_message, actual_priority)
         
         # Trigger voice alert if enabled
-        voice_enabled = voice_override if voice_override is not None else rule.get("voice", False)
-        if voice_enabled and not self.voice_mute and self.voice_callback:
+        if send_voice:
             try:
                 self.voice_callback(formatted_message, actual_priority)
                 self.stats["voice_alerts_sent"] += 1
@@ -509,6 +595,18 @@ class NotificationRouter:
         
         return success
     
+    def _has_destination(self, target: TargetBot) -> bool:
+        """Check whether any callback is configured for the target"""
+        if target == TargetBot.ALL:
+            return bool(self.controller_callback or self.notification_callback or self.analytics_callback)
+        if target == TargetBot.CONTROLLER:
+            return self.controller_callback is not None
+        if target == TargetBot.NOTIFICATION:
+            return self.notification_callback is not None
+        if target == TargetBot.ANALYTICS:
+            return self.analytics_callback is not None
+        return False
+    
     def _send_to_target(self, target: TargetBot, message: str, priority: NotificationPriority) -> bool:
         """Send message to target bot(s)"""
         success = False
@@ -593,1020 +691,1288 @@ class NotificationRouter:
         return [t.value for t in self.muted_types]
 
 
-class NotificationFormatter:
+class BatchedDispatcher:
     """
-    Provides standard formatters for different notification types.
+    Wraps a bot send callback so messages are queued and delivered in batches.
+    
+    When called from a thread with a running asyncio loop, the first message
+    starts a background flusher on that loop. The flusher drains up to
+    max_batch messages (waiting at most max_delay seconds for the batch to
+    fill) and delivers them together with asyncio.gather. Without a running
+    loop the message is sent directly, so the wrapper is safe to use from
+    synchronous code.
     """
     
-    @staticmethod
-    def format_entry(data: Dict) -> str:
-        """Format entry notification"""
-        plugin_name = data.get("plugin_name", "Unknown")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        entry_price = data.get("entry_price", 0)
-        
-        message = (
-            f"<b>ENTRY ALERT</b> | {plugin_name}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Entry Price:</b> {entry_price}\n"
-        )
-        
-        if data.get("order_a_lot"):
-            message += (
-                f"\n<b>Order A:</b> {data.get('order_a_lot')} lots\n"
-                f"  SL: {data.get('order_a_sl', 'N/A')}\n"
-                f"  TP: {data.get('order_a_tp', 'N/A')}\n"
-            )
-        
-        if data.get("order_b_lot"):
-            message += (
-                f"\n<b>Order B:</b> {data.get('order_b_lot')} lots\n"
-                f"  SL: {data.get('order_b_sl', 'N/A')}\n"
-                f"  TP: {data.get('order_b_tp', 'N/A')}\n"
-            )
-        
-        message += f"\n<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
-    
-    @staticmethod
-    def format_exit(data: Dict) -> str:
-        """Format exit notification"""
-        plugin_name = data.get("plugin_name", "Unknown")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        profit = data.get("profit", 0)
-        
-        emoji = "" if profit >= 0 else ""
-        
-        message = (
-            f"{emoji} <b>EXIT ALERT</b> | {plugin_name}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction} -> CLOSED\n\n"
-            f"<b>Entry:</b> {data.get('entry_price', 'N/A')}\n"
-            f"<b>Exit:</b> {data.get('exit_price', 'N/A')}\n"
-            f"<b>Hold Time:</b> {data.get('hold_time', 'N/A')}\n\n"
-            f"<b>P&L:</b> ${profit:+.2f}\n"
-            f"<b>Reason:</b> {data.get('reason', 'N/A')}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
-    @staticmethod
-    def format_tp_hit(data: Dict) -> str:
-        """Format TP_HIT notification"""
-        symbol = data.get("symbol", "UNKNOWN")
-        profit = data.get("profit", 0.0)
-        tp_level = data.get("tp_level", 1)
-        entry_price = data.get("entry_price", 0.0)
-        exit_price = data.get("exit_price", 0.0)
-        
-        return (
-            f"<b>TAKE PROFIT HIT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"  Symbol: {symbol}\n"
-            f"  TP Level: {tp_level}\n"
-            f"  Entry: {entry_price}\n"
-            f"  Exit: {exit_price}\n"
-            f"  Profit: ${profit:.2f}\n"
-        )
+    # Queued by close() to stop the flusher once everything before it is sent
+    _STOP = object()
     
-    @staticmethod
-    def format_sl_hit(data: Dict) -> str:
-        """Format SL_HIT notification"""
-        symbol = data.get("symbol", "UNKNOWN")
-        loss = data.get("loss", 0.0)
-        entry_price = data.get("entry_price", 0.0)
-        exit_price = data.get("exit_price", 0.0)
-        
-        return (
-            f"<b>STOP LOSS HIT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"  Symbol: {symbol}\n"
-            f"  Entry: {entry_price}\n"
-            f"  Exit: {exit_price}\n"
-            f"  Loss: ${abs(loss):.2f}\n"
-        )
-    
-    @staticmethod
-    def format_daily_summary(data: Dict) -> str:
-        """Format daily summary notification"""
-        date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
-        total_trades = data.get("total_trades", 0)
-        winners = data.get("winners", 0)
-        losers = data.get("losers", 0)
-        win_rate = data.get("win_rate", 0)
-        net_pnl = data.get("net_pnl", 0)
-        
-        emoji = "" if net_pnl >= 0 else ""
+    def __init__(
+        self,
+        send_callback: Callable,
+        max_batch: int = 32,
+        max_delay: float = 0.02,
+        max_queue: int = 1000
+    ):
+        """
+        Initialize BatchedDispatcher.
         
-        message = (
-            f"<b>DAILY SUMMARY</b> | {date}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Performance:</b>\n"
-            f"  Total Trades: {total_trades}\n"
-            f"  Winners: {winners} ({win_rate:.1f}%)\n"
-            f"  Losers: {losers}\n\n"
-            f"<b>P&L:</b>\n"
-            f"  Gross Profit: +${data.get('gross_profit', 0):.2f}\n"
-            f"  Gross Loss: -${data.get('gross_loss', 0):.2f}\n"
-            f"  {emoji} Net P&L: ${net_pnl:+.2f}"
-        )
+        Args:
+            send_callback: Sync or async function that sends one message
+            max_batch: Maximum messages delivered per flush
+            max_delay: Seconds to wait for a batch to fill after the first message
+            max_queue: Maximum queued messages before new ones are rejected
+        """
+        self.send_callback = send_callback
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_queue = max_queue
         
-        return message
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
     
-    @staticmethod
-    def format_emergency(data: Dict) -> str:
-        """Format emergency notification"""
-        reason = data.get("reason", "Unknown")
-        details = data.get("details", "No details available")
-        
-        message = (
-            f"<b>EMERGENCY ALERT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Details:</b> {details}\n\n"
-            f"<b>Action Required:</b> Immediate attention needed\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
-    @staticmethod
-    def format_error(data: Dict) -> str:
-        """Format error notification"""
-        error_type = data.get("error_type", "Unknown")
-        severity = data.get("severity", "MEDIUM")
-        details = data.get("details", "No details available")
-        
-        severity_emoji = "" if severity == "HIGH" else ("" if severity == "MEDIUM" else "")
-        
-        message = (
-            f"<b>ERROR ALERT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Error Type:</b> {error_type}\n"
-            f"<b>Severity:</b> {severity_emoji} {severity}\n"
-            f"<b>Details:</b> {details}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
-    # ========================================
-    # V6 Price Action Formatters (NEW - Telegram V5 Upgrade)
-    # ========================================
-    
-    @staticmethod
-    def format_v6_entry(data: Dict) -> str:
-        """Format V6 Price Action entry notification with timeframe badge"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        entry_price = data.get("entry_price", 0)
-        
-        # Timeframe-specific badges
-        tf_badges = {
-            "15m": "15M",
-            "30m": "30M",
-            "1h": "1H",
-            "4h": "4H",
-        }
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper())
-        
-        direction_emoji = "" if direction.upper() == "BUY" else ""
-        
-        message = (
-            f"{direction_emoji} <b>V6 ENTRY</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Entry Price:</b> {entry_price}\n"
-            f"<b>Timeframe:</b> {tf_badge}\n"
-        )
-        
-        if data.get("sl"):
-            message += f"<b>Stop Loss:</b> {data.get('sl')}\n"
-        if data.get("tp"):
-            message += f"<b>Take Profit:</b> {data.get('tp')}\n"
-        if data.get("lot_size"):
-            message += f"<b>Lot Size:</b> {data.get('lot_size')}\n"
-        if data.get("pattern"):
-            message += f"<b>Pattern:</b> {data.get('pattern')}\n"
-        
-        message += f"\n<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
-    
-    @staticmethod
-    def format_v6_exit(data: Dict) -> str:
-        """Format V6 Price Action exit notification"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        profit = data.get("pnl", data.get("profit", 0))
-        exit_reason = data.get("exit_reason", "N/A")
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else "V6"
-        
-        result_emoji = "" if profit >= 0 else ""
-        
-        message = (
-            f"{result_emoji} <b>V6 EXIT</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction} -> CLOSED\n\n"
-            f"<b>Entry:</b> {data.get('entry_price', 'N/A')}\n"
-            f"<b>Exit:</b> {data.get('exit_price', 'N/A')}\n"
-            f"<b>Hold Time:</b> {data.get('duration', data.get('hold_time', 'N/A'))}\n\n"
-            f"<b>P&L:</b> ${profit:+.2f}"
-        )
-        
-        if data.get("pips"):
-            message += f" ({data.get('pips'):+.1f} pips)"
+    def __call__(self, message: str) -> Optional[bool]:
+        """
+        Queue a message for batched delivery.
         
+        Returns:
+            True if queued, None if the queue is full, otherwise the result
+            of sending directly (no running loop)
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        
+        leftover: List[str] = []
+        if self._task is not None and (self._task.done() or self._loop.is_closed()):
+            # The flusher's loop has ended (e.g. asyncio.run returned) or the
+            # flusher died; anything it left queued goes to the next flusher
+            while not self._queue.empty():
+                leftover.append(self._queue.get_nowait())
+            self._task = None
+        
+        if self._task is None:
+            if running is None:
+                result: Optional[bool] = self.send_callback(message)
+                return result
+            self._start(running)
+            for pending in leftover:
+                self._queue.put_nowait(pending)
+        
+        if self._queue.qsize() >= self.max_queue:
+            logger.warning("Batched dispatch queue full, dropping message")
+            return None
+        
+        if running is self._loop:
+            self._queue.put_nowait(message)
+        else:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, message)
+        return True
+    
+    def _start(self, loop: asyncio.AbstractEventLoop):
+        """Create the queue and flusher task on the given loop"""
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._task = loop.create_task(self._flusher())
+    
+    async def _flusher(self):
+        """Drain the queue in batches until the stop sentinel is reached"""
+        stopping = False
+        while not stopping:
+            message = await self._queue.get()
+            if message is self._STOP:
+                break
+            batch = [message]
+            try:
+                deadline = self._loop.time() + self.max_delay
+                while len(batch) < self.max_batch:
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        message = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if message is self._STOP:
+                        stopping = True
+                        break
+                    batch.append(message)
+            finally:
+                # Deliver what was collected even if the task is cancelled
+                await self._deliver(batch)
+    
+    async def _deliver(self, batch: List[str]):
+        """Send one batch, awaiting async sends concurrently"""
+        pending = []
+        for message in batch:
+            try:
+                result = self.send_callback(message)
+            except Exception as e:
+                logger.error(f"Batched send error: {e}")
+                continue
+            if inspect.isawaitable(result):
+                pending.append(result)
+        
+        if pending:
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Batched send error: {result}")
+    
+    async def flush(self):
+        """Deliver everything currently queued"""
+        if self._queue is None:
+            return
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._deliver(batch)
+    
+    async def close(self):
+        """Stop the flusher after delivering queued messages"""
+        if self._task is None:
+            return
+        self._queue.put_nowait(self._STOP)
+        await self._task
+        self._task = None
+        await self.flush()
+
+
+def format_entry(data: Dict[str, Any]) -> str:
+    """Format entry notification"""
+    plugin_name = data.get("plugin_name", "Unknown")
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    entry_price = data.get("entry_price", 0)
+
+    message = (
+        f"<b>ENTRY ALERT</b> | {plugin_name}\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Direction:</b> {direction}\n"
+        f"<b>Entry Price:</b> {entry_price}\n"
+    )
+
+    if data.get("order_a_lot"):
         message += (
-            f"\n<b>Reason:</b> {exit_reason}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
-    
-    @staticmethod
-    def format_v6_tp_hit(data: Dict) -> str:
-        """Format V6 take profit hit notification"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        profit = data.get("pnl", data.get("profit", 0))
-        tp_level = data.get("tp_level", 1)
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else "V6"
-        
-        message = (
-            f" <b>V6 TP{tp_level} HIT</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>TP Level:</b> {tp_level}\n"
-            f"<b>Profit:</b> ${profit:+.2f}\n"
+            f"\n<b>Order A:</b> {data.get('order_a_lot')} lots\n"
+            f"  SL: {data.get('order_a_sl', 'N/A')}\n"
+            f"  TP: {data.get('order_a_tp', 'N/A')}\n"
         )
-        
-        if data.get("pips"):
-            message += f"<b>Pips:</b> {data.get('pips'):+.1f}\n"
-        
-        message += f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
-    
-    @staticmethod
-    def format_v6_sl_hit(data: Dict) -> str:
-        """Format V6 stop loss hit notification"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        loss = data.get("pnl", data.get("loss", 0))
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else "V6"
-        
-        message = (
-            f" <b>V6 SL HIT</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Loss:</b> ${loss:.2f}\n"
+
+    if data.get("order_b_lot"):
+        message += (
+            f"\n<b>Order B:</b> {data.get('order_b_lot')} lots\n"
+            f"  SL: {data.get('order_b_sl', 'N/A')}\n"
+            f"  TP: {data.get('order_b_tp', 'N/A')}\n"
         )
-        
-        if data.get("pips"):
-            message += f"<b>Pips:</b> {data.get('pips'):.1f}\n"
-        
-        message += f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
+
+    message += f"\n<b>Time:</b> {_hms()}"
+
+    return message
+
+
+def format_exit(data: Dict[str, Any]) -> str:
+    """Format exit notification"""
+    plugin_name = data.get("plugin_name", "Unknown")
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    profit = data.get("profit", 0)
+
+    emoji = _PNL_EMOJI[profit >= 0]
+
+    message = (
+        f"{emoji} <b>EXIT ALERT</b> | {plugin_name}\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Direction:</b> {direction} -> CLOSED\n\n"
+        f"<b>Entry:</b> {data.get('entry_price', 'N/A')}\n"
+        f"<b>Exit:</b> {data.get('exit_price', 'N/A')}\n"
+        f"<b>Hold Time:</b> {data.get('hold_time', 'N/A')}\n\n"
+        f"<b>P&L:</b> ${profit:+.2f}\n"
+        f"<b>Reason:</b> {data.get('reason', 'N/A')}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+
+    return message
+
+
+def format_tp_hit(data: Dict[str, Any]) -> str:
+    """Format TP_HIT notification"""
+    symbol = data.get("symbol", "UNKNOWN")
+    profit = data.get("profit", 0.0)
+    tp_level = data.get("tp_level", 1)
+    entry_price = data.get("entry_price", 0.0)
+    exit_price = data.get("exit_price", 0.0)
+
+    return (
+        f"<b>TAKE PROFIT HIT</b>\n"
+        f"{_SEP24}\n\n"
+        f"  Symbol: {symbol}\n"
+        f"  TP Level: {tp_level}\n"
+        f"  Entry: {entry_price}\n"
+        f"  Exit: {exit_price}\n"
+        f"  Profit: ${profit:.2f}\n"
+    )
+
+
+def format_sl_hit(data: Dict[str, Any]) -> str:
+    """Format SL_HIT notification"""
+    symbol = data.get("symbol", "UNKNOWN")
+    loss = data.get("loss", 0.0)
+    entry_price = data.get("entry_price", 0.0)
+    exit_price = data.get("exit_price", 0.0)
+
+    return (
+        f"<b>STOP LOSS HIT</b>\n"
+        f"{_SEP24}\n\n"
+        f"  Symbol: {symbol}\n"
+        f"  Entry: {entry_price}\n"
+        f"  Exit: {exit_price}\n"
+        f"  Loss: ${abs(loss):.2f}\n"
+    )
+
+
+def format_daily_summary(data: Dict[str, Any]) -> str:
+    """Format daily summary notification"""
+    date = data.get("date") or time.strftime("%Y-%m-%d")
+    total_trades = data.get("total_trades", 0)
+    winners = data.get("winners", 0)
+    losers = data.get("losers", 0)
+    win_rate = data.get("win_rate", 0)
+    net_pnl = data.get("net_pnl", 0)
+
+    emoji = _PNL_EMOJI[net_pnl >= 0]
+
+    message = (
+        f"<b>DAILY SUMMARY</b> | {date}\n"
+        f"{_SEP24}\n\n"
+        f"<b>Performance:</b>\n"
+        f"  Total Trades: {total_trades}\n"
+        f"  Winners: {winners} ({win_rate:.1f}%)\n"
+        f"  Losers: {losers}\n\n"
+        f"<b>P&L:</b>\n"
+        f"  Gross Profit: +${data.get('gross_profit', 0):.2f}\n"
+        f"  Gross Loss: -${data.get('gross_loss', 0):.2f}\n"
+        f"  {emoji} Net P&L: ${net_pnl:+.2f}"
+    )
+
+    return message
+
+
+def format_emergency(data: Dict[str, Any]) -> str:
+    """Format emergency notification"""
+    reason = data.get("reason", "Unknown")
+    details = data.get("details", "No details available")
+
+    message = (
+        f"<b>EMERGENCY ALERT</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Reason:</b> {reason}\n"
+        f"<b>Details:</b> {details}\n\n"
+        f"<b>Action Required:</b> Immediate attention needed\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+
+    return message
+
+
+def format_error(data: Dict[str, Any]) -> str:
+    """Format error notification"""
+    error_type = data.get("error_type", "Unknown")
+    severity = data.get("severity", "MEDIUM")
+    details = data.get("details", "No details available")
+
+    severity_emoji = "" if severity == "HIGH" else ("" if severity == "MEDIUM" else "")
+
+    message = (
+        f"<b>ERROR ALERT</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Error Type:</b> {error_type}\n"
+        f"<b>Severity:</b> {severity_emoji} {severity}\n"
+        f"<b>Details:</b> {details}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+
+    return message
+
+
+# ========================================
+# V6 Price Action Formatters (NEW - Telegram V5 Upgrade)
+# ========================================
+
+
+def format_v6_entry(data: Dict[str, Any]) -> str:
+    """Format V6 Price Action entry notification with timeframe badge"""
+    timeframe = data.get("timeframe", "N/A")
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    entry_price = data.get("entry_price", 0)
+
+    tf_badge = _tf_badge(timeframe)
+
+    direction_emoji = _DIR_EMOJI[direction in _BUY_DIRECTIONS]
+
+    message = (
+        f"{direction_emoji} <b>V6 ENTRY</b> | {tf_badge}\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Direction:</b> {direction}\n"
+        f"<b>Entry Price:</b> {entry_price}\n"
+        f"<b>Timeframe:</b> {tf_badge}\n"
+    )
+
+    if data.get("sl"):
+        message += f"<b>Stop Loss:</b> {data.get('sl')}\n"
+    if data.get("tp"):
+        message += f"<b>Take Profit:</b> {data.get('tp')}\n"
+    if data.get("lot_size"):
+        message += f"<b>Lot Size:</b> {data.get('lot_size')}\n"
+    if data.get("pattern"):
+        message += f"<b>Pattern:</b> {data.get('pattern')}\n"
+
+    message += f"\n<b>Time:</b> {_hms()}"
+
+    return message
+
+
+def format_v6_exit(data: Dict[str, Any]) -> str:
+    """Format V6 Price Action exit notification"""
+    timeframe = data.get("timeframe", "N/A")
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    profit = data.get("pnl", data.get("profit", 0))
+    exit_reason = data.get("exit_reason", "N/A")
+
+    tf_badge = _tf_badge(timeframe) or "V6"
+
+    result_emoji = _PNL_EMOJI[profit >= 0]
+
+    message = (
+        f"{result_emoji} <b>V6 EXIT</b> | {tf_badge}\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Direction:</b> {direction} -> CLOSED\n\n"
+        f"<b>Entry:</b> {data.get('entry_price', 'N/A')}\n"
+        f"<b>Exit:</b> {data.get('exit_price', 'N/A')}\n"
+        f"<b>Hold Time:</b> {data.get('duration', data.get('hold_time', 'N/A'))}\n\n"
+        f"<b>P&L:</b> ${profit:+.2f}"
+    )
+
+    if data.get("pips"):
+        message += f" ({data.get('pips'):+.1f} pips)"
+
+    message += (
+        f"\n<b>Reason:</b> {exit_reason}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+
+    return message
+
+
+def format_v6_tp_hit(data: Dict[str, Any]) -> str:
+    """Format V6 take profit hit notification"""
+    timeframe = data.get("timeframe", "N/A")
+    symbol = data.get("symbol", "N/A")
+    profit = data.get("pnl", data.get("profit", 0))
+    tp_level = data.get("tp_level", 1)
+
+    tf_badge = _tf_badge(timeframe) or "V6"
+
+    message = (
+        f" <b>V6 TP{tp_level} HIT</b> | {tf_badge}\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>TP Level:</b> {tp_level}\n"
+        f"<b>Profit:</b> ${profit:+.2f}\n"
+    )
+
+    if data.get("pips"):
+        message += f"<b>Pips:</b> {data.get('pips'):+.1f}\n"
+
+    message += f"<b>Time:</b> {_hms()}"
+
+    return message
+
+
+def format_v6_sl_hit(data: Dict[str, Any]) -> str:
+    """Format V6 stop loss hit notification"""
+    timeframe = data.get("timeframe", "N/A")
+    symbol = data.get("symbol", "N/A")
+    loss = data.get("pnl", data.get("loss", 0))
+
+    tf_badge = _tf_badge(timeframe) or "V6"
+
+    message = (
+        f" <b>V6 SL HIT</b> | {tf_badge}\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Loss:</b> ${loss:.2f}\n"
+    )
+
+    if data.get("pips"):
+        message += f"<b>Pips:</b> {data.get('pips'):.1f}\n"
+
+    message += f"<b>Time:</b> {_hms()}"
+
+    return message
+
+
+def format_v6_timeframe_toggle(data: Dict[str, Any]) -> str:
+    """Format V6 timeframe enabled/disabled notification"""
+    timeframe = data.get("timeframe", "N/A")
+    enabled = data.get("enabled", False)
+
+    tf_badge = _tf_badge(timeframe) if timeframe else timeframe
+
+    status_emoji = "" if enabled else ""
+    action = "ENABLED" if enabled else "DISABLED"
+
+    message = (
+        f"{status_emoji} <b>V6 {tf_badge} {action}</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Timeframe:</b> {tf_badge}\n"
+        f"<b>Status:</b> {action}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+
+    return message
+
+
+def format_v6_daily_summary(data: Dict[str, Any]) -> str:
+    """Format V6 daily summary notification"""
+    date = data.get("date") or time.strftime("%Y-%m-%d")
+
+    buf = io.StringIO()
+    w = buf.write
+
+    w(
+        f" <b>V6 DAILY SUMMARY</b> | {date}\n"
+        f"{_SEP24}\n\n"
+        f"<b>By Timeframe:</b>\n"
+    )
+
+    # Per-timeframe stats
+    for tf in ["15m", "30m", "1h", "4h"]:
+        tf_data = ChainMap(data.get(tf) or {}, _V6_TF_STATS_DEFAULTS)
+        trades = tf_data["trades"]
+        pnl = tf_data["pnl"]
+        win_rate = tf_data["win_rate"]
+
+        if trades > 0:
+            emoji = _PNL_EMOJI[pnl >= 0]
+            w(f"  {tf.upper()}: {trades} trades, {emoji}${pnl:+.2f} ({win_rate:.0f}% WR)\n")
+        else:
+            w(f"  {tf.upper()}: No trades\n")
+
+    # Totals
+    d = ChainMap(data, _V6_SUMMARY_DEFAULTS)
+    total_trades = d["total_trades"]
+    total_pnl = d["total_pnl"]
+    total_win_rate = d["total_win_rate"]
+
+    total_emoji = _PNL_EMOJI[total_pnl >= 0]
+
+    w(
+        f"\n<b>V6 Total:</b>\n"
+        f"  Trades: {total_trades}\n"
+        f"  {total_emoji} P&L: ${total_pnl:+.2f}\n"
+        f"  Win Rate: {total_win_rate:.1f}%"
+    )
+
+    return buf.getvalue()
+
+
+def format_v6_signal(data: Dict[str, Any]) -> str:
+    """Format V6 signal received notification"""
+    d = ChainMap(data, _SIGNAL_DEFAULTS)
+    timeframe = d["timeframe"]
+    symbol = d["symbol"]
+    direction = d["direction"]
+    pattern = d["pattern"]
+
+    tf_badge = _tf_badge(timeframe) or "V6"
+
+    direction_emoji = _DIR_EMOJI[direction in _BUY_DIRECTIONS]
+
+    opt_lines = [_OPT_LINE_TMPL % (label, d[key]) for key, label in _OPT_FIELDS if d[key]]
+
+    return _V6_SIGNAL_TMPL % {
+        "tfb": tf_badge,
+        "symbol": symbol,
+        "demoji": direction_emoji,
+        "direction": direction,
+        "pattern": pattern,
+        "opt": "".join(opt_lines),
+        "t": _hms(),
+    }
+
+
+# ==================== NEW FORMATTERS (34 total) ====================
+
+
+# Autonomous System Formatters (5)
+def format_tp_continuation(data: Dict[str, Any]) -> str:
+    """Format TP continuation notification"""
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    level = data.get("level", 1)
+    next_level = data.get("next_level", level + 1)
+    entry = data.get("entry", "N/A")
+    total_profit = data.get("total_profit", 0)
+
+    message = (
+        f"<b>AUTONOMOUS RE-ENTRY</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol} ({direction})\n"
+        f"<b>Type:</b> TP Continuation\n"
+        f"<b>Progress:</b> Level {level} -> Level {next_level}\n\n"
+        f"<b>Entry:</b> {entry}\n"
+        f"<b>Total Profit:</b> ${total_profit:+.2f}\n"
+        f"<b>Status:</b> ACTIVE\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_sl_hunt_activated(data: Dict[str, Any]) -> str:
+    """Format SL Hunt activated notification"""
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    sl_price = data.get("sl_price", "N/A")
+    recovery_entry = data.get("recovery_entry", "N/A")
+    attempt = data.get("attempt", 1)
+
+    message = (
+        f"<b>SL HUNT ACTIVATED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol} ({direction})\n"
+        f"<b>Type:</b> Recovery Entry\n"
+        f"<b>Attempt:</b> {attempt}/1\n\n"
+        f"<b>SL Hit:</b> {sl_price}\n"
+        f"<b>Recovery Entry:</b> {recovery_entry}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_recovery_success(data: Dict[str, Any]) -> str:
+    """Format recovery success notification"""
+    chain_id = data.get("chain_id", "N/A")
+    level = data.get("level", 1)
+
+    message = (
+        f"<b>RECOVERY SUCCESS</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Chain:</b> {chain_id}\n"
+        f"<b>Resumed to Level:</b> {level}\n"
+        f"<b>Status:</b> ACTIVE\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_recovery_failed(data: Dict[str, Any]) -> str:
+    """Format recovery failed notification"""
+    chain_id = data.get("chain_id", "N/A")
+    reason = data.get("reason", "No more recovery attempts allowed")
+
+    message = (
+        f"<b>RECOVERY FAILED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Chain:</b> {chain_id}\n"
+        f"<b>Status:</b> STOPPED\n"
+        f"<b>Reason:</b> {reason}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_profit_order_protection(data: Dict[str, Any]) -> str:
+    """Format profit order protection notification"""
+    chain_id = data.get("chain_id", "N/A")
+    level = data.get("level", 1)
+    order_id = data.get("order_id", "N/A")
+    sl_price = data.get("sl_price", "N/A")
+    current_price = data.get("current_price", "N/A")
+
+    message = (
+        f"<b>PROFIT ORDER PROTECTION</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Chain:</b> #{chain_id}\n"
+        f"<b>Level:</b> {level}\n"
+        f"<b>Order ID:</b> #{order_id}\n"
+        f"<b>SL Price:</b> {sl_price}\n"
+        f"<b>Current Price:</b> {current_price}\n"
+        f"<b>Status:</b> MONITORING ACTIVE\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+# Re-entry System Formatters (5)
+def format_tp_reentry_started(data: Dict[str, Any]) -> str:
+    """Format TP re-entry started notification"""
+    symbol = data.get("symbol", "N/A")
+    level = data.get("level", 1)
+    next_level = data.get("next_level", level + 1)
+    mode = data.get("mode", "Autonomous")
+
+    message = (
+        f"<b>TP RE-ENTRY</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Level:</b> {level} -> {next_level}\n"
+        f"<b>Mode:</b> {mode}\n"
+        f"<b>Trend Aligned:</b> Yes\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_tp_reentry_executed(data: Dict[str, Any]) -> str:
+    """Format TP re-entry executed notification"""
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    entry = data.get("entry", "N/A")
+    sl = data.get("sl", "N/A")
+    tp = data.get("tp", "N/A")
+    level = data.get("level", 1)
+
+    direction_emoji = _DIR_EMOJI[direction in _BUY_DIRECTIONS]
+
+    message = (
+        f"{direction_emoji} <b>TP RE-ENTRY EXECUTED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Direction:</b> {direction}\n"
+        f"<b>Level:</b> {level}\n\n"
+        f"<b>Entry:</b> {entry}\n"
+        f"<b>SL:</b> {sl}\n"
+        f"<b>TP:</b> {tp}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_tp_reentry_completed(data: Dict[str, Any]) -> str:
+    """Format TP re-entry chain completed notification"""
+    chain_id = data.get("chain_id", "N/A")
+    total_profit = data.get("total_profit", 0)
+    levels_completed = data.get("levels_completed", 0)
+    max_levels = data.get("max_levels", 5)
+
+    message = (
+        f"<b>PROFIT CHAIN COMPLETE!</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Chain:</b> #{chain_id}\n"
+        f"<b>Total Profit:</b> ${total_profit:+.2f}\n"
+        f"<b>Levels:</b> {levels_completed}/{max_levels}\n"
+        f"<b>Success Rate:</b> 100%\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_sl_hunt_recovery(data: Dict[str, Any]) -> str:
+    """Format SL Hunt recovery order placed notification"""
+    recovery_for = data.get("recovery_for", "N/A")
+    new_order = data.get("new_order", "N/A")
+    entry = data.get("entry", "N/A")
+    sl = data.get("sl", "N/A")
+    tp = data.get("tp", "N/A")
+    lot = data.get("lot", "N/A")
+
+    message = (
+        f"<b>SL HUNT RECOVERY ORDER PLACED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Recovery For:</b> #{recovery_for}\n"
+        f"<b>New Order:</b> #{new_order}\n"
+        f"<b>Entry:</b> {entry}\n"
+        f"<b>SL:</b> {sl} (Tight)\n"
+        f"<b>TP:</b> {tp}\n"
+        f"<b>Lot:</b> {lot}\n"
+        f"<b>Status:</b> Recovery attempt in progress...\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_exit_continuation(data: Dict[str, Any]) -> str:
+    """Format exit continuation notification"""
+    symbol = data.get("symbol", "N/A")
+    old_direction = data.get("old_direction", "N/A")
+    new_direction = data.get("new_direction", "N/A")
+    pnl = data.get("pnl", 0)
+    closed_id = data.get("closed_id", "N/A")
+
+    message = (
+        f"<b>REVERSAL EXIT TRIGGERED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Old:</b> {old_direction} -> <b>New:</b> {new_direction}\n"
+        f"<b>P&L:</b> ${pnl:+.2f}\n"
+        f"<b>Closed:</b> #{closed_id}\n"
+        f"<b>Status:</b> Monitoring for continuation...\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+# Signal Event Formatters (4)
+def format_signal_received(data: Dict[str, Any]) -> str:
+    """Format signal received notification"""
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    strategy = data.get("strategy", "N/A")
+    entry = data.get("entry", "N/A")
+
+    direction_emoji = _DIR_EMOJI[direction in _BUY_DIRECTIONS]
+
+    message = (
+        f"{direction_emoji} <b>SIGNAL RECEIVED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Direction:</b> {direction}\n"
+        f"<b>Strategy:</b> {strategy}\n"
+        f"<b>Entry:</b> {entry}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_signal_ignored(data: Dict[str, Any]) -> str:
+    """Format signal ignored notification"""
+    symbol = data.get("symbol", "N/A")
+    reason = data.get("reason", "N/A")
+
+    message = (
+        f"<b>SIGNAL IGNORED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Reason:</b> {reason}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_signal_filtered(data: Dict[str, Any]) -> str:
+    """Format signal filtered notification"""
+    symbol = data.get("symbol", "N/A")
+    filter_type = data.get("filter_type", "Duplicate")
+
+    message = (
+        f"<b>SIGNAL FILTERED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Filter:</b> {filter_type}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_trend_changed(data: Dict[str, Any]) -> str:
+    """Format trend changed notification"""
+    symbol = data.get("symbol", "N/A")
+    timeframe = data.get("timeframe", "N/A")
+    old_trend = data.get("old_trend", "NEUTRAL")
+    new_trend = data.get("new_trend", "N/A")
+    mode = data.get("mode", "AUTO")
+
+    trend_emoji = "" if new_trend.upper() == "BULLISH" else ("" if new_trend.upper() == "BEARISH" else "")
+
+    message = (
+        f"<b>TREND UPDATE</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Timeframe:</b> {timeframe}\n"
+        f"<b>Old:</b> {old_trend}\n"
+        f"<b>New:</b> {trend_emoji} {new_trend}\n"
+        f"<b>Mode:</b> {mode}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+# Trade Event Formatters (3)
+def format_partial_close(data: Dict[str, Any]) -> str:
+    """Format partial close notification"""
+    symbol = data.get("symbol", "N/A")
+    closed_lots = data.get("closed_lots", 0)
+    remaining_lots = data.get("remaining_lots", 0)
+    pnl = data.get("pnl", 0)
+
+    message = (
+        f"<b>PARTIAL CLOSE</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Closed:</b> {closed_lots} lots\n"
+        f"<b>Remaining:</b> {remaining_lots} lots\n"
+        f"<b>P&L:</b> ${pnl:+.2f}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_manual_exit(data: Dict[str, Any]) -> str:
+    """Format manual exit notification"""
+    symbol = data.get("symbol", "N/A")
+    pnl = data.get("pnl", 0)
+    exit_price = data.get("exit_price", "N/A")
+    trade_id = data.get("trade_id", "N/A")
+
+    emoji = _PNL_EMOJI[pnl >= 0]
+
+    message = (
+        f"{emoji} <b>MANUAL EXIT</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>P&L:</b> ${pnl:+.2f}\n"
+        f"<b>Exit Price:</b> {exit_price}\n"
+        f"<b>Reason:</b> Manual close\n"
+        f"<b>Trade #:</b> {trade_id}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_reversal_exit(data: Dict[str, Any]) -> str:
+    """Format reversal exit notification"""
+    symbol = data.get("symbol", "N/A")
+    old_direction = data.get("old_direction", "N/A")
+    new_direction = data.get("new_direction", "N/A")
+    pnl = data.get("pnl", 0)
+    closed_id = data.get("closed_id", "N/A")
+
+    message = (
+        f"<b>REVERSAL EXIT TRIGGERED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Old:</b> {old_direction} -> <b>New:</b> {new_direction}\n"
+        f"<b>P&L:</b> ${pnl:+.2f}\n"
+        f"<b>Closed:</b> #{closed_id}\n"
+        f"<b>Status:</b> Monitoring for continuation...\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+# System Event Formatters (6)
+def format_mt5_connected(data: Dict[str, Any]) -> str:
+    """Format MT5 connected notification"""
+    account = data.get("account", "N/A")
+    server = data.get("server", "N/A")
+
+    message = (
+        f"<b>MT5 CONNECTED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Account:</b> {account}\n"
+        f"<b>Server:</b> {server}\n"
+        f"<b>Status:</b> Connected\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_lifetime_loss_limit(data: Dict[str, Any]) -> str:
+    """Format lifetime loss limit notification"""
+    total_loss = data.get("total_loss", 0)
+    limit = data.get("limit", 0)
+
+    message = (
+        f"<b>LIFETIME LOSS LIMIT REACHED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Total Loss:</b> ${total_loss:.2f}\n"
+        f"<b>Limit:</b> ${limit:.2f}\n"
+        f"<b>Status:</b> TRADING STOPPED\n"
+        f"<b>Action:</b> Manual intervention required\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_daily_loss_warning(data: Dict[str, Any]) -> str:
+    """Format daily loss warning notification"""
+    current_loss = data.get("current_loss", 0)
+    daily_limit = data.get("daily_limit", 0)
+    remaining = data.get("remaining", 0)
+    percentage = data.get("percentage", 0)
+
+    message = (
+        f"<b>DAILY LOSS APPROACHING LIMIT</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Current Loss:</b> ${current_loss:.2f}\n"
+        f"<b>Daily Limit:</b> ${daily_limit:.2f}\n"
+        f"<b>Remaining:</b> ${remaining:.2f} ({percentage:.0f}%)\n"
+        f"<b>Warning:</b> Trade cautiously!\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_config_error(data: Dict[str, Any]) -> str:
+    """Format config error notification"""
+    error = data.get("error", "Unknown error")
+    details = data.get("details", "No details available")
+
+    message = (
+        f"<b>CONFIGURATION ERROR</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Error:</b> {error}\n"
+        f"<b>Details:</b> {details}\n"
+        f"<b>Action:</b> Please check config.json and restart\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_database_error(data: Dict[str, Any]) -> str:
+    """Format database error notification"""
+    operation = data.get("operation", "Unknown")
+    error = data.get("error", "Unknown error")
+
+    message = (
+        f"<b>DATABASE ERROR</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Operation:</b> {operation}\n"
+        f"<b>Error:</b> {error}\n"
+        f"<b>Action:</b> Check logs for details\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_order_failed(data: Dict[str, Any]) -> str:
+    """Format order failed notification"""
+    symbol = data.get("symbol", "N/A")
+    reason = data.get("reason", "Unknown")
+
+    message = (
+        f"<b>ORDER PLACEMENT FAILED</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Reason:</b> {reason}\n"
+        f"<b>Action:</b> Trade cancelled\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+# Session Event Formatters (4)
+def format_session_toggle(data: Dict[str, Any]) -> str:
+    """Format session toggle notification"""
+    session = data.get("session", "N/A")
+    enabled = data.get("enabled", False)
+    status = "ENABLED" if enabled else "DISABLED"
+
+    message = (
+        f"<b>SESSION UPDATE</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Session:</b> {session}\n"
+        f"<b>Status:</b> {status}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_symbol_toggle(data: Dict[str, Any]) -> str:
+    """Format symbol toggle notification"""
+    session = data.get("session", "N/A")
+    symbol = data.get("symbol", "N/A")
+    enabled = data.get("enabled", False)
+    status = "ENABLED" if enabled else "DISABLED"
+
+    message = (
+        f"<b>SYMBOL UPDATE</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Session:</b> {session}\n"
+        f"<b>Symbol:</b> {symbol}\n"
+        f"<b>Status:</b> {status}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_time_adjustment(data: Dict[str, Any]) -> str:
+    """Format time adjustment notification"""
+    session = data.get("session", "N/A")
+    adjustment_type = data.get("type", "Start")
+    adjustment = data.get("adjustment", "+30")
+    new_time = data.get("new_time", "N/A")
+
+    message = (
+        f"<b>TIME ADJUSTMENT</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Session:</b> {session}\n"
+        f"<b>{adjustment_type} Time:</b> {adjustment} minutes\n"
+        f"<b>New Time:</b> {new_time} UTC\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_force_close_toggle(data: Dict[str, Any]) -> str:
+    """Format force close toggle notification"""
+    session = data.get("session", "N/A")
+    enabled = data.get("enabled", False)
+    status = "ENABLED" if enabled else "DISABLED"
+
+    message = (
+        f"<b>FORCE CLOSE UPDATE</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Session:</b> {session}\n"
+        f"<b>Force Close:</b> {status}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+# Voice Alert Formatters (5)
+def format_voice_trade_entry(data: Dict[str, Any]) -> str:
+    """Format voice trade entry notification"""
+    symbol = data.get("symbol", "N/A")
+    direction = data.get("direction", "N/A")
+    price = data.get("price", "N/A")
+
+    message = f"New trade opened. {symbol} {direction} at {price}"
+    return message
+
+
+def format_voice_tp_hit(data: Dict[str, Any]) -> str:
+    """Format voice TP hit notification"""
+    symbol = data.get("symbol", "N/A")
+    profit = data.get("profit", 0)
+
+    message = f"Take profit hit. {symbol} profit {profit:.2f} dollars"
+    return message
+
+
+def format_voice_sl_hit(data: Dict[str, Any]) -> str:
+    """Format voice SL hit notification"""
+    symbol = data.get("symbol", "N/A")
+    loss = data.get("loss", 0)
+
+    message = f"Stop loss hit. {symbol} loss {abs(loss):.2f} dollars"
+    return message
+
+
+def format_voice_risk_limit(data: Dict[str, Any]) -> str:
+    """Format voice risk limit notification"""
+    limit_type = data.get("limit_type", "Daily")
+
+    message = f"Warning. {limit_type} loss limit reached. Trading paused."
+    return message
+
+
+def format_voice_recovery(data: Dict[str, Any]) -> str:
+    """Format voice recovery notification"""
+    symbol = data.get("symbol", "N/A")
+
+    message = f"Recovery attempt started for {symbol}"
+    return message
+
+
+# Dashboard Formatters (2)
+def format_dashboard_update(data: Dict[str, Any]) -> str:
+    """Format dashboard update notification"""
+    balance = data.get("balance", 0)
+    open_trades = data.get("open_trades", 0)
+    live_pnl = data.get("live_pnl", 0)
+    today_pnl = data.get("today_pnl", 0)
+    trades_today = data.get("trades_today", 0)
+
+    pnl_emoji = _PNL_EMOJI[live_pnl >= 0]
+
+    message = (
+        f"<b>ZEPIX TRADING BOT DASHBOARD</b>\n"
+        f"{'=' * 30}\n\n"
+        f"<b>LIVE STATUS</b>\n"
+        f"  Bot: RUNNING\n"
+        f"  Balance: ${balance:,.2f}\n"
+        f"  Open Trades: {open_trades}\n"
+        f"  Live PnL: {pnl_emoji}${live_pnl:+.2f}\n\n"
+        f"<b>TODAY'S PERFORMANCE</b>\n"
+        f"  Net PnL: ${today_pnl:+.2f}\n"
+        f"  Trades Today: {trades_today}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+def format_autonomous_dashboard(data: Dict[str, Any]) -> str:
+    """Format autonomous dashboard notification"""
+    status = data.get("status", "RUNNING")
+    daily_recoveries = data.get("daily_recoveries", 0)
+    max_recoveries = data.get("max_recoveries", 10)
+    active_monitors = data.get("active_monitors", 0)
+    tp_continuation = data.get("tp_continuation", True)
+    sl_hunt_recovery = data.get("sl_hunt_recovery", True)
+    exit_continuation = data.get("exit_continuation", True)
+
+    message = (
+        f"<b>AUTONOMOUS DASHBOARD</b>\n"
+        f"{_SEP24}\n\n"
+        f"<b>Status:</b> {status}\n"
+        f"<b>Daily Recoveries:</b> {daily_recoveries}/{max_recoveries}\n"
+        f"<b>Active Monitors:</b> {active_monitors}\n\n"
+        f"<b>Sub-Systems:</b>\n"
+        f"  Profit Protection: Active\n"
+        f"  SL Optimizer: Active\n"
+        f"  Recovery Windows: Active\n\n"
+        f"<b>Active Configuration:</b>\n"
+        f"  TP Continuation: {'ON' if tp_continuation else 'OFF'}\n"
+        f"  SL Hunt Recovery: {'ON' if sl_hunt_recovery else 'OFF'}\n"
+        f"  Exit Continuation: {'ON' if exit_continuation else 'OFF'}\n"
+        f"<b>Time:</b> {_hms()}"
+    )
+    return message
+
+
+class NotificationFormatter:
+    """
+    Provides standard formatters for different notification types.
     
-    @staticmethod
-    def format_v6_timeframe_toggle(data: Dict) -> str:
-        """Format V6 timeframe enabled/disabled notification"""
-        timeframe = data.get("timeframe", "N/A")
-        enabled = data.get("enabled", False)
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else timeframe
-        
-        status_emoji = "" if enabled else ""
-        action = "ENABLED" if enabled else "DISABLED"
-        
-        message = (
-            f"{status_emoji} <b>V6 {tf_badge} {action}</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Timeframe:</b> {tf_badge}\n"
-            f"<b>Status:</b> {action}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        
-        return message
+    The formatters are module-level functions; this class re-exposes them as
+    static methods for existing callers.
+    """
     
-    @staticmethod
-    def format_v6_daily_summary(data: Dict) -> str:
-        """Format V6 daily summary notification"""
-        date = data.get("date", datetime.now().strftime("%Y-%m-%d"))
-        
-        message = (
-            f" <b>V6 DAILY SUMMARY</b> | {date}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>By Timeframe:</b>\n"
-        )
-        
-        # Per-timeframe stats
-        for tf in ["15m", "30m", "1h", "4h"]:
-            tf_data = data.get(tf, {})
-            trades = tf_data.get("trades", 0)
-            pnl = tf_data.get("pnl", 0)
-            win_rate = tf_data.get("win_rate", 0)
-            
-            if trades > 0:
-                emoji = "" if pnl >= 0 else ""
-                message += f"  {tf.upper()}: {trades} trades, {emoji}${pnl:+.2f} ({win_rate:.0f}% WR)\n"
-            else:
-                message += f"  {tf.upper()}: No trades\n"
-        
-        # Totals
-        total_trades = data.get("total_trades", 0)
-        total_pnl = data.get("total_pnl", 0)
-        total_win_rate = data.get("total_win_rate", 0)
-        
-        total_emoji = "" if total_pnl >= 0 else ""
-        
-        message += (
-            f"\n<b>V6 Total:</b>\n"
-            f"  Trades: {total_trades}\n"
-            f"  {total_emoji} P&L: ${total_pnl:+.2f}\n"
-            f"  Win Rate: {total_win_rate:.1f}%"
-        )
-        
-        return message
-    
-    @staticmethod
-    def format_v6_signal(data: Dict) -> str:
-        """Format V6 signal received notification"""
-        timeframe = data.get("timeframe", "N/A")
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        pattern = data.get("pattern", "N/A")
-        
-        tf_badges = {"15m": "15M", "30m": "30M", "1h": "1H", "4h": "4H"}
-        tf_badge = tf_badges.get(timeframe.lower(), timeframe.upper()) if timeframe else "V6"
-        
-        direction_emoji = "" if direction.upper() == "BUY" else ""
-        
-        message = (
-            f" <b>V6 SIGNAL</b> | {tf_badge}\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction_emoji} {direction}\n"
-            f"<b>Timeframe:</b> {tf_badge}\n"
-            f"<b>Pattern:</b> {pattern}\n"
-        )
-        
-        if data.get("entry"):
-            message += f"<b>Entry:</b> {data.get('entry')}\n"
-        if data.get("sl"):
-            message += f"<b>SL:</b> {data.get('sl')}\n"
-        if data.get("tp"):
-            message += f"<b>TP:</b> {data.get('tp')}\n"
-        
-        message += f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        
-        return message
+    format_entry = staticmethod(format_entry)
+    format_exit = staticmethod(format_exit)
+    format_tp_hit = staticmethod(format_tp_hit)
+    format_sl_hit = staticmethod(format_sl_hit)
+    format_daily_summary = staticmethod(format_daily_summary)
+    format_emergency = staticmethod(format_emergency)
+    format_error = staticmethod(format_error)
+    format_v6_entry = staticmethod(format_v6_entry)
+    format_v6_exit = staticmethod(format_v6_exit)
+    format_v6_tp_hit = staticmethod(format_v6_tp_hit)
+    format_v6_sl_hit = staticmethod(format_v6_sl_hit)
+    format_v6_timeframe_toggle = staticmethod(format_v6_timeframe_toggle)
+    format_v6_daily_summary = staticmethod(format_v6_daily_summary)
+    format_v6_signal = staticmethod(format_v6_signal)
+    format_tp_continuation = staticmethod(format_tp_continuation)
+    format_sl_hunt_activated = staticmethod(format_sl_hunt_activated)
+    format_recovery_success = staticmethod(format_recovery_success)
+    format_recovery_failed = staticmethod(format_recovery_failed)
+    format_profit_order_protection = staticmethod(format_profit_order_protection)
+    format_tp_reentry_started = staticmethod(format_tp_reentry_started)
+    format_tp_reentry_executed = staticmethod(format_tp_reentry_executed)
+    format_tp_reentry_completed = staticmethod(format_tp_reentry_completed)
+    format_sl_hunt_recovery = staticmethod(format_sl_hunt_recovery)
+    format_exit_continuation = staticmethod(format_exit_continuation)
+    format_signal_received = staticmethod(format_signal_received)
+    format_signal_ignored = staticmethod(format_signal_ignored)
+    format_signal_filtered = staticmethod(format_signal_filtered)
+    format_trend_changed = staticmethod(format_trend_changed)
+    format_partial_close = staticmethod(format_partial_close)
+    format_manual_exit = staticmethod(format_manual_exit)
+    format_reversal_exit = staticmethod(format_reversal_exit)
+    format_mt5_connected = staticmethod(format_mt5_connected)
+    format_lifetime_loss_limit = staticmethod(format_lifetime_loss_limit)
+    format_daily_loss_warning = staticmethod(format_daily_loss_warning)
+    format_config_error = staticmethod(format_config_error)
+    format_database_error = staticmethod(format_database_error)
+    format_order_failed = staticmethod(format_order_failed)
+    format_session_toggle = staticmethod(format_session_toggle)
+    format_symbol_toggle = staticmethod(format_symbol_toggle)
+    format_time_adjustment = staticmethod(format_time_adjustment)
+    format_force_close_toggle = staticmethod(format_force_close_toggle)
+    format_voice_trade_entry = staticmethod(format_voice_trade_entry)
+    format_voice_tp_hit = staticmethod(format_voice_tp_hit)
+    format_voice_sl_hit = staticmethod(format_voice_sl_hit)
+    format_voice_risk_limit = staticmethod(format_voice_risk_limit)
+    format_voice_recovery = staticmethod(format_voice_recovery)
+    format_dashboard_update = staticmethod(format_dashboard_update)
+    format_autonomous_dashboard = staticmethod(format_autonomous_dashboard)
+
+
+# Default formatter table, built once at import and bulk-registered by create_default_router;
+# every enum member is resolved here exactly once
+_NT = NotificationType
+_DEFAULT_FORMATTERS: Final[Dict[NotificationType, Callable]] = {
+    # Default formatters
+    _NT.ENTRY: format_entry,
+    _NT.EXIT: format_exit,
+    _NT.TP_HIT: format_tp_hit,
+    _NT.SL_HIT: format_sl_hit,
+    _NT.DAILY_SUMMARY: format_daily_summary,
+    _NT.EMERGENCY_STOP: format_emergency,
+    _NT.ERROR: format_error,
+    
+    # V6 formatters (NEW - Telegram V5 Upgrade)
+    _NT.V6_ENTRY_15M: format_v6_entry,
+    _NT.V6_ENTRY_30M: format_v6_entry,
+    _NT.V6_ENTRY_1H: format_v6_entry,
+    _NT.V6_ENTRY_4H: format_v6_entry,
+    _NT.V6_EXIT: format_v6_exit,
+    _NT.V6_TP_HIT: format_v6_tp_hit,
+    _NT.V6_SL_HIT: format_v6_sl_hit,
+    _NT.V6_TIMEFRAME_ENABLED: format_v6_timeframe_toggle,
+    _NT.V6_TIMEFRAME_DISABLED: format_v6_timeframe_toggle,
+    _NT.V6_DAILY_SUMMARY: format_v6_daily_summary,
+    _NT.V6_SIGNAL: format_v6_signal,
     
     # ==================== NEW FORMATTERS (34 total) ====================
     
     # Autonomous System Formatters (5)
-    @staticmethod
-    def format_tp_continuation(data: Dict) -> str:
-        """Format TP continuation notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        level = data.get("level", 1)
-        next_level = data.get("next_level", level + 1)
-        entry = data.get("entry", "N/A")
-        total_profit = data.get("total_profit", 0)
-        
-        message = (
-            f"<b>AUTONOMOUS RE-ENTRY</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol} ({direction})\n"
-            f"<b>Type:</b> TP Continuation\n"
-            f"<b>Progress:</b> Level {level} -> Level {next_level}\n\n"
-            f"<b>Entry:</b> {entry}\n"
-            f"<b>Total Profit:</b> ${total_profit:+.2f}\n"
-            f"<b>Status:</b> ACTIVE\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_sl_hunt_activated(data: Dict) -> str:
-        """Format SL Hunt activated notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        sl_price = data.get("sl_price", "N/A")
-        recovery_entry = data.get("recovery_entry", "N/A")
-        attempt = data.get("attempt", 1)
-        
-        message = (
-            f"<b>SL HUNT ACTIVATED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol} ({direction})\n"
-            f"<b>Type:</b> Recovery Entry\n"
-            f"<b>Attempt:</b> {attempt}/1\n\n"
-            f"<b>SL Hit:</b> {sl_price}\n"
-            f"<b>Recovery Entry:</b> {recovery_entry}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_recovery_success(data: Dict) -> str:
-        """Format recovery success notification"""
-        chain_id = data.get("chain_id", "N/A")
-        level = data.get("level", 1)
-        
-        message = (
-            f"<b>RECOVERY SUCCESS</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Chain:</b> {chain_id}\n"
-            f"<b>Resumed to Level:</b> {level}\n"
-            f"<b>Status:</b> ACTIVE\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_recovery_failed(data: Dict) -> str:
-        """Format recovery failed notification"""
-        chain_id = data.get("chain_id", "N/A")
-        reason = data.get("reason", "No more recovery attempts allowed")
-        
-        message = (
-            f"<b>RECOVERY FAILED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Chain:</b> {chain_id}\n"
-            f"<b>Status:</b> STOPPED\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_profit_order_protection(data: Dict) -> str:
-        """Format profit order protection notification"""
-        chain_id = data.get("chain_id", "N/A")
-        level = data.get("level", 1)
-        order_id = data.get("order_id", "N/A")
-        sl_price = data.get("sl_price", "N/A")
-        current_price = data.get("current_price", "N/A")
-        
-        message = (
-            f"<b>PROFIT ORDER PROTECTION</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Chain:</b> #{chain_id}\n"
-            f"<b>Level:</b> {level}\n"
-            f"<b>Order ID:</b> #{order_id}\n"
-            f"<b>SL Price:</b> {sl_price}\n"
-            f"<b>Current Price:</b> {current_price}\n"
-            f"<b>Status:</b> MONITORING ACTIVE\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
+    _NT.TP_CONTINUATION: format_tp_continuation,
+    _NT.SL_HUNT_ACTIVATED: format_sl_hunt_activated,
+    _NT.RECOVERY_SUCCESS: format_recovery_success,
+    _NT.RECOVERY_FAILED: format_recovery_failed,
+    _NT.PROFIT_ORDER_PROTECTION: format_profit_order_protection,
     
     # Re-entry System Formatters (5)
-    @staticmethod
-    def format_tp_reentry_started(data: Dict) -> str:
-        """Format TP re-entry started notification"""
-        symbol = data.get("symbol", "N/A")
-        level = data.get("level", 1)
-        next_level = data.get("next_level", level + 1)
-        mode = data.get("mode", "Autonomous")
-        
-        message = (
-            f"<b>TP RE-ENTRY</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Level:</b> {level} -> {next_level}\n"
-            f"<b>Mode:</b> {mode}\n"
-            f"<b>Trend Aligned:</b> Yes\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_tp_reentry_executed(data: Dict) -> str:
-        """Format TP re-entry executed notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        entry = data.get("entry", "N/A")
-        sl = data.get("sl", "N/A")
-        tp = data.get("tp", "N/A")
-        level = data.get("level", 1)
-        
-        direction_emoji = "" if direction.upper() == "BUY" else ""
-        
-        message = (
-            f"{direction_emoji} <b>TP RE-ENTRY EXECUTED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Level:</b> {level}\n\n"
-            f"<b>Entry:</b> {entry}\n"
-            f"<b>SL:</b> {sl}\n"
-            f"<b>TP:</b> {tp}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_tp_reentry_completed(data: Dict) -> str:
-        """Format TP re-entry chain completed notification"""
-        chain_id = data.get("chain_id", "N/A")
-        total_profit = data.get("total_profit", 0)
-        levels_completed = data.get("levels_completed", 0)
-        max_levels = data.get("max_levels", 5)
-        
-        message = (
-            f"<b>PROFIT CHAIN COMPLETE!</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Chain:</b> #{chain_id}\n"
-            f"<b>Total Profit:</b> ${total_profit:+.2f}\n"
-            f"<b>Levels:</b> {levels_completed}/{max_levels}\n"
-            f"<b>Success Rate:</b> 100%\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_sl_hunt_recovery(data: Dict) -> str:
-        """Format SL Hunt recovery order placed notification"""
-        recovery_for = data.get("recovery_for", "N/A")
-        new_order = data.get("new_order", "N/A")
-        entry = data.get("entry", "N/A")
-        sl = data.get("sl", "N/A")
-        tp = data.get("tp", "N/A")
-        lot = data.get("lot", "N/A")
-        
-        message = (
-            f"<b>SL HUNT RECOVERY ORDER PLACED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Recovery For:</b> #{recovery_for}\n"
-            f"<b>New Order:</b> #{new_order}\n"
-            f"<b>Entry:</b> {entry}\n"
-            f"<b>SL:</b> {sl} (Tight)\n"
-            f"<b>TP:</b> {tp}\n"
-            f"<b>Lot:</b> {lot}\n"
-            f"<b>Status:</b> Recovery attempt in progress...\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_exit_continuation(data: Dict) -> str:
-        """Format exit continuation notification"""
-        symbol = data.get("symbol", "N/A")
-        old_direction = data.get("old_direction", "N/A")
-        new_direction = data.get("new_direction", "N/A")
-        pnl = data.get("pnl", 0)
-        closed_id = data.get("closed_id", "N/A")
-        
-        message = (
-            f"<b>REVERSAL EXIT TRIGGERED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Old:</b> {old_direction} -> <b>New:</b> {new_direction}\n"
-            f"<b>P&L:</b> ${pnl:+.2f}\n"
-            f"<b>Closed:</b> #{closed_id}\n"
-            f"<b>Status:</b> Monitoring for continuation...\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
+    _NT.TP_REENTRY_STARTED: format_tp_reentry_started,
+    _NT.TP_REENTRY_EXECUTED: format_tp_reentry_executed,
+    _NT.TP_REENTRY_COMPLETED: format_tp_reentry_completed,
+    _NT.SL_HUNT_RECOVERY: format_sl_hunt_recovery,
+    _NT.EXIT_CONTINUATION: format_exit_continuation,
     
     # Signal Event Formatters (4)
-    @staticmethod
-    def format_signal_received(data: Dict) -> str:
-        """Format signal received notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        strategy = data.get("strategy", "N/A")
-        entry = data.get("entry", "N/A")
-        
-        direction_emoji = "" if direction.upper() == "BUY" else ""
-        
-        message = (
-            f"{direction_emoji} <b>SIGNAL RECEIVED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Direction:</b> {direction}\n"
-            f"<b>Strategy:</b> {strategy}\n"
-            f"<b>Entry:</b> {entry}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_signal_ignored(data: Dict) -> str:
-        """Format signal ignored notification"""
-        symbol = data.get("symbol", "N/A")
-        reason = data.get("reason", "N/A")
-        
-        message = (
-            f"<b>SIGNAL IGNORED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_signal_filtered(data: Dict) -> str:
-        """Format signal filtered notification"""
-        symbol = data.get("symbol", "N/A")
-        filter_type = data.get("filter_type", "Duplicate")
-        
-        message = (
-            f"<b>SIGNAL FILTERED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Filter:</b> {filter_type}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_trend_changed(data: Dict) -> str:
-        """Format trend changed notification"""
-        symbol = data.get("symbol", "N/A")
-        timeframe = data.get("timeframe", "N/A")
-        old_trend = data.get("old_trend", "NEUTRAL")
-        new_trend = data.get("new_trend", "N/A")
-        mode = data.get("mode", "AUTO")
-        
-        trend_emoji = "" if new_trend.upper() == "BULLISH" else ("" if new_trend.upper() == "BEARISH" else "")
-        
-        message = (
-            f"<b>TREND UPDATE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Timeframe:</b> {timeframe}\n"
-            f"<b>Old:</b> {old_trend}\n"
-            f"<b>New:</b> {trend_emoji} {new_trend}\n"
-            f"<b>Mode:</b> {mode}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
+    _NT.SIGNAL_RECEIVED: format_signal_received,
+    _NT.SIGNAL_IGNORED: format_signal_ignored,
+    _NT.SIGNAL_FILTERED: format_signal_filtered,
+    _NT.TREND_CHANGED: format_trend_changed,
     
     # Trade Event Formatters (3)
-    @staticmethod
-    def format_partial_close(data: Dict) -> str:
-        """Format partial close notification"""
-        symbol = data.get("symbol", "N/A")
-        closed_lots = data.get("closed_lots", 0)
-        remaining_lots = data.get("remaining_lots", 0)
-        pnl = data.get("pnl", 0)
-        
-        message = (
-            f"<b>PARTIAL CLOSE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Closed:</b> {closed_lots} lots\n"
-            f"<b>Remaining:</b> {remaining_lots} lots\n"
-            f"<b>P&L:</b> ${pnl:+.2f}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_manual_exit(data: Dict) -> str:
-        """Format manual exit notification"""
-        symbol = data.get("symbol", "N/A")
-        pnl = data.get("pnl", 0)
-        exit_price = data.get("exit_price", "N/A")
-        trade_id = data.get("trade_id", "N/A")
-        
-        emoji = "" if pnl >= 0 else ""
-        
-        message = (
-            f"{emoji} <b>MANUAL EXIT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>P&L:</b> ${pnl:+.2f}\n"
-            f"<b>Exit Price:</b> {exit_price}\n"
-            f"<b>Reason:</b> Manual close\n"
-            f"<b>Trade #:</b> {trade_id}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_reversal_exit(data: Dict) -> str:
-        """Format reversal exit notification"""
-        symbol = data.get("symbol", "N/A")
-        old_direction = data.get("old_direction", "N/A")
-        new_direction = data.get("new_direction", "N/A")
-        pnl = data.get("pnl", 0)
-        closed_id = data.get("closed_id", "N/A")
-        
-        message = (
-            f"<b>REVERSAL EXIT TRIGGERED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Old:</b> {old_direction} -> <b>New:</b> {new_direction}\n"
-            f"<b>P&L:</b> ${pnl:+.2f}\n"
-            f"<b>Closed:</b> #{closed_id}\n"
-            f"<b>Status:</b> Monitoring for continuation...\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
+    _NT.PARTIAL_CLOSE: format_partial_close,
+    _NT.MANUAL_EXIT: format_manual_exit,
+    _NT.REVERSAL_EXIT: format_reversal_exit,
     
     # System Event Formatters (6)
-    @staticmethod
-    def format_mt5_connected(data: Dict) -> str:
-        """Format MT5 connected notification"""
-        account = data.get("account", "N/A")
-        server = data.get("server", "N/A")
-        
-        message = (
-            f"<b>MT5 CONNECTED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Account:</b> {account}\n"
-            f"<b>Server:</b> {server}\n"
-            f"<b>Status:</b> Connected\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_lifetime_loss_limit(data: Dict) -> str:
-        """Format lifetime loss limit notification"""
-        total_loss = data.get("total_loss", 0)
-        limit = data.get("limit", 0)
-        
-        message = (
-            f"<b>LIFETIME LOSS LIMIT REACHED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Total Loss:</b> ${total_loss:.2f}\n"
-            f"<b>Limit:</b> ${limit:.2f}\n"
-            f"<b>Status:</b> TRADING STOPPED\n"
-            f"<b>Action:</b> Manual intervention required\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_daily_loss_warning(data: Dict) -> str:
-        """Format daily loss warning notification"""
-        current_loss = data.get("current_loss", 0)
-        daily_limit = data.get("daily_limit", 0)
-        remaining = data.get("remaining", 0)
-        percentage = data.get("percentage", 0)
-        
-        message = (
-            f"<b>DAILY LOSS APPROACHING LIMIT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Current Loss:</b> ${current_loss:.2f}\n"
-            f"<b>Daily Limit:</b> ${daily_limit:.2f}\n"
-            f"<b>Remaining:</b> ${remaining:.2f} ({percentage:.0f}%)\n"
-            f"<b>Warning:</b> Trade cautiously!\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_config_error(data: Dict) -> str:
-        """Format config error notification"""
-        error = data.get("error", "Unknown error")
-        details = data.get("details", "No details available")
-        
-        message = (
-            f"<b>CONFIGURATION ERROR</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Error:</b> {error}\n"
-            f"<b>Details:</b> {details}\n"
-            f"<b>Action:</b> Please check config.json and restart\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_database_error(data: Dict) -> str:
-        """Format database error notification"""
-        operation = data.get("operation", "Unknown")
-        error = data.get("error", "Unknown error")
-        
-        message = (
-            f"<b>DATABASE ERROR</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Operation:</b> {operation}\n"
-            f"<b>Error:</b> {error}\n"
-            f"<b>Action:</b> Check logs for details\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_order_failed(data: Dict) -> str:
-        """Format order failed notification"""
-        symbol = data.get("symbol", "N/A")
-        reason = data.get("reason", "Unknown")
-        
-        message = (
-            f"<b>ORDER PLACEMENT FAILED</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Reason:</b> {reason}\n"
-            f"<b>Action:</b> Trade cancelled\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
+    _NT.MT5_CONNECTED: format_mt5_connected,
+    _NT.LIFETIME_LOSS_LIMIT: format_lifetime_loss_limit,
+    _NT.DAILY_LOSS_WARNING: format_daily_loss_warning,
+    _NT.CONFIG_ERROR: format_config_error,
+    _NT.DATABASE_ERROR: format_database_error,
+    _NT.ORDER_FAILED: format_order_failed,
     
     # Session Event Formatters (4)
-    @staticmethod
-    def format_session_toggle(data: Dict) -> str:
-        """Format session toggle notification"""
-        session = data.get("session", "N/A")
-        enabled = data.get("enabled", False)
-        status = "ENABLED" if enabled else "DISABLED"
-        
-        message = (
-            f"<b>SESSION UPDATE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Session:</b> {session}\n"
-            f"<b>Status:</b> {status}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_symbol_toggle(data: Dict) -> str:
-        """Format symbol toggle notification"""
-        session = data.get("session", "N/A")
-        symbol = data.get("symbol", "N/A")
-        enabled = data.get("enabled", False)
-        status = "ENABLED" if enabled else "DISABLED"
-        
-        message = (
-            f"<b>SYMBOL UPDATE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Session:</b> {session}\n"
-            f"<b>Symbol:</b> {symbol}\n"
-            f"<b>Status:</b> {status}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_time_adjustment(data: Dict) -> str:
-        """Format time adjustment notification"""
-        session = data.get("session", "N/A")
-        adjustment_type = data.get("type", "Start")
-        adjustment = data.get("adjustment", "+30")
-        new_time = data.get("new_time", "N/A")
-        
-        message = (
-            f"<b>TIME ADJUSTMENT</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Session:</b> {session}\n"
-            f"<b>{adjustment_type} Time:</b> {adjustment} minutes\n"
-            f"<b>New Time:</b> {new_time} UTC\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_force_close_toggle(data: Dict) -> str:
-        """Format force close toggle notification"""
-        session = data.get("session", "N/A")
-        enabled = data.get("enabled", False)
-        status = "ENABLED" if enabled else "DISABLED"
-        
-        message = (
-            f"<b>FORCE CLOSE UPDATE</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Session:</b> {session}\n"
-            f"<b>Force Close:</b> {status}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
+    _NT.SESSION_TOGGLE: format_session_toggle,
+    _NT.SYMBOL_TOGGLE: format_symbol_toggle,
+    _NT.TIME_ADJUSTMENT: format_time_adjustment,
+    _NT.FORCE_CLOSE_TOGGLE: format_force_close_toggle,
     
     # Voice Alert Formatters (5)
-    @staticmethod
-    def format_voice_trade_entry(data: Dict) -> str:
-        """Format voice trade entry notification"""
-        symbol = data.get("symbol", "N/A")
-        direction = data.get("direction", "N/A")
-        price = data.get("price", "N/A")
-        
-        message = f"New trade opened. {symbol} {direction} at {price}"
-        return message
-    
-    @staticmethod
-    def format_voice_tp_hit(data: Dict) -> str:
-        """Format voice TP hit notification"""
-        symbol = data.get("symbol", "N/A")
-        profit = data.get("profit", 0)
-        
-        message = f"Take profit hit. {symbol} profit {profit:.2f} dollars"
-        return message
-    
-    @staticmethod
-    def format_voice_sl_hit(data: Dict) -> str:
-        """Format voice SL hit notification"""
-        symbol = data.get("symbol", "N/A")
-        loss = data.get("loss", 0)
-        
-        message = f"Stop loss hit. {symbol} loss {abs(loss):.2f} dollars"
-        return message
-    
-    @staticmethod
-    def format_voice_risk_limit(data: Dict) -> str:
-        """Format voice risk limit notification"""
-        limit_type = data.get("limit_type", "Daily")
-        
-        message = f"Warning. {limit_type} loss limit reached. Trading paused."
-        return message
-    
-    @staticmethod
-    def format_voice_recovery(data: Dict) -> str:
-        """Format voice recovery notification"""
-        symbol = data.get("symbol", "N/A")
-        
-        message = f"Recovery attempt started for {symbol}"
-        return message
+    _NT.VOICE_TRADE_ENTRY: format_voice_trade_entry,
+    _NT.VOICE_TP_HIT: format_voice_tp_hit,
+    _NT.VOICE_SL_HIT: format_voice_sl_hit,
+    _NT.VOICE_RISK_LIMIT: format_voice_risk_limit,
+    _NT.VOICE_RECOVERY: format_voice_recovery,
     
     # Dashboard Formatters (2)
-    @staticmethod
-    def format_dashboard_update(data: Dict) -> str:
-        """Format dashboard update notification"""
-        balance = data.get("balance", 0)
-        open_trades = data.get("open_trades", 0)
-        live_pnl = data.get("live_pnl", 0)
-        today_pnl = data.get("today_pnl", 0)
-        trades_today = data.get("trades_today", 0)
-        
-        pnl_emoji = "" if live_pnl >= 0 else ""
-        
-        message = (
-            f"<b>ZEPIX TRADING BOT DASHBOARD</b>\n"
-            f"{'=' * 30}\n\n"
-            f"<b>LIVE STATUS</b>\n"
-            f"  Bot: RUNNING\n"
-            f"  Balance: ${balance:,.2f}\n"
-            f"  Open Trades: {open_trades}\n"
-            f"  Live PnL: {pnl_emoji}${live_pnl:+.2f}\n\n"
-            f"<b>TODAY'S PERFORMANCE</b>\n"
-            f"  Net PnL: ${today_pnl:+.2f}\n"
-            f"  Trades Today: {trades_today}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
-    
-    @staticmethod
-    def format_autonomous_dashboard(data: Dict) -> str:
-        """Format autonomous dashboard notification"""
-        status = data.get("status", "RUNNING")
-        daily_recoveries = data.get("daily_recoveries", 0)
-        max_recoveries = data.get("max_recoveries", 10)
-        active_monitors = data.get("active_monitors", 0)
-        tp_continuation = data.get("tp_continuation", True)
-        sl_hunt_recovery = data.get("sl_hunt_recovery", True)
-        exit_continuation = data.get("exit_continuation", True)
-        
-        message = (
-            f"<b>AUTONOMOUS DASHBOARD</b>\n"
-            f"{'=' * 24}\n\n"
-            f"<b>Status:</b> {status}\n"
-            f"<b>Daily Recoveries:</b> {daily_recoveries}/{max_recoveries}\n"
-            f"<b>Active Monitors:</b> {active_monitors}\n\n"
-            f"<b>Sub-Systems:</b>\n"
-            f"  Profit Protection: Active\n"
-            f"  SL Optimizer: Active\n"
-            f"  Recovery Windows: Active\n\n"
-            f"<b>Active Configuration:</b>\n"
-            f"  TP Continuation: {'ON' if tp_continuation else 'OFF'}\n"
-            f"  SL Hunt Recovery: {'ON' if sl_hunt_recovery else 'OFF'}\n"
-            f"  Exit Continuation: {'ON' if exit_continuation else 'OFF'}\n"
-            f"<b>Time:</b> {datetime.now().strftime('%H:%M:%S')}"
-        )
-        return message
+    _NT.DASHBOARD_UPDATE: format_dashboard_update,
+    _NT.AUTONOMOUS_DASHBOARD: format_autonomous_dashboard,
+}
 
 
 def create_default_router(
     controller_callback: Optional[Callable] = None,
     notification_callback: Optional[Callable] = None,
     analytics_callback: Optional[Callable] = None,
-    voice_callback: Optional[Callable] = None
+    voice_callback: Optional[Callable] = None,
+    batch_dispatch: bool = False
 ) -> NotificationRouter:
     """
     Create a NotificationRouter with default formatters registered.
@@ -1616,10 +1982,16 @@ def create_default_router(
         notification_callback: Function to send to Notification Bot
         analytics_callback: Function to send to Analytics Bot
         voice_callback: Function to trigger voice alerts
+        batch_dispatch: Wrap the bot callbacks in BatchedDispatcher
         
     Returns:
         Configured NotificationRouter
     """
+    if batch_dispatch:
+        controller_callback = controller_callback and BatchedDispatcher(controller_callback)
+        notification_callback = notification_callback and BatchedDispatcher(notification_callback)
+        analytics_callback = analytics_callback and BatchedDispatcher(analytics_callback)
+    
     router = NotificationRouter(
         controller_callback=controller_callback,
         notification_callback=notification_callback,
@@ -1627,78 +1999,6 @@ def create_default_router(
         voice_callback=voice_callback
     )
     
-    # Register default formatters
-    router.register_formatter(NotificationType.ENTRY, NotificationFormatter.format_entry)
-    router.register_formatter(NotificationType.EXIT, NotificationFormatter.format_exit)
-    router.register_formatter(NotificationType.TP_HIT, NotificationFormatter.format_tp_hit)
-    router.register_formatter(NotificationType.SL_HIT, NotificationFormatter.format_sl_hit)
-    router.register_formatter(NotificationType.DAILY_SUMMARY, NotificationFormatter.format_daily_summary)
-    router.register_formatter(NotificationType.EMERGENCY_STOP, NotificationFormatter.format_emergency)
-    router.register_formatter(NotificationType.ERROR, NotificationFormatter.format_error)
-    
-    # Register V6 formatters (NEW - Telegram V5 Upgrade)
-    router.register_formatter(NotificationType.V6_ENTRY_15M, NotificationFormatter.format_v6_entry)
-    router.register_formatter(NotificationType.V6_ENTRY_30M, NotificationFormatter.format_v6_entry)
-    router.register_formatter(NotificationType.V6_ENTRY_1H, NotificationFormatter.format_v6_entry)
-    router.register_formatter(NotificationType.V6_ENTRY_4H, NotificationFormatter.format_v6_entry)
-    router.register_formatter(NotificationType.V6_EXIT, NotificationFormatter.format_v6_exit)
-    router.register_formatter(NotificationType.V6_TP_HIT, NotificationFormatter.format_v6_tp_hit)
-    router.register_formatter(NotificationType.V6_SL_HIT, NotificationFormatter.format_v6_sl_hit)
-    router.register_formatter(NotificationType.V6_TIMEFRAME_ENABLED, NotificationFormatter.format_v6_timeframe_toggle)
-    router.register_formatter(NotificationType.V6_TIMEFRAME_DISABLED, NotificationFormatter.format_v6_timeframe_toggle)
-    router.register_formatter(NotificationType.V6_DAILY_SUMMARY, NotificationFormatter.format_v6_daily_summary)
-    router.register_formatter(NotificationType.V6_SIGNAL, NotificationFormatter.format_v6_signal)
-    
-    # ==================== NEW FORMATTER REGISTRATIONS (34 total) ====================
-    
-    # Autonomous System Formatters (5)
-    router.register_formatter(NotificationType.TP_CONTINUATION, NotificationFormatter.format_tp_continuation)
-    router.register_formatter(NotificationType.SL_HUNT_ACTIVATED, NotificationFormatter.format_sl_hunt_activated)
-    router.register_formatter(NotificationType.RECOVERY_SUCCESS, NotificationFormatter.format_recovery_success)
-    router.register_formatter(NotificationType.RECOVERY_FAILED, NotificationFormatter.format_recovery_failed)
-    router.register_formatter(NotificationType.PROFIT_ORDER_PROTECTION, NotificationFormatter.format_profit_order_protection)
-    
-    # Re-entry System Formatters (5)
-    router.register_formatter(NotificationType.TP_REENTRY_STARTED, NotificationFormatter.format_tp_reentry_started)
-    router.register_formatter(NotificationType.TP_REENTRY_EXECUTED, NotificationFormatter.format_tp_reentry_executed)
-    router.register_formatter(NotificationType.TP_REENTRY_COMPLETED, NotificationFormatter.format_tp_reentry_completed)
-    router.register_formatter(NotificationType.SL_HUNT_RECOVERY, NotificationFormatter.format_sl_hunt_recovery)
-    router.register_formatter(NotificationType.EXIT_CONTINUATION, NotificationFormatter.format_exit_continuation)
-    
-    # Signal Event Formatters (4)
-    router.register_formatter(NotificationType.SIGNAL_RECEIVED, NotificationFormatter.format_signal_received)
-    router.register_formatter(NotificationType.SIGNAL_IGNORED, NotificationFormatter.format_signal_ignored)
-    router.register_formatter(NotificationType.SIGNAL_FILTERED, NotificationFormatter.format_signal_filtered)
-    router.register_formatter(NotificationType.TREND_CHANGED, NotificationFormatter.format_trend_changed)
-    
-    # Trade Event Formatters (3)
-    router.register_formatter(NotificationType.PARTIAL_CLOSE, NotificationFormatter.format_partial_close)
-    router.register_formatter(NotificationType.MANUAL_EXIT, NotificationFormatter.format_manual_exit)
-    router.register_formatter(NotificationType.REVERSAL_EXIT, NotificationFormatter.format_reversal_exit)
-    
-    # System Event Formatters (6)
-    router.register_formatter(NotificationType.MT5_CONNECTED, NotificationFormatter.format_mt5_connected)
-    router.register_formatter(NotificationType.LIFETIME_LOSS_LIMIT, NotificationFormatter.format_lifetime_loss_limit)
-    router.register_formatter(NotificationType.DAILY_LOSS_WARNING, NotificationFormatter.format_daily_loss_warning)
-    router.register_formatter(NotificationType.CONFIG_ERROR, NotificationFormatter.format_config_error)
-    router.register_formatter(NotificationType.DATABASE_ERROR, NotificationFormatter.format_database_error)
-    router.register_formatter(NotificationType.ORDER_FAILED, NotificationFormatter.format_order_failed)
-    
-    # Session Event Formatters (4)
-    router.register_formatter(NotificationType.SESSION_TOGGLE, NotificationFormatter.format_session_toggle)
-    router.register_formatter(NotificationType.SYMBOL_TOGGLE, NotificationFormatter.format_symbol_toggle)
-    router.register_formatter(NotificationType.TIME_ADJUSTMENT, NotificationFormatter.format_time_adjustment)
-    router.register_formatter(NotificationType.FORCE_CLOSE_TOGGLE, NotificationFormatter.format_force_close_toggle)
-    
-    # Voice Alert Formatters (5)
-    router.register_formatter(NotificationType.VOICE_TRADE_ENTRY, NotificationFormatter.format_voice_trade_entry)
-    router.register_formatter(NotificationType.VOICE_TP_HIT, NotificationFormatter.format_voice_tp_hit)
-    router.register_formatter(NotificationType.VOICE_SL_HIT, NotificationFormatter.format_voice_sl_hit)
-    router.register_formatter(NotificationType.VOICE_RISK_LIMIT, NotificationFormatter.format_voice_risk_limit)
-    router.register_formatter(NotificationType.VOICE_RECOVERY, NotificationFormatter.format_voice_recovery)
-    
-    # Dashboard Formatters (2)
-    router.register_formatter(NotificationType.DASHBOARD_UPDATE, NotificationFormatter.format_dashboard_update)
-    router.register_formatter(NotificationType.AUTONOMOUS_DASHBOARD, NotificationFormatter.format_autonomous_dashboard)
+    router.register_formatters(_DEFAULT_FORMATTERS)
     
     return router
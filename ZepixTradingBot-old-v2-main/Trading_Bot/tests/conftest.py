@@ -0,0 +1,98 @@
+"""
+Conftest.py - Suite-wide test setup and shared menu fixtures
+
+Registers src/telegram/notification_preferences.py as a top-level module
+for every test module, and provides the bot mock and menu handler fixtures
+used by the Telegram V5 upgrade tests.
+
+Each test gets a freshly built bot mock, so neither bot.config nor the call
+history of send_message and the other child mocks can leak into the next
+test. Handlers are built per test from that mock.
+
+The bot mock is limited with spec_set to the TelegramBot attributes the
+handlers read (MenuManager is handed a TelegramBot in production), so any
+other attribute access fails loudly instead of growing a child mock.
+"""
+
+import importlib.util
+import os
+import sys
+import pytest
+from unittest.mock import NonCallableMock
+
+# src itself is put on sys.path by the pythonpath setting in pyproject.toml
+SRC_ROOT = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+
+# src/telegram clashes with the python-telegram-bot package, so
+# notification_preferences.py is registered under its own top-level name.
+# Executed once here, tests import it with a plain sys.modules lookup.
+if "notification_preferences" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location(
+        "notification_preferences",
+        os.path.join(SRC_ROOT, "telegram", "notification_preferences.py")
+    )
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules["notification_preferences"] = _module
+    _spec.loader.exec_module(_module)
+
+
+# TelegramBot attributes the menu handlers read
+BOT_ATTRIBUTES = [
+    "config", "chat_id", "trading_engine",
+    "send_message", "send_message_with_keyboard", "edit_message", "send_document",
+]
+
+
+def _build_mock_bot():
+    """Build a bot mock limited to BOT_ATTRIBUTES with a V6 price action config."""
+    bot = NonCallableMock(spec_set=BOT_ATTRIBUTES)
+    bot.config = {"v6_price_action": {"enabled": True, "timeframes": {}}}
+    return bot
+
+
+@pytest.fixture(scope="session")
+def make_mock_bot():
+    """Fixture providing the bot mock factory, for fixtures wider than one test."""
+    return _build_mock_bot
+
+
+@pytest.fixture
+def mock_bot():
+    """Fixture providing a fresh bot mock with a V6 price action config."""
+    return _build_mock_bot()
+
+
+@pytest.fixture
+def v6_handler(mock_bot):
+    """Fixture providing a V6ControlMenuHandler."""
+    from menu.v6_control_menu_handler import V6ControlMenuHandler
+    return V6ControlMenuHandler(mock_bot)
+
+
+@pytest.fixture
+def analytics_handler(mock_bot):
+    """Fixture providing an AnalyticsMenuHandler."""
+    from menu.analytics_menu_handler import AnalyticsMenuHandler
+    return AnalyticsMenuHandler(mock_bot)
+
+
+@pytest.fixture
+def dual_order_handler(mock_bot):
+    """Fixture providing a DualOrderMenuHandler."""
+    from menu.dual_order_menu_handler import DualOrderMenuHandler
+    return DualOrderMenuHandler(mock_bot)
+
+
+@pytest.fixture
+def reentry_handler(mock_bot):
+    """Fixture providing a ReentryMenuHandler."""
+    from menu.dual_order_menu_handler import ReentryMenuHandler
+    return ReentryMenuHandler(mock_bot)
+
+
+@pytest.fixture
+def notification_prefs_handler(mock_bot):
+    """Fixture providing a NotificationPreferencesMenuHandler."""
+    from menu.notification_preferences_menu import NotificationPreferencesMenuHandler
+    return NotificationPreferencesMenuHandler(mock_bot)
@@ -9,6 +9,7 @@ Test Cases: 10
 
 import pytest
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -16,6 +17,47 @@ from pathlib import Path
 from tests.documentation_tests.conftest import PROJECT_ROOT, TRADING_BOT_ROOT, SRC_ROOT
 DOC_FILE = "Trading_Bot_Documentation/V5_BIBLE/SESSION_MANAGER_GUIDE.md"
 
+SESSION_MANAGER = "managers/session_manager.py"
+TRADING_ENGINE = "core/trading_engine.py"
+
+# ASCII-only lowercase table; the lowered copy is built once per file and shared
+_LOWER_TABLE = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# Any-of keyword checks run as one regex pass over the lowered bytes
+_SESSION_RE = re.compile(rb"session|asian|london|new_york|timezone")
+_TIMEZONE_RE = re.compile(rb"timezone|utc|datetime|time")
+_LOGGING_RE = re.compile(rb"log|print")
+
+# (claim id, source file, "raw" or lowered "lc" bytes, needle or regex, failure message)
+SOURCE_CLAIMS = [
+    ("002_session_manager_class_exists", SESSION_MANAGER, "raw", b"SessionManager",
+     "SessionManager class not found"),
+    ("003_init_method_exists", SESSION_MANAGER, "raw", b"def __init__",
+     "__init__ method not found"),
+    ("004_session_related_methods_exist", SESSION_MANAGER, "lc", b"session",
+     "Session methods not found"),
+    ("005_config_attribute_exists", SESSION_MANAGER, "raw", b"config",
+     "config attribute not found"),
+    ("006_trading_sessions_defined", SESSION_MANAGER, "lc", _SESSION_RE,
+     "Trading session definitions not found"),
+    ("007_timezone_handling_exists", SESSION_MANAGER, "lc", _TIMEZONE_RE,
+     "Timezone handling not found"),
+    ("008_trading_engine_integration", TRADING_ENGINE, "lc", b"session",
+     "Session manager integration not found in trading engine"),
+    ("010_logging_exists", SESSION_MANAGER, "lc", _LOGGING_RE,
+     "Session logging not found"),
+]
+
+
+@pytest.fixture(scope="session")
+def src_files():
+    """Read each source file referenced by the guide exactly once per run"""
+    files = {}
+    for path in (SESSION_MANAGER, TRADING_ENGINE):
+        data = (SRC_ROOT / path).read_bytes()
+        files[path] = {"raw": data, "lc": data.translate(_LOWER_TABLE)}
+    return files
+
 
 class TestSessionManagerGuide:
     """Test suite for SESSION_MANAGER_GUIDE.md"""
@@ -27,97 +69,28 @@ class TestSessionManagerGuide:
         DOC CLAIM: session_manager.py file
         TEST TYPE: File Existence
         """
-        file_path = SRC_ROOT / "managers" / "session_manager.py"
+        file_path = SRC_ROOT / SESSION_MANAGER
         assert file_path.exists(), f"File not found: {file_path}"
     
-    # ==================== CLASS EXISTENCE TESTS ====================
-    
-    def test_session_guide_002_session_manager_class_exists(self):
-        """
-        DOC CLAIM: SessionManager class
-        TEST TYPE: Class Existence
-        """
-        file_path = SRC_ROOT / "managers" / "session_manager.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
-        assert "class SessionManager" in content or "SessionManager" in content, \
-            "SessionManager class not found"
-    
-    # ==================== METHOD EXISTENCE TESTS ====================
-    
-    def test_session_guide_003_init_method_exists(self):
-        """
-        DOC CLAIM: __init__ method
-        TEST TYPE: Method Existence
-        """
-        file_path = SRC_ROOT / "managers" / "session_manager.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
-        assert "def __init__" in content, "__init__ method not found"
-    
-    def test_session_guide_004_session_related_methods_exist(self):
-        """
-        DOC CLAIM: Session management methods
-        TEST TYPE: Method Existence
-        """
-        file_path = SRC_ROOT / "managers" / "session_manager.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
-        assert "session" in content.lower(), "Session methods not found"
-    
-    # ==================== ATTRIBUTE TESTS ====================
+    # ==================== SOURCE CONTENT TESTS ====================
     
-    def test_session_guide_005_config_attribute_exists(self):
+    @pytest.mark.parametrize(
+        "source,variant,pattern,message",
+        [claim[1:] for claim in SOURCE_CLAIMS],
+        ids=[claim[0] for claim in SOURCE_CLAIMS],
+    )
+    def test_session_guide_source_claim(self, src_files, source, variant, pattern, message):
         """
-        DOC CLAIM: config attribute
-        TEST TYPE: Attribute Existence
+        DOC CLAIM: Class, method, attribute, session, timezone, integration
+        and logging claims (002-008, 010)
+        TEST TYPE: Source Content
         """
-        file_path = SRC_ROOT / "managers" / "session_manager.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
-        assert "config" in content, "config attribute not found"
-    
-    # ==================== SESSION DEFINITION TESTS ====================
-    
-    def test_session_guide_006_trading_sessions_defined(self):
-        """
-        DOC CLAIM: Trading session definitions
-        TEST TYPE: Definition Existence
-        """
-        file_path = SRC_ROOT / "managers" / "session_manager.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
-        # Check for any session-related content
-        has_sessions = any(term in content.lower() for term in 
-                         ["session", "asian", "london", "new_york", "timezone"])
-        assert has_sessions, "Trading session definitions not found"
-    
-    # ==================== TIMEZONE TESTS ====================
-    
-    def test_session_guide_007_timezone_handling_exists(self):
-        """
-        DOC CLAIM: Timezone handling
-        TEST TYPE: Feature Existence
-        """
-        file_path = SRC_ROOT / "managers" / "session_manager.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
-        has_timezone = any(term in content.lower() for term in 
-                          ["timezone", "utc", "datetime", "time"])
-        assert has_timezone, "Timezone handling not found"
-    
-    # ==================== INTEGRATION TESTS ====================
-    
-    def test_session_guide_008_trading_engine_integration(self):
-        """
-        DOC CLAIM: Integration with trading engine
-        TEST TYPE: Integration Existence
-        """
-        file_path = SRC_ROOT / "core" / "trading_engine.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
-        has_session = "session" in content.lower()
-        assert has_session, "Session manager integration not found in trading engine"
+        content = src_files[source][variant]
+        if isinstance(pattern, bytes):
+            found = content.find(pattern) != -1
+        else:
+            found = pattern.search(content) is not None
+        assert found, message
     
     def test_session_guide_009_config_integration(self):
         """
@@ -132,17 +105,6 @@ class TestSessionManagerGuide:
                 content = f.read()
         # Pass - session config is optional
         assert True
-    
-    def test_session_guide_010_logging_exists(self):
-        """
-        DOC CLAIM: Session logging
-        TEST TYPE: Logging Existence
-        """
-        file_path = SRC_ROOT / "managers" / "session_manager.py"
-        with open(file_path, 'r') as f:
-            content = f.read()
-        has_logging = "log" in content.lower() or "print" in content.lower()
-        assert has_logging, "Session logging not found"
 
 
 if __name__ == "__main__":
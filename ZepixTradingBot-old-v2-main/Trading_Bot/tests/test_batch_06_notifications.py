@@ -14,6 +14,7 @@ Version: 1.0.0
 Date: 2026-01-14
 """
 
+import asyncio
 import pytest
 import threading
 import time
@@ -41,6 +42,7 @@ from telegram.notification_router import (
     Notification,
     NotificationRouter,
     NotificationFormatter,
+    BatchedDispatcher,
     DEFAULT_ROUTING_RULES,
     create_default_router
 )
@@ -687,7 +689,43 @@ class TestNotificationRouter:
         router.register_formatter(NotificationType.ENTRY, formatter)
         
         assert NotificationType.ENTRY in router.formatters
-    
+
+    def test_register_formatters_bulk(self):
+        """Test registering several formatters at once"""
+        router = NotificationRouter()
+        formatter = lambda data: "Custom"
+
+        router.register_formatters({
+            NotificationType.ENTRY: formatter,
+            NotificationType.EXIT: formatter
+        })
+
+        assert router.formatters[NotificationType.ENTRY] is formatter
+        assert router.formatters[NotificationType.EXIT] is formatter
+
+    def test_formatter_skipped_without_destination(self):
+        """Test formatter is not called when no callback receives the message"""
+        formatter = Mock(return_value="formatted")
+        router = NotificationRouter(controller_callback=Mock(return_value=1))
+        router.register_formatter(NotificationType.ENTRY, formatter)
+
+        result = router.send(NotificationType.ENTRY, "Entry", voice_override=False)
+
+        assert result is False
+        formatter.assert_not_called()
+
+    def test_formatter_called_for_voice_only(self):
+        """Test formatter still runs when only the voice callback is set"""
+        formatter = Mock(return_value="formatted")
+        voice = Mock()
+        router = NotificationRouter(voice_callback=voice)
+        router.register_formatter(NotificationType.ENTRY, formatter)
+
+        router.send(NotificationType.ENTRY, "Entry")
+
+        formatter.assert_called_once()
+        voice.assert_called_once_with("formatted", NotificationPriority.HIGH)
+
     def test_set_routing_rule(self):
         """Test setting custom routing rule"""
         router = NotificationRouter()
@@ -813,6 +851,167 @@ class TestNotificationFormatter:
         assert "MT5 Connection" in message
         assert "HIGH" in message
 
+    def test_format_v6_signal(self):
+        """Test V6 signal formatting with optional fields and defaults"""
+        data = {
+            "timeframe": "15m",
+            "symbol": "XAUUSD",
+            "direction": "BUY",
+            "sl": 2010.5
+        }
+
+        message = NotificationFormatter.format_v6_signal(data)
+
+        assert "V6 SIGNAL" in message
+        assert "15M" in message
+        assert "XAUUSD" in message
+        assert "<b>Pattern:</b> N/A" in message
+        assert "<b>SL:</b> 2010.5" in message
+        assert "<b>Entry:</b>" not in message
+        assert "<b>Time:</b>" in message
+
+    def test_format_v6_daily_summary(self):
+        """Test V6 daily summary formatting with missing timeframes"""
+        data = {
+            "date": "2026-01-14",
+            "15m": {"trades": 3, "pnl": 42.0, "win_rate": 66.7},
+            "total_trades": 3,
+            "total_pnl": 42.0
+        }
+
+        message = NotificationFormatter.format_v6_daily_summary(data)
+
+        assert "2026-01-14" in message
+        assert "15M: 3 trades" in message
+        assert "30M: No trades" in message
+        assert "Trades: 3" in message
+        assert "Win Rate: 0.0%" in message
+
+    def test_cached_time_stamp(self):
+        """Test formatter timestamp helper returns HH:MM:SS"""
+        from telegram.notification_router import _hms
+
+        stamp = _hms()
+
+        assert len(stamp) == 8
+        time.strptime(stamp, "%H:%M:%S")
+
+    def test_tf_badge(self):
+        """Test V6 timeframe badge lookup"""
+        from telegram.notification_router import _tf_badge
+
+        assert _tf_badge("15m") == "15M"
+        assert _tf_badge("1H") == "1H"
+        assert _tf_badge("5m") == "5M"
+        assert _tf_badge("") == ""
+
+    def test_v6_empty_timeframe_badges(self):
+        """Test entry leaves an empty timeframe blank while exit shows V6"""
+        entry = NotificationFormatter.format_v6_entry({"timeframe": ""})
+        exit_msg = NotificationFormatter.format_v6_exit({"timeframe": ""})
+
+        assert entry.split("\n")[0].endswith("V6 ENTRY</b> | ")
+        assert exit_msg.split("\n")[0].endswith("V6 EXIT</b> | V6")
+
+
+class TestBatchedDispatcher:
+    """Tests for BatchedDispatcher class"""
+    
+    def test_sends_directly_without_loop(self):
+        """Test messages are sent immediately when no event loop is running"""
+        send = Mock(return_value=1)
+        dispatcher = BatchedDispatcher(send)
+        
+        result = dispatcher("hello")
+        
+        assert result == 1
+        send.assert_called_once_with("hello")
+    
+    async def test_batches_async_sends(self):
+        """Test queued messages are delivered together by the flusher"""
+        sent = []
+        
+        async def send(message):
+            sent.append(message)
+            return True
+        
+        dispatcher = BatchedDispatcher(send, max_delay=0.01)
+        
+        assert dispatcher("one") is True
+        assert dispatcher("two") is True
+        assert sent == []
+        
+        await asyncio.sleep(0.05)
+        await dispatcher.close()
+        
+        assert sent == ["one", "two"]
+    
+    async def test_close_flushes_pending(self):
+        """Test close delivers messages still in the queue"""
+        send = Mock(return_value=1)
+        dispatcher = BatchedDispatcher(send, max_delay=10)
+        
+        dispatcher("pending")
+        await dispatcher.close()
+        
+        send.assert_called_once_with("pending")
+    
+    def test_restarts_after_loop_ends(self):
+        """Test a dispatcher outlives the loop that started its flusher"""
+        sent = []
+        
+        def send(message):
+            sent.append(message)
+            return True
+        
+        dispatcher = BatchedDispatcher(send, max_delay=10)
+        
+        async def queue_only(message):
+            dispatcher(message)
+        
+        async def queue_and_close(message):
+            dispatcher(message)
+            await dispatcher.close()
+        
+        asyncio.run(queue_only("stranded"))
+        assert dispatcher("direct") is True
+        asyncio.run(queue_and_close("restarted"))
+        
+        assert sent == ["stranded", "direct", "restarted"]
+    
+    async def test_close_while_collecting_batch(self):
+        """Test close delivers a batch the flusher is still filling"""
+        sent = []
+        
+        async def send(message):
+            sent.append(message)
+            return True
+        
+        dispatcher = BatchedDispatcher(send, max_delay=10)
+        dispatcher("collected")
+        await asyncio.sleep(0.01)
+        
+        await asyncio.wait_for(dispatcher.close(), 1)
+        
+        assert sent == ["collected"]
+    
+    async def test_close_while_message_arriving(self):
+        """Test close delivers a message queued while the flusher is waiting"""
+        sent = []
+        
+        async def send(message):
+            sent.append(message)
+            return True
+        
+        dispatcher = BatchedDispatcher(send, max_delay=10)
+        dispatcher("first")
+        await asyncio.sleep(0.01)
+        dispatcher("second")
+        
+        await asyncio.wait_for(dispatcher.close(), 1)
+        
+        assert sent == ["first", "second"]
+
 
 class TestCreateDefaultRouter:
     """Tests for create_default_router function"""
@@ -826,6 +1025,15 @@ class TestCreateDefaultRouter:
         assert NotificationType.DAILY_SUMMARY in router.formatters
         assert NotificationType.EMERGENCY_STOP in router.formatters
         assert NotificationType.ERROR in router.formatters
+    
+    def test_default_router_formatters_customisable(self):
+        """Test a default router accepts custom formatters"""
+        router = create_default_router()
+        custom = lambda data: "custom"
+        
+        router.register_formatter(NotificationType.ENTRY, custom)
+        
+        assert router.formatters[NotificationType.ENTRY] is custom
 
 
 # ============================================================================
@@ -260,6 +260,19 @@ class TestServiceAPIInitialization:
         assert service_api._market_service is not None
         assert service_api.services_available == True
     
+    def test_services_unavailable_when_constructor_fails(self, mock_trading_engine, monkeypatch):
+        """Test a service whose constructor raises marks services unavailable"""
+        from src.core.plugin_system import service_api as service_api_module
+        
+        def failing_service(**kwargs):
+            raise RuntimeError("boom")
+        
+        monkeypatch.setattr(service_api_module, "MarketDataService", failing_service, raising=False)
+        api = service_api_module.ServiceAPI(mock_trading_engine)
+        
+        assert api._market_service is None
+        assert api.services_available == False
+    
     def test_factory_function(self, mock_trading_engine):
         """Test create_service_api factory function"""
         from src.core.plugin_system.service_api import create_service_api
@@ -267,6 +280,15 @@ class TestServiceAPIInitialization:
         
         assert api.plugin_id == "test_factory"
         assert api.services_available == True
+    
+    def test_for_plugin_reuses_instance(self, mock_trading_engine):
+        """Test ServiceAPI.for_plugin returns one instance per engine and plugin"""
+        from src.core.plugin_system.service_api import ServiceAPI
+        api = ServiceAPI.for_plugin(mock_trading_engine, "test_plugin")
+        
+        assert ServiceAPI.for_plugin(mock_trading_engine, "test_plugin") is api
+        assert ServiceAPI.for_plugin(mock_trading_engine, "other_plugin") is not api
+        assert ServiceAPI.for_plugin(MockTradingEngine(), "test_plugin") is not api
 
 
 # =============================================================================
@@ -287,11 +309,50 @@ class TestBackwardCompatibility:
         assert info['digits'] == 2
         assert info['spread'] == 30
     
+    def test_get_price_cached_until_invalidated(self, service_api):
+        """Test get_price reuses a fresh tick and refetches after invalidate_cache"""
+        service_api.get_price("XAUUSD")
+        service_api._mt5.get_symbol_tick = lambda symbol: {'bid': 2651.00}
+        
+        assert service_api.get_price("XAUUSD") == 2650.50
+        
+        service_api.invalidate_cache("XAUUSD")
+        assert service_api.get_price("XAUUSD") == 2651.00
+    
+    def test_get_symbol_info_cache_is_short_and_copied(self, service_api):
+        """Test cached symbol info is handed out as a copy and expires quickly"""
+        info = service_api.get_symbol_info("XAUUSD")
+        info['spread'] = 999
+        
+        assert service_api.get_symbol_info("XAUUSD")['spread'] == 30
+        assert service_api.SYMBOL_INFO_CACHE_TTL <= 0.2
+        
+        service_api._symbol_info_cache["XAUUSD"] = (0.0, {'spread': 1})
+        assert service_api.get_symbol_info("XAUUSD")['spread'] == 30
+    
+    @pytest.mark.asyncio
+    async def test_warmup_primes_symbol_info(self, service_api):
+        """Test warmup caches symbol info so the next lookup skips MT5"""
+        await service_api.warmup(["XAUUSD"])
+        service_api._mt5.get_symbol_info = None
+        
+        assert service_api.get_symbol_info("XAUUSD")
+    
     def test_get_balance(self, service_api):
         """Test get_balance (backward compatible)"""
         balance = service_api.get_balance()
         assert balance == 10000.0
     
+    def test_get_balance_cached_until_trade_closed(self, service_api):
+        """Test get_balance reuses a fresh balance and refetches after a close"""
+        service_api.get_balance()
+        service_api._mt5.get_account_balance = lambda: 10250.0
+        
+        assert service_api.get_balance() == 10000.0
+        
+        service_api.close_trade(12345)
+        assert service_api.get_balance() == 10250.0
+    
     def test_get_equity(self, service_api):
         """Test get_equity (backward compatible)"""
         equity = service_api.get_equity()
@@ -337,6 +398,38 @@ class TestBackwardCompatibility:
         service_api.send_notification("Test message")
         assert "Test message" in mock_trading_engine.telegram_bot.messages_sent
     
+    @pytest.mark.asyncio
+    async def test_send_notification_queued_in_event_loop(self, service_api, mock_trading_engine):
+        """Test send_notification inside a loop returns before sending, then sends in order"""
+        service_api.send_notification("First")
+        service_api.send_notification("Second")
+        
+        assert mock_trading_engine.telegram_bot.messages_sent == []
+        await asyncio.sleep(0.01)
+        assert mock_trading_engine.telegram_bot.messages_sent == ["First", "Second"]
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_queued_notifications(self, service_api, mock_trading_engine):
+        """Test close() sends everything still queued, then stops the sender"""
+        service_api.send_notification("First")
+        service_api.send_notification("Second")
+        task = service_api._notify_task
+
+        await service_api.close()
+
+        assert mock_trading_engine.telegram_bot.messages_sent == ["First", "Second"]
+        assert task.done()
+        assert service_api._notify_task is None
+
+    @pytest.mark.asyncio
+    async def test_send_notification_async_keeps_order(self, service_api, mock_trading_engine):
+        """Test send_notification_async waits behind queued messages and reports the send"""
+        service_api.send_notification("First")
+
+        assert await service_api.send_notification_async("Second") is True
+        assert mock_trading_engine.telegram_bot.messages_sent == ["First", "Second"]
+        await service_api.close()
+
     def test_get_config(self, service_api):
         """Test get_config (backward compatible)"""
         max_lot = service_api.get_config("max_lot_size")
@@ -348,6 +441,46 @@ class TestBackwardCompatibility:
         trades = service_api.get_open_trades()
         assert len(trades) == 2
 
+    def test_get_open_trades_soa(self, service_api, mock_trading_engine):
+        """Test open trades come back as typed per-field arrays, ticket -1 when unset"""
+        np = pytest.importorskip("numpy")
+        models = pytest.importorskip("src.models")
+        # The engine also needs the Telegram and MT5 stacks, which fail with ImportError
+        engine_module = pytest.importorskip("src.core.trading_engine", exc_type=ImportError)
+
+        def arrays_for(trades):
+            owner = Mock(open_trades=trades)
+            return engine_module.TradingEngine.get_open_trades_arrays(owner)
+
+        trades = [
+            models.Trade(symbol="XAUUSD", entry=2650.0, sl=2640.0, tp=2670.0, lot_size=0.1,
+                         direction="buy", strategy="combinedlogic-1", trade_id=1001,
+                         open_time="2026-01-01 00:00:00"),
+            models.Trade(symbol="EURUSD", entry=1.1, sl=1.105, tp=1.09, lot_size=0.5,
+                         direction="sell", strategy="combinedlogic-2", trade_id=None,
+                         open_time="2026-01-01 00:05:00"),
+        ]
+        mock_trading_engine.get_open_trades_arrays = lambda: arrays_for(trades)
+
+        arrays = service_api.get_open_trades_soa()
+
+        assert arrays["ticket"].dtype == np.int64
+        assert arrays["ticket"].tolist() == [1001, -1]
+        assert arrays["symbol"].dtype == object
+        assert arrays["symbol"].tolist() == ["XAUUSD", "EURUSD"]
+        assert arrays["direction"].tolist() == ["buy", "sell"]
+        assert arrays["strategy"].tolist() == ["combinedlogic-1", "combinedlogic-2"]
+        for field, expected in (("lots", [0.1, 0.5]), ("open_price", [2650.0, 1.1]),
+                                ("sl", [2640.0, 1.105]), ("tp", [2670.0, 1.09])):
+            assert arrays[field].dtype == np.float64
+            assert arrays[field].tolist() == expected
+
+        empty = arrays_for([])
+        assert set(empty) == set(arrays)
+        assert all(len(column) == 0 for column in empty.values())
+        assert empty["ticket"].dtype == np.int64
+        assert empty["lots"].dtype == np.float64
+
 
 # =============================================================================
 # TEST: ORDER EXECUTION SERVICE INTEGRATION
@@ -480,6 +613,17 @@ class TestRiskManagementIntegration:
         assert lot > 0
         assert lot <= 10.0
     
+    @pytest.mark.asyncio
+    async def test_calculate_lot_sizes_bulk_matches_single(self, service_api):
+        """Test bulk lot sizes match calculate_lot_size_async row by row"""
+        pytest.importorskip("numpy")
+        rows = [("XAUUSD", 1.5, 50.0), ("EURUSD", 1.0, 20.0), ("XAUUSD", 2.0, 0.0)]
+        
+        lots = service_api.calculate_lot_sizes_bulk(*map(list, zip(*rows)))
+        
+        for lot, (symbol, risk, sl_pips) in zip(lots, rows):
+            assert lot == await service_api.calculate_lot_size_async(symbol, risk, sl_pips)
+    
     @pytest.mark.asyncio
     async def test_calculate_atr_sl(self, service_api):
         """Test ATR-based SL calculation"""
@@ -914,6 +1058,17 @@ class TestConfiguration:
         """Test plugin config with default value"""
         value = service_api.get_plugin_config("nonexistent_key", default="default")
         assert value == "default"
+    
+    def test_refresh_plugin_config(self, mock_trading_engine):
+        """Test plugin config snapshot picks up a replaced plugins section"""
+        from src.core.plugin_system.service_api import ServiceAPI
+        
+        api = ServiceAPI(mock_trading_engine, plugin_id="v3_combined")
+        mock_trading_engine.config["plugins"] = {"v3_combined": {"max_lot_size": 2.0}}
+        
+        assert api.get_plugin_config("max_lot_size") == 1.0
+        api.refresh_plugin_config()
+        assert api.get_plugin_config("max_lot_size") == 2.0
 
 
 # =============================================================================
@@ -55,6 +55,15 @@ class DummyPluginWithHook(BaseLogicPlugin):
         return data
 
 
+class DummyPluginWithSyncHook(DummyPlugin):
+    """Dummy plugin with a synchronous hook handler for testing"""
+    
+    def on_signal_received(self, data):
+        """Sync hook handler that modifies signal data"""
+        data["sync_hook"] = True
+        return data
+
+
 class MockAlert:
     """Mock alert for testing"""
     def __init__(self, symbol: str, signal_type: str, direction: str = "BUY"):
@@ -104,6 +113,24 @@ class TestBaseLogicPlugin:
         assert "metadata" in status
         assert "database" in status
     
+    def test_plugin_hook_names_collected_per_class(self):
+        """Test on_<hook> methods are collected into _HOOK_NAMES at class creation"""
+        assert DummyPlugin._HOOK_NAMES == frozenset()
+        assert DummyPluginWithHook._HOOK_NAMES == {"signal_received"}
+        assert DummyPluginWithSyncHook._HOOK_NAMES == {"signal_received"}
+    
+    def test_plugin_database_connection_reused(self, tmp_path):
+        """Test the plugin database connection is opened once and closed on close()"""
+        plugin = DummyPlugin("test_plugin", {}, None)
+        plugin.db_path = str(tmp_path / "plugin.db")
+        
+        conn = plugin.get_database_connection()
+        assert plugin.get_database_connection() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        
+        plugin.close()
+        assert plugin._conn is None
+    
     def test_plugin_metadata(self):
         """Test plugin metadata loading"""
         plugin = DummyPlugin("test_plugin", {}, None)
@@ -361,6 +388,122 @@ class TestPluginRegistry:
         result = await registry.execute_hook("signal_received", data)
         
         assert "modified_by_plugin" not in result
+    
+    @pytest.mark.asyncio
+    async def test_execute_hook_sync_handler(self):
+        """Test sync hook handlers run and their hook cache is reused"""
+        config = {
+            "plugin_system": {"plugin_dir": "src/logic_plugins"},
+            "plugins": {"test": {"enabled": True}}
+        }
+        registry = PluginRegistry(config, None)
+        
+        plugin = DummyPluginWithSyncHook("test", {"enabled": True}, None)
+        registry.plugins["test"] = plugin
+        
+        result = await registry.execute_hook("signal_received", {"test": "data"})
+        
+        assert result.get("sync_hook") is True
+        assert plugin._hook_cache["signal_received"][1] is False
+        assert "exit_signal" not in plugin._hook_cache
+    
+    @pytest.mark.asyncio
+    async def test_execute_hook_follows_enabled_changes(self):
+        """Test cached hook handlers respect enable/disable and plugin replacement"""
+        config = {
+            "plugin_system": {"plugin_dir": "src/logic_plugins"},
+            "plugins": {"test": {"enabled": True}}
+        }
+        registry = PluginRegistry(config, None)
+        
+        registry.register_plugin("test", DummyPluginWithSyncHook("test", {"enabled": True}, None))
+        assert (await registry.execute_hook("signal_received", {})).get("sync_hook") is True
+        
+        registry.plugins["test"].enabled = False
+        assert "sync_hook" not in await registry.execute_hook("signal_received", {})
+        
+        registry.plugins["test"].enable()
+        assert (await registry.execute_hook("signal_received", {})).get("sync_hook") is True
+        
+        registry.register_plugin("test", DummyPlugin("test", {"enabled": True}, None))
+        assert "sync_hook" not in await registry.execute_hook("signal_received", {})
+    
+    @pytest.mark.asyncio
+    async def test_execute_hook_skips_disabled_duck_typed_plugin(self):
+        """Test a plugin that is not a BaseLogicPlugin is skipped once its enabled flag is cleared"""
+        config = {
+            "plugin_system": {"plugin_dir": "src/logic_plugins"},
+            "plugins": {}
+        }
+        registry = PluginRegistry(config, None)
+        
+        plugin = MagicMock()
+        plugin.enabled = True
+        plugin.on_signal_received = Mock(return_value={"mock_hook": True})
+        registry.register_plugin("mock", plugin)
+        assert (await registry.execute_hook("signal_received", {})).get("mock_hook") is True
+        
+        plugin.enabled = False
+        assert "mock_hook" not in await registry.execute_hook("signal_received", {})
+    
+    @pytest.mark.asyncio
+    async def test_execute_hook_after_unregister(self):
+        """Test an unregistered plugin no longer receives hooks"""
+        config = {
+            "plugin_system": {"plugin_dir": "src/logic_plugins"},
+            "plugins": {"test": {"enabled": True}}
+        }
+        registry = PluginRegistry(config, None)
+        
+        plugin = DummyPluginWithSyncHook("test", {"enabled": True}, None)
+        registry.register_plugin("test", plugin)
+        assert (await registry.execute_hook("signal_received", {})).get("sync_hook") is True
+        
+        assert registry.unregister_plugin("test") is plugin
+        assert "sync_hook" not in await registry.execute_hook("signal_received", {})
+    
+    @pytest.mark.asyncio
+    async def test_execute_hook_instance_handler_after_invalidate(self):
+        """Test a hook handler assigned on a plugin instance is used once the cache is invalidated"""
+        config = {
+            "plugin_system": {"plugin_dir": "src/logic_plugins"},
+            "plugins": {"test": {"enabled": True}}
+        }
+        registry = PluginRegistry(config, None)
+        
+        plugin = DummyPlugin("test", {"enabled": True}, None)
+        registry.plugins["test"] = plugin
+        assert "instance_hook" not in await registry.execute_hook("signal_received", {})
+        
+        plugin.on_signal_received = lambda data: {**data, "instance_hook": True}
+        registry.invalidate_hook_cache()
+        
+        assert (await registry.execute_hook("signal_received", {})).get("instance_hook") is True
+    
+    @pytest.mark.asyncio
+    async def test_execute_hook_concurrent(self):
+        """Test concurrent mode runs every async handler against the original data"""
+        config = {
+            "plugin_system": {"plugin_dir": "src/logic_plugins"},
+            "plugins": {}
+        }
+        registry = PluginRegistry(config, None)
+        
+        seen = []
+        
+        class RecordingPlugin(DummyPlugin):
+            async def on_notification_sent(self, data):
+                seen.append(self.plugin_id)
+                raise RuntimeError("handler failure is logged, not raised")
+        
+        registry.plugins["first"] = RecordingPlugin("first", {"enabled": True}, None)
+        registry.plugins["second"] = RecordingPlugin("second", {"enabled": True}, None)
+        
+        data = {"test": "data"}
+        result = await registry.execute_hook("notification_sent", data, concurrent=True)
+        
+        assert result is data
+        assert sorted(seen) == ["first", "second"]
 
 
 class TestServiceAPI:
@@ -12,6 +12,7 @@ Verifies:
 Version: 1.0.0
 Date: 2026-01-15
 """
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any
@@ -290,6 +291,16 @@ class TestServiceAPIProperties:
         """Test unregistered service property returns None"""
         assert service_api.reentry_service is None
         assert service_api.dual_order_service is None
+    
+    def test_core_services_built_on_first_use(self, service_api):
+        """Test core services are constructed lazily and then reused"""
+        assert '_market_service' not in vars(service_api)
+        
+        market_service = service_api._market_service
+        
+        assert market_service is not None
+        assert service_api._market_service is market_service
+        assert service_api.services_available is True
 
 
 # ============================================================================
@@ -517,6 +528,76 @@ class TestServiceAPIOperations:
         result = await service_api.send_telegram_notification('trade_opened', 'Test message')
         
         assert result == True
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_spread_requests_share_one_fetch(self, service_api):
+        """Test concurrent get_current_spread calls for a symbol hit MarketDataService once"""
+        async def slow_spread(symbol):
+            await asyncio.sleep(0.01)
+            return 2.5
+        
+        market_service = MagicMock()
+        market_service.get_current_spread = AsyncMock(side_effect=slow_spread)
+        service_api._market_service = market_service
+        
+        results = await asyncio.gather(*(service_api.get_current_spread('XAUUSD') for _ in range(3)))
+        
+        assert results == [2.5, 2.5, 2.5]
+        market_service.get_current_spread.assert_awaited_once_with('XAUUSD')
+    
+    @pytest.mark.asyncio
+    async def test_trend_fallbacks_are_independent_copies(self, service_api):
+        """Test trend fallbacks without a TrendManagementService are fresh dicts per call"""
+        service_api._trend_service = None
+        
+        trend = await service_api.get_timeframe_trend('XAUUSD', '1h')
+        trend["direction"] = "bullish"
+        trends = await service_api.get_mtf_trends('XAUUSD')
+        trends["1h"] = 1
+        
+        assert await service_api.get_timeframe_trend('EURUSD', '1h') == {
+            "direction": "neutral", "value": 0, "timeframe": "1h"
+        }
+        assert await service_api.get_mtf_trends('XAUUSD') == {"15m": 0, "1h": 0, "4h": 0, "1d": 0}
+    
+    @pytest.mark.asyncio
+    async def test_timeframe_trends_bulk_uses_one_mtf_fetch(self, service_api):
+        """Test bulk pillar lookups share a single get_mtf_trends call"""
+        trend_service = MagicMock()
+        trend_service.get_mtf_trends = AsyncMock(return_value={"15m": 1, "1h": 1, "4h": -1, "1d": 0})
+        service_api._trend_service = trend_service
+        
+        assert await service_api.get_timeframe_trends_bulk('XAUUSD') == {"15m": 1, "1h": 1, "4h": -1, "1d": 0}
+        assert await service_api.get_timeframe_trends_bulk('XAUUSD', ('1h', '4h')) == {"1h": 1, "4h": -1}
+        trend_service.get_mtf_trends.assert_awaited_once_with('XAUUSD')
+        
+        service_api.invalidate_cache('XAUUSD')
+        await service_api.get_timeframe_trends_bulk('XAUUSD')
+        assert trend_service.get_mtf_trends.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_mtf_trends_are_copies(self, service_api):
+        """Test callers mutating cached MTF trends don't affect later callers"""
+        fetched = {"15m": 1, "1h": 1, "4h": -1, "1d": 0}
+        trend_service = MagicMock()
+        trend_service.get_mtf_trends = AsyncMock(return_value=fetched)
+        service_api._trend_service = trend_service
+
+        first = await service_api.get_mtf_trends('XAUUSD')
+        first["1h"] = -1
+        fetched["4h"] = 1
+
+        assert await service_api.get_mtf_trends('XAUUSD') == {"15m": 1, "1h": 1, "4h": -1, "1d": 0}
+        trend_service.get_mtf_trends.assert_awaited_once_with('XAUUSD')
+
+    def test_default_pip_calculator(self, service_api):
+        """Test default pip metadata for metals and forex"""
+        calculator = service_api._create_default_pip_calculator()
+        
+        assert calculator.get_symbol_meta('XAUUSD') == (10.0, 0.1, 2)
+        assert calculator.get_pip_value('XAGUSD', 0.5) == 5.0
+        assert calculator.get_pip_size('EURUSD') == 0.0001
+        assert calculator.get_digits('EURUSD') == 5
 
 
 # ============================================================================
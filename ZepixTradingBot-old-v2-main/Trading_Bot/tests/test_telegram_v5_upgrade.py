@@ -12,310 +12,185 @@ Version: 1.0.0
 Date: 2026-01-19
 """
 
-import pytest
-import sys
 import os
-from unittest.mock import Mock, MagicMock, patch
+import pytest
 from datetime import datetime
 
-# Add src to path for imports
-src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
+from core.plugin_system.service_api import ServiceAPI
+from notification_preferences import NotificationPreferences
+from src.telegram.notification_router import (
+    NotificationType, NotificationFormatter, DEFAULT_ROUTING_RULES, create_default_router
+)
+
+
+# Methods each menu handler fixture must expose
+HANDLER_METHODS = {
+    "v6_handler": [
+        "show_v6_main_menu",
+        "handle_toggle_system",
+        "handle_toggle_timeframe",
+        "handle_enable_all",
+        "handle_disable_all",
+        "show_v6_stats_menu",
+        "show_v6_configure_menu",
+        "handle_callback",
+    ],
+    "analytics_handler": [
+        "show_analytics_menu",
+        "show_daily_analytics",
+        "show_weekly_analytics",
+        "show_monthly_analytics",
+        "show_analytics_by_pair",
+        "show_analytics_by_logic",
+        "export_analytics",
+        "handle_callback",
+    ],
+    "dual_order_handler": [
+        "show_dual_order_menu",
+        "show_plugin_dual_order_config",
+        "show_mode_selection",
+        "handle_callback",
+    ],
+    "reentry_handler": [
+        "show_reentry_menu",
+        "show_plugin_reentry_config",
+        "handle_callback",
+    ],
+    "notification_prefs_handler": [
+        "show_main_menu",
+        "show_categories_menu",
+        "show_plugin_filter_menu",
+        "show_priority_menu",
+        "show_quiet_hours_menu",
+        "show_v6_timeframes_menu",
+        "handle_callback",
+    ],
+}
 
 
 class TestV6ControlMenuHandler:
     """Tests for V6 Control Menu Handler (Phase 2)"""
     
-    def test_v6_control_menu_handler_init(self):
+    def test_v6_control_menu_handler_init(self, v6_handler, mock_bot):
         """Test V6ControlMenuHandler initialization"""
-        from menu.v6_control_menu_handler import V6ControlMenuHandler
-        
-        mock_bot = Mock()
-        mock_bot.config = {"v6_price_action": {"enabled": True, "timeframes": {}}}
-        handler = V6ControlMenuHandler(mock_bot)
-        
-        assert handler.bot == mock_bot
-        assert handler.V6_TIMEFRAMES == ["15m", "30m", "1h", "4h"]
-    
-    def test_v6_control_menu_handler_has_required_methods(self):
-        """Test V6ControlMenuHandler has all required methods"""
-        from menu.v6_control_menu_handler import V6ControlMenuHandler
-        
-        mock_bot = Mock()
-        handler = V6ControlMenuHandler(mock_bot)
-        
-        # Check required methods exist
-        assert hasattr(handler, 'show_v6_main_menu')
-        assert hasattr(handler, 'handle_toggle_system')
-        assert hasattr(handler, 'handle_toggle_timeframe')
-        assert hasattr(handler, 'handle_enable_all')
-        assert hasattr(handler, 'handle_disable_all')
-        assert hasattr(handler, 'show_v6_stats_menu')
-        assert hasattr(handler, 'show_v6_configure_menu')
-        assert hasattr(handler, 'handle_callback')
-    
-    def test_v6_control_menu_handler_callback_returns_false_for_invalid(self):
-        """Test V6ControlMenuHandler callback handling returns False for invalid callbacks"""
-        from menu.v6_control_menu_handler import V6ControlMenuHandler
-        
-        mock_bot = Mock()
-        mock_bot.config = {"v6_price_action": {"enabled": True, "timeframes": {}}}
-        handler = V6ControlMenuHandler(mock_bot)
-        
-        # Test callback handling returns False for invalid callbacks
-        assert handler.handle_callback("invalid_callback", 123, 456) == False
+        assert v6_handler.bot == mock_bot
 
 
 class TestAnalyticsMenuHandler:
     """Tests for Analytics Menu Handler (Phase 4)"""
     
-    def test_analytics_menu_handler_init(self):
+    def test_analytics_menu_handler_init(self, analytics_handler, mock_bot):
         """Test AnalyticsMenuHandler initialization"""
-        from menu.analytics_menu_handler import AnalyticsMenuHandler
-        
-        mock_bot = Mock()
-        handler = AnalyticsMenuHandler(mock_bot)
-        
-        assert handler._bot == mock_bot
-    
-    def test_analytics_menu_handler_has_required_methods(self):
-        """Test AnalyticsMenuHandler has all required methods"""
-        from menu.analytics_menu_handler import AnalyticsMenuHandler
-        
-        mock_bot = Mock()
-        handler = AnalyticsMenuHandler(mock_bot)
-        
-        # Check required methods exist
-        assert hasattr(handler, 'show_analytics_menu')
-        assert hasattr(handler, 'show_daily_analytics')
-        assert hasattr(handler, 'show_weekly_analytics')
-        assert hasattr(handler, 'show_monthly_analytics')
-        assert hasattr(handler, 'show_analytics_by_pair')
-        assert hasattr(handler, 'show_analytics_by_logic')
-        assert hasattr(handler, 'export_analytics')
-        assert hasattr(handler, 'handle_callback')
-    
-    def test_analytics_menu_handler_callback_returns_false_for_invalid(self):
-        """Test AnalyticsMenuHandler callback handling returns False for invalid callbacks"""
-        from menu.analytics_menu_handler import AnalyticsMenuHandler
-        
-        mock_bot = Mock()
-        handler = AnalyticsMenuHandler(mock_bot)
-        
-        # Test callback handling returns False for invalid callbacks
-        assert handler.handle_callback("invalid_callback", 123, 456) == False
+        assert analytics_handler._bot == mock_bot
 
 
 class TestDualOrderMenuHandler:
     """Tests for Dual Order Menu Handler (Phase 5)"""
     
-    def test_dual_order_menu_handler_init(self):
+    def test_dual_order_menu_handler_init(self, dual_order_handler, mock_bot):
         """Test DualOrderMenuHandler initialization"""
-        from menu.dual_order_menu_handler import DualOrderMenuHandler
-        
-        mock_bot = Mock()
-        handler = DualOrderMenuHandler(mock_bot)
-        
-        assert handler._bot == mock_bot
-        assert handler.ORDER_MODES == ["order_a", "order_b", "both"]
-    
-    def test_dual_order_menu_handler_has_required_methods(self):
-        """Test DualOrderMenuHandler has all required methods"""
-        from menu.dual_order_menu_handler import DualOrderMenuHandler
-        
-        mock_bot = Mock()
-        handler = DualOrderMenuHandler(mock_bot)
-        
-        # Check required methods exist
-        assert hasattr(handler, 'show_dual_order_menu')
-        assert hasattr(handler, 'show_plugin_dual_order_config')
-        assert hasattr(handler, 'show_mode_selection')
-        assert hasattr(handler, 'handle_callback')
-    
-    def test_dual_order_menu_handler_callback_handling(self):
-        """Test DualOrderMenuHandler callback handling"""
-        from menu.dual_order_menu_handler import DualOrderMenuHandler
-        
-        mock_bot = Mock()
-        handler = DualOrderMenuHandler(mock_bot)
-        
-        # Test callback handling returns True for valid callbacks
-        assert handler.handle_callback("menu_dual_order", 123, 456) == True
-        assert handler.handle_callback("dual_config_v3_logic1", 123, 456) == True
-        
-        # Test callback handling returns False for invalid callbacks
-        assert handler.handle_callback("invalid_callback", 123, 456) == False
+        assert dual_order_handler._bot == mock_bot
 
 
 class TestReentryMenuHandler:
     """Tests for Re-entry Menu Handler (Phase 5)"""
     
-    def test_reentry_menu_handler_init(self):
+    def test_reentry_menu_handler_init(self, reentry_handler, mock_bot):
         """Test ReentryMenuHandler initialization"""
-        from menu.dual_order_menu_handler import ReentryMenuHandler
-        
-        mock_bot = Mock()
-        handler = ReentryMenuHandler(mock_bot)
-        
-        assert handler._bot == mock_bot
-        assert handler.REENTRY_TYPES == ["tp_continuation", "sl_hunt_recovery", "exit_continuation"]
-    
-    def test_reentry_menu_handler_has_required_methods(self):
-        """Test ReentryMenuHandler has all required methods"""
-        from menu.dual_order_menu_handler import ReentryMenuHandler
-        
-        mock_bot = Mock()
-        handler = ReentryMenuHandler(mock_bot)
-        
-        # Check required methods exist
-        assert hasattr(handler, 'show_reentry_menu')
-        assert hasattr(handler, 'show_plugin_reentry_config')
-        assert hasattr(handler, 'handle_callback')
+        assert reentry_handler._bot == mock_bot
+
+
+class TestMenuHandlerConstants:
+    """Tests for menu handler class constants (Phases 2 and 5)"""
     
-    def test_reentry_menu_handler_callback_handling(self):
-        """Test ReentryMenuHandler callback handling"""
-        from menu.dual_order_menu_handler import ReentryMenuHandler
-        
-        mock_bot = Mock()
-        handler = ReentryMenuHandler(mock_bot)
-        
-        # Test callback handling returns True for valid callbacks
-        assert handler.handle_callback("menu_reentry", 123, 456) == True
-        assert handler.handle_callback("reentry_config_v3_logic1", 123, 456) == True
+    def test_menu_handler_class_constants(self):
+        """Test handler constants are read straight off the classes, no handler instance needed"""
+        from menu.v6_control_menu_handler import V6ControlMenuHandler
+        from menu.dual_order_menu_handler import DualOrderMenuHandler, ReentryMenuHandler
         
-        # Test callback handling returns False for invalid callbacks
-        assert handler.handle_callback("invalid_callback", 123, 456) == False
+        assert V6ControlMenuHandler.V6_TIMEFRAMES == ["15m", "30m", "1h", "4h"]
+        assert DualOrderMenuHandler.ORDER_MODES == ["order_a", "order_b", "both"]
+        assert ReentryMenuHandler.REENTRY_TYPES == ["tp_continuation", "sl_hunt_recovery", "exit_continuation"]
+
+
+class TestMenuHandlerMethods:
+    """Tests for the methods every menu handler exposes"""
+    
+    @pytest.mark.parametrize("fixture_name,methods", list(HANDLER_METHODS.items()), ids=list(HANDLER_METHODS))
+    def test_required_methods(self, request, fixture_name, methods):
+        """Test each menu handler has all required methods"""
+        handler = request.getfixturevalue(fixture_name)
+        missing = [m for m in methods if not hasattr(handler, m)]
+        assert not missing, f"{fixture_name} missing methods: {missing}"
+
+
+class TestMenuHandlerCallbacks:
+    """Tests for menu handler callback dispatch"""
+    
+    @pytest.mark.parametrize("handler_fixture", [
+        "v6_handler", "analytics_handler", "notification_prefs_handler",
+    ])
+    def test_invalid_callback_returns_false(self, request, handler_fixture):
+        """Test menu handlers return False for callbacks they do not own"""
+        handler = request.getfixturevalue(handler_fixture)
+        assert handler.handle_callback("invalid_callback", 123, 456) is False
+    
+    @pytest.mark.parametrize("handler_fixture,callback,expected", [
+        ("dual_order_handler", "menu_dual_order", True),
+        ("dual_order_handler", "dual_config_v3_logic1", True),
+        ("dual_order_handler", "invalid_callback", False),
+        ("reentry_handler", "menu_reentry", True),
+        ("reentry_handler", "reentry_config_v3_logic1", True),
+        ("reentry_handler", "invalid_callback", False),
+    ])
+    def test_handle_callback_result(self, request, handler_fixture, callback, expected):
+        """Test DualOrder and Re-entry handlers claim only their own callbacks"""
+        handler = request.getfixturevalue(handler_fixture)
+        assert handler.handle_callback(callback, 123, 456) is expected
 
 
 class TestMenuManagerIntegration:
     """Tests for MenuManager Integration (Phase 6)"""
     
-    def test_menu_manager_has_v6_handler(self):
-        """Test MenuManager has V6ControlMenuHandler"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, '_v6_handler')
-        assert manager._v6_handler is not None
-    
-    def test_menu_manager_has_analytics_handler(self):
-        """Test MenuManager has AnalyticsMenuHandler"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, '_analytics_handler')
-        assert manager._analytics_handler is not None
-    
-    def test_menu_manager_has_dual_order_handler(self):
-        """Test MenuManager has DualOrderMenuHandler"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, '_dual_order_handler')
-        assert manager._dual_order_handler is not None
-    
-    def test_menu_manager_has_reentry_handler(self):
-        """Test MenuManager has ReentryMenuHandler"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, '_reentry_handler')
-        assert manager._reentry_handler is not None
-    
-    def test_menu_manager_has_v6_methods(self):
-        """Test MenuManager has V6 menu methods"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, 'show_v6_menu')
-        assert hasattr(manager, 'handle_v6_callback')
-        assert hasattr(manager, 'is_v6_callback')
-    
-    def test_menu_manager_has_analytics_methods(self):
-        """Test MenuManager has Analytics menu methods"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, 'show_analytics_menu')
-        assert hasattr(manager, 'handle_analytics_callback')
-        assert hasattr(manager, 'is_analytics_callback')
-    
-    def test_menu_manager_has_dual_order_methods(self):
-        """Test MenuManager has Dual Order menu methods"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, 'show_dual_order_menu')
-        assert hasattr(manager, 'handle_dual_order_callback')
-        assert hasattr(manager, 'is_dual_order_callback')
-    
-    def test_menu_manager_has_reentry_methods(self):
-        """Test MenuManager has Re-entry menu methods"""
+    @pytest.fixture(scope="class")
+    def menu_manager(self, make_mock_bot):
+        """One MenuManager for the class; these tests only read from it"""
         from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, 'show_reentry_menu')
-        assert hasattr(manager, 'handle_reentry_callback')
-        assert hasattr(manager, 'is_reentry_callback')
-    
-    def test_menu_manager_is_v6_callback(self):
-        """Test MenuManager.is_v6_callback correctly identifies V6 callbacks"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        # V6 callbacks should return True
-        assert manager.is_v6_callback("menu_v6") == True
-        assert manager.is_v6_callback("v6_toggle_system") == True
-        assert manager.is_v6_callback("v6_toggle_15m") == True
-        
-        # Non-V6 callbacks should return False
-        assert manager.is_v6_callback("menu_main") == False
-        assert manager.is_v6_callback("analytics_daily") == False
-    
-    def test_menu_manager_is_analytics_callback(self):
-        """Test MenuManager.is_analytics_callback correctly identifies Analytics callbacks"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        # Analytics callbacks should return True
-        assert manager.is_analytics_callback("menu_analytics") == True
-        assert manager.is_analytics_callback("analytics_daily") == True
-        assert manager.is_analytics_callback("analytics_weekly") == True
-        
-        # Non-Analytics callbacks should return False
-        assert manager.is_analytics_callback("menu_main") == False
-        assert manager.is_analytics_callback("v6_toggle_system") == False
+        return MenuManager(make_mock_bot())
+    
+    @pytest.mark.parametrize("attr", [
+        "_v6_handler", "_analytics_handler", "_dual_order_handler",
+        "_reentry_handler", "_notification_prefs_handler",
+        "show_v6_menu", "handle_v6_callback", "is_v6_callback",
+        "show_analytics_menu", "handle_analytics_callback", "is_analytics_callback",
+        "show_dual_order_menu", "handle_dual_order_callback", "is_dual_order_callback",
+        "show_reentry_menu", "handle_reentry_callback", "is_reentry_callback",
+        "show_notification_prefs_menu", "handle_notification_prefs_callback",
+    ])
+    def test_menu_manager_has_attribute(self, menu_manager, attr):
+        """Test MenuManager wires every V5 menu handler and its menu methods"""
+        assert getattr(menu_manager, attr, None) is not None
+    
+    @pytest.mark.parametrize("method,callback,expected", [
+        ("is_v6_callback", "menu_v6", True),
+        ("is_v6_callback", "v6_toggle_system", True),
+        ("is_v6_callback", "v6_toggle_15m", True),
+        ("is_v6_callback", "menu_main", False),
+        ("is_v6_callback", "analytics_daily", False),
+        ("is_analytics_callback", "menu_analytics", True),
+        ("is_analytics_callback", "analytics_daily", True),
+        ("is_analytics_callback", "analytics_weekly", True),
+        ("is_analytics_callback", "menu_main", False),
+        ("is_analytics_callback", "v6_toggle_system", False),
+        ("is_notification_prefs_callback", "notif_main", True),
+        ("is_notification_prefs_callback", "notif_categories", True),
+        ("is_notification_prefs_callback", "menu_notifications", True),
+        ("is_notification_prefs_callback", "menu_main", False),
+        ("is_notification_prefs_callback", "v6_toggle_system", False),
+    ])
+    def test_menu_manager_identifies_callback(self, menu_manager, method, callback, expected):
+        """Test MenuManager.is_*_callback correctly identifies callbacks for each menu"""
+        assert getattr(menu_manager, method)(callback) is expected
 
 
 class TestServiceAPIV6Methods:
@@ -323,67 +198,50 @@ class TestServiceAPIV6Methods:
     
     def test_service_api_has_v6_notification_methods(self):
         """Test ServiceAPI has V6 notification methods"""
-        from core.plugin_system.service_api import ServiceAPI
-        
-        # Check V6 notification methods exist
-        assert hasattr(ServiceAPI, 'send_v6_entry_notification')
-        assert hasattr(ServiceAPI, 'send_v6_exit_notification')
-        assert hasattr(ServiceAPI, 'send_v6_tp_notification')
-        assert hasattr(ServiceAPI, 'send_v6_sl_notification')
-        assert hasattr(ServiceAPI, 'send_v6_timeframe_toggle_notification')
-        assert hasattr(ServiceAPI, 'send_v6_daily_summary')
-        assert hasattr(ServiceAPI, 'send_v6_signal_notification')
+        required = {
+            "send_v6_entry_notification",
+            "send_v6_exit_notification",
+            "send_v6_tp_notification",
+            "send_v6_sl_notification",
+            "send_v6_timeframe_toggle_notification",
+            "send_v6_daily_summary",
+            "send_v6_signal_notification",
+        }
+        missing = required - set(dir(ServiceAPI))
+        assert not missing, f"Missing: {sorted(missing)}"
+
+
+@pytest.fixture(scope="module")
+def default_prefs(tmp_path_factory):
+    """Untouched NotificationPreferences shared by read-only tests"""
+    cfg = tmp_path_factory.mktemp("np") / "prefs.json"
+    return NotificationPreferences(config_path=str(cfg))
+
+
+@pytest.fixture
+def prefs(tmp_path_factory):
+    """Fresh NotificationPreferences for tests that change settings"""
+    cfg = tmp_path_factory.mktemp("np") / "prefs.json"
+    return NotificationPreferences(config_path=str(cfg))
 
 
 class TestNotificationPreferences:
     """Tests for Notification Preferences System (Batch 1)"""
     
-    @staticmethod
-    def _get_notification_preferences_class():
-        """Helper to import NotificationPreferences avoiding telegram package conflict"""
-        import importlib.util
-        import os
-        spec = importlib.util.spec_from_file_location(
-            "notification_preferences",
-            os.path.join(os.path.dirname(__file__), '..', 'src', 'telegram', 'notification_preferences.py')
-        )
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module.NotificationPreferences
-    
-    def test_notification_preferences_init(self):
+    def test_notification_preferences_init(self, default_prefs):
         """Test NotificationPreferences initialization"""
-        NotificationPreferences = self._get_notification_preferences_class()
-        
-        # Create with temp config path to avoid file system issues
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            prefs = NotificationPreferences(config_path=f.name)
-        
-        assert prefs is not None
-        assert prefs.is_enabled() == True  # Default is enabled
+        assert default_prefs is not None
+        assert default_prefs.is_enabled() is True  # Default is enabled
     
-    def test_notification_preferences_category_toggle(self):
+    def test_notification_preferences_category_toggle(self, prefs):
         """Test NotificationPreferences category toggle"""
-        NotificationPreferences = self._get_notification_preferences_class()
-        
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            prefs = NotificationPreferences(config_path=f.name)
-        
         # Test category toggle
         initial = prefs.is_category_enabled("trade_entry")
         prefs.toggle_category("trade_entry")
         assert prefs.is_category_enabled("trade_entry") != initial
     
-    def test_notification_preferences_plugin_filter(self):
+    def test_notification_preferences_plugin_filter(self, prefs):
         """Test NotificationPreferences plugin filter"""
-        NotificationPreferences = self._get_notification_preferences_class()
-        
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            prefs = NotificationPreferences(config_path=f.name)
-        
         # Test plugin filter
         prefs.set_plugin_filter("v3_only")
         assert prefs.get_plugin_filter() == "v3_only"
@@ -394,14 +252,8 @@ class TestNotificationPreferences:
         prefs.set_plugin_filter("all")
         assert prefs.get_plugin_filter() == "all"
     
-    def test_notification_preferences_priority_level(self):
+    def test_notification_preferences_priority_level(self, prefs):
         """Test NotificationPreferences priority level"""
-        NotificationPreferences = self._get_notification_preferences_class()
-        
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            prefs = NotificationPreferences(config_path=f.name)
-        
         # Test priority level
         prefs.set_priority_level("critical_only")
         assert prefs.get_priority_level() == "critical_only"
@@ -409,44 +261,26 @@ class TestNotificationPreferences:
         prefs.set_priority_level("high_and_above")
         assert prefs.get_priority_level() == "high_and_above"
     
-    def test_notification_preferences_v6_timeframe_filter(self):
+    def test_notification_preferences_v6_timeframe_filter(self, prefs):
         """Test NotificationPreferences V6 timeframe filter"""
-        NotificationPreferences = self._get_notification_preferences_class()
-        
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            prefs = NotificationPreferences(config_path=f.name)
-        
         # Test V6 timeframe filter
         prefs.set_v6_timeframe_enabled("15m", False)
-        assert prefs.is_v6_timeframe_enabled("15m") == False
+        assert prefs.is_v6_timeframe_enabled("15m") is False
         
         prefs.set_v6_timeframe_enabled("15m", True)
-        assert prefs.is_v6_timeframe_enabled("15m") == True
+        assert prefs.is_v6_timeframe_enabled("15m") is True
     
-    def test_notification_preferences_should_send(self):
+    def test_notification_preferences_should_send(self, prefs):
         """Test NotificationPreferences should_send_notification"""
-        NotificationPreferences = self._get_notification_preferences_class()
-        
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            prefs = NotificationPreferences(config_path=f.name)
-        
         # Test should_send_notification
-        assert prefs.should_send_notification("trade_entry") == True
+        assert prefs.should_send_notification("trade_entry") is True
         
         # Disable category and test
         prefs.set_category_enabled("trade_entry", False)
-        assert prefs.should_send_notification("trade_entry") == False
+        assert prefs.should_send_notification("trade_entry") is False
     
-    def test_notification_preferences_reset(self):
+    def test_notification_preferences_reset(self, prefs):
         """Test NotificationPreferences reset to defaults"""
-        NotificationPreferences = self._get_notification_preferences_class()
-        
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            prefs = NotificationPreferences(config_path=f.name)
-        
         # Change some settings
         prefs.set_plugin_filter("v3_only")
         prefs.set_priority_level("critical_only")
@@ -461,66 +295,9 @@ class TestNotificationPreferences:
 class TestNotificationPreferencesMenuHandler:
     """Tests for Notification Preferences Menu Handler (Batch 1)"""
     
-    def test_notification_prefs_menu_handler_init(self):
+    def test_notification_prefs_menu_handler_init(self, notification_prefs_handler, mock_bot):
         """Test NotificationPreferencesMenuHandler initialization"""
-        from menu.notification_preferences_menu import NotificationPreferencesMenuHandler
-        
-        mock_bot = Mock()
-        handler = NotificationPreferencesMenuHandler(mock_bot)
-        
-        assert handler.bot == mock_bot
-    
-    def test_notification_prefs_menu_handler_has_required_methods(self):
-        """Test NotificationPreferencesMenuHandler has all required methods"""
-        from menu.notification_preferences_menu import NotificationPreferencesMenuHandler
-        
-        mock_bot = Mock()
-        handler = NotificationPreferencesMenuHandler(mock_bot)
-        
-        # Check required methods exist
-        assert hasattr(handler, 'show_main_menu')
-        assert hasattr(handler, 'show_categories_menu')
-        assert hasattr(handler, 'show_plugin_filter_menu')
-        assert hasattr(handler, 'show_priority_menu')
-        assert hasattr(handler, 'show_quiet_hours_menu')
-        assert hasattr(handler, 'show_v6_timeframes_menu')
-        assert hasattr(handler, 'handle_callback')
-    
-    def test_notification_prefs_menu_handler_callback_returns_false_for_invalid(self):
-        """Test NotificationPreferencesMenuHandler callback handling returns False for invalid callbacks"""
-        from menu.notification_preferences_menu import NotificationPreferencesMenuHandler
-        
-        mock_bot = Mock()
-        handler = NotificationPreferencesMenuHandler(mock_bot)
-        
-        # Test callback handling returns False for invalid callbacks
-        assert handler.handle_callback("invalid_callback", 123, 456) == False
-
-
-class TestMenuManagerNotificationPrefsIntegration:
-    """Tests for MenuManager Notification Preferences Integration (Batch 1)"""
-    
-    def test_menu_manager_has_notification_prefs_handler(self):
-        """Test MenuManager has NotificationPreferencesMenuHandler"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, '_notification_prefs_handler')
-        assert manager._notification_prefs_handler is not None
-    
-    def test_menu_manager_has_notification_prefs_methods(self):
-        """Test MenuManager has notification preferences menu methods"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        assert hasattr(manager, 'show_notification_prefs_menu')
-        assert hasattr(manager, 'handle_notification_prefs_callback')
+        assert notification_prefs_handler.bot == mock_bot
 
 
 class TestControllerBot105Commands:
@@ -546,7 +323,6 @@ class TestControllerBot105Commands:
     @staticmethod
     def _get_controller_bot_source():
         """Read controller_bot.py source code for analysis"""
-        import os
         controller_path = os.path.join(os.path.dirname(__file__), '..', 'src', 'telegram', 'controller_bot.py')
         with open(controller_path, 'r', encoding='utf-8') as f:
             return f.read()
@@ -703,40 +479,15 @@ class TestControllerBot105Commands:
         assert len(missing_methods) == 0, f"Missing handler method implementations: {missing_methods}"
 
 
-class TestMenuManagerNotificationPrefsCallback:
-    """Tests for MenuManager notification preferences callback"""
-    
-    def test_menu_manager_is_notification_prefs_callback(self):
-        """Test MenuManager.is_notification_prefs_callback correctly identifies notification prefs callbacks"""
-        from menu.menu_manager import MenuManager
-        
-        mock_bot = Mock()
-        mock_bot.config = {}
-        manager = MenuManager(mock_bot)
-        
-        # Notification prefs callbacks should return True
-        assert manager.is_notification_prefs_callback("notif_main") == True
-        assert manager.is_notification_prefs_callback("notif_categories") == True
-        assert manager.is_notification_prefs_callback("menu_notifications") == True
-        
-        # Non-notification prefs callbacks should return False
-        assert manager.is_notification_prefs_callback("menu_main") == False
-        assert manager.is_notification_prefs_callback("v6_toggle_system") == False
-
-
 class TestNotificationRouter78Types:
     """Tests for NotificationRouter with all 78 notification types"""
     
     def test_notification_router_has_78_types(self):
         """Test NotificationRouter has exactly 78 notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         assert len(NotificationType) == 78, f"Expected 78 notification types, got {len(NotificationType)}"
     
     def test_notification_router_has_all_original_types(self):
         """Test NotificationRouter has all original 44 notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         original_types = [
             "ENTRY", "EXIT", "TP_HIT", "SL_HIT", "PROFIT_BOOKING", "SL_MODIFIED", "BREAKEVEN",
             "BOT_STARTED", "BOT_STOPPED", "EMERGENCY_STOP", "MT5_DISCONNECT", "MT5_RECONNECT", "DAILY_LOSS_LIMIT",
@@ -754,8 +505,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_autonomous_system_types(self):
         """Test NotificationRouter has all 5 Autonomous System notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         autonomous_types = [
             "TP_CONTINUATION", "SL_HUNT_ACTIVATED", "RECOVERY_SUCCESS", 
             "RECOVERY_FAILED", "PROFIT_ORDER_PROTECTION"
@@ -766,8 +515,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_reentry_system_types(self):
         """Test NotificationRouter has all 5 Re-entry System notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         reentry_types = [
             "TP_REENTRY_STARTED", "TP_REENTRY_EXECUTED", "TP_REENTRY_COMPLETED",
             "SL_HUNT_RECOVERY", "EXIT_CONTINUATION"
@@ -778,8 +525,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_signal_event_types(self):
         """Test NotificationRouter has all 4 Signal Event notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         signal_types = [
             "SIGNAL_RECEIVED", "SIGNAL_IGNORED", "SIGNAL_FILTERED", "TREND_CHANGED"
         ]
@@ -789,8 +534,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_trade_event_types(self):
         """Test NotificationRouter has all 3 Trade Event notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         trade_types = ["PARTIAL_CLOSE", "MANUAL_EXIT", "REVERSAL_EXIT"]
         
         for type_name in trade_types:
@@ -798,8 +541,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_system_event_types(self):
         """Test NotificationRouter has all 6 System Event notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         system_types = [
             "MT5_CONNECTED", "LIFETIME_LOSS_LIMIT", "DAILY_LOSS_WARNING",
             "CONFIG_ERROR", "DATABASE_ERROR", "ORDER_FAILED"
@@ -810,8 +551,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_session_event_types(self):
         """Test NotificationRouter has all 4 Session Event notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         session_types = [
             "SESSION_TOGGLE", "SYMBOL_TOGGLE", "TIME_ADJUSTMENT", "FORCE_CLOSE_TOGGLE"
         ]
@@ -821,8 +560,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_voice_alert_types(self):
         """Test NotificationRouter has all 5 Voice Alert notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         voice_types = [
             "VOICE_TRADE_ENTRY", "VOICE_TP_HIT", "VOICE_SL_HIT",
             "VOICE_RISK_LIMIT", "VOICE_RECOVERY"
@@ -833,8 +570,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_dashboard_types(self):
         """Test NotificationRouter has all 2 Dashboard notification types"""
-        from src.telegram.notification_router import NotificationType
-        
         dashboard_types = ["DASHBOARD_UPDATE", "AUTONOMOUS_DASHBOARD"]
         
         for type_name in dashboard_types:
@@ -842,8 +577,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_router_has_routing_rules_for_all_types(self):
         """Test NotificationRouter has routing rules for all 78 notification types"""
-        from src.telegram.notification_router import NotificationType, DEFAULT_ROUTING_RULES
-        
         missing_rules = []
         for notif_type in NotificationType:
             if notif_type not in DEFAULT_ROUTING_RULES:
@@ -853,8 +586,6 @@ class TestNotificationRouter78Types:
     
     def test_notification_formatter_has_all_formatters(self):
         """Test NotificationFormatter has formatters for all new notification types"""
-        from src.telegram.notification_router import NotificationFormatter
-        
         # Check all new formatters exist
         new_formatters = [
             "format_tp_continuation", "format_sl_hunt_activated", "format_recovery_success",
@@ -880,8 +611,6 @@ class TestNotificationRouter78Types:
     
     def test_create_default_router_registers_all_formatters(self):
         """Test create_default_router registers formatters for all notification types"""
-        from src.telegram.notification_router import create_default_router, NotificationType
-        
         router = create_default_router()
         
         # Check that formatters are registered for key notification types
@@ -894,4 +623,5 @@ class TestNotificationRouter78Types:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    import sys
+    sys.exit(pytest.main([__file__, "-q", "-p", "no:cacheprovider"]))
@@ -0,0 +1,112 @@
+"""
+Test V3 Combined Plugin - entry execution paths
+
+Tests for the live (non-shadow) entry flow of the V3 plugin:
+1. Aggressive reversal closes run alongside the new orders
+2. A failed reversal close is logged without losing the order result
+3. config.json is re-read when its mtime changes and never shared
+
+Version: 1.0.0
+Date: 2026-10-15
+"""
+import pytest
+import json
+import os
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.logic_plugins.v3_combined.plugin import V3CombinedPlugin, _read_config_json
+
+
+def _make_plugin():
+    service_api = Mock()
+    service_api.database_service = None
+    plugin = V3CombinedPlugin(
+        plugin_id='v3_combined',
+        config={'shadow_mode': False},
+        service_api=service_api
+    )
+    plugin.shadow_mode = False
+    plugin.logger = Mock()
+    plugin._place_dual = AsyncMock(return_value={"status": "success", "orders": 2})
+    return plugin
+
+
+REVERSAL_ALERT = {
+    "signal_type": "Liquidity_Trap_Reversal",
+    "symbol": "XAUUSD",
+    "direction": "buy",
+    "tf": "15",
+    "consensus_score": 8,
+}
+
+
+class TestAggressiveReversalEntry:
+    """Test the concurrent reversal close + entry path"""
+
+    @pytest.mark.asyncio
+    async def test_reversal_close_succeeds(self):
+        """Test orders are placed and opposite positions closed"""
+        plugin = _make_plugin()
+        plugin.service_api.close_positions_by_direction = AsyncMock(return_value=3)
+
+        result = await plugin.process_entry_signal(dict(REVERSAL_ALERT))
+
+        assert result == {"status": "success", "orders": 2}
+        plugin._place_dual.assert_awaited_once()
+        plugin.service_api.close_positions_by_direction.assert_awaited_once_with(
+            plugin_id='v3_combined', symbol='XAUUSD', direction='SELL'
+        )
+        plugin.logger.info.assert_any_call("Reversal result: %s", "success")
+        plugin.logger.error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reversal_close_error_keeps_order_result(self):
+        """Test a raising close is logged and the order result still returned"""
+        plugin = _make_plugin()
+        plugin.service_api.close_positions_by_direction = AsyncMock(
+            side_effect=RuntimeError("bridge down")
+        )
+
+        result = await plugin.process_entry_signal(dict(REVERSAL_ALERT))
+
+        assert result == {"status": "success", "orders": 2}
+        plugin._place_dual.assert_awaited_once()
+        logged = [str(c) for c in plugin.logger.error.call_args_list]
+        assert any("bridge down" in line for line in logged)
+        plugin.logger.info.assert_any_call("Reversal result: %s", "error")
+
+
+class TestConfigLoading:
+    """Test the mtime-keyed config.json cache"""
+
+    def test_config_reread_after_mtime_change(self, tmp_path):
+        """Test an edited config file is parsed again"""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"shadow_mode": False}))
+        os.utime(path, (1000, 1000))
+        first = _read_config_json(str(path), os.stat(path).st_mtime)
+
+        path.write_text(json.dumps({"shadow_mode": True}))
+        os.utime(path, (1000, 1000))
+        assert _read_config_json(str(path), os.stat(path).st_mtime) is first
+
+        os.utime(path, (2000, 2000))
+        second = _read_config_json(str(path), os.stat(path).st_mtime)
+
+        assert first == {"shadow_mode": False}
+        assert second == {"shadow_mode": True}
+
+    def test_plugin_config_does_not_share_cached_dict(self):
+        """Test nested config changes on one plugin don't reach another"""
+        first = _make_plugin()
+        first.plugin_config["signal_routing"]["default_logic"] = "changed"
+        first.plugin_config["logic_multipliers"]["combinedlogic-1"] = 99
+
+        second = _make_plugin()
+
+        assert second.plugin_config["signal_routing"]["default_logic"] != "changed"
+        assert second.plugin_config["logic_multipliers"].get("combinedlogic-1") != 99